@@ -0,0 +1,51 @@
+"""add full text search vectors
+
+Revision ID: 3e8b6f1c9d20
+Revises: 7a3d9c4e2b15
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3e8b6f1c9d20"
+down_revision: Union[str, Sequence[str], None] = "7a3d9c4e2b15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors app.models.search: generated tsvector columns, earlier columns
+# weighted higher, each with a GIN index.
+SEARCH_VECTORS = {
+    "projects": "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+    "tasks": "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+    "comments": "setweight(to_tsvector('english', coalesce(body, '')), 'A')",
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Adding a stored generated column rewrites the table once.
+    for table, expression in SEARCH_VECTORS.items():
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS search_vector tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vector "
+                f"ON {table} USING GIN (search_vector)"
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in SEARCH_VECTORS:
+        op.execute(f"DROP INDEX IF EXISTS ix_{table}_search_vector")
+        op.execute(f"ALTER TABLE {table} DROP COLUMN IF EXISTS search_vector")
@@ -0,0 +1,60 @@
+"""add project members access index
+
+Revision ID: 4f2a9c1e7b30
+Revises: c21b41e7a08d
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2a9c1e7b30"
+down_revision: Union[str, Sequence[str], None] = "c21b41e7a08d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "project_members",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(),
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "user_id"),
+    )
+    op.create_index(
+        "ix_project_members_user_project",
+        "project_members",
+        ["user_id", "project_id"],
+    )
+
+    # Backfill: owners plus every user assigned to a task of the project.
+    op.execute(
+        """
+        INSERT INTO project_members (project_id, user_id)
+        SELECT id, owner_id FROM projects WHERE owner_id IS NOT NULL
+        UNION
+        SELECT project_id, assignee_id FROM tasks
+        WHERE project_id IS NOT NULL AND assignee_id IS NOT NULL
+        """
+    )
+
+    op.alter_column("project_members", "created_at", server_default=None)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_project_members_user_project", table_name="project_members")
+    op.drop_table("project_members")
@@ -0,0 +1,56 @@
+"""fractional task order
+
+Revision ID: 5c8e1f0d2a67
+Revises: 9b6d3e2f1a84
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c8e1f0d2a67"
+down_revision: Union[str, Sequence[str], None] = "9b6d3e2f1a84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "tasks",
+        "order",
+        existing_type=sa.Integer(),
+        type_=sa.Float(),
+        existing_nullable=True,
+    )
+    # Give existing cards spaced positions within their column so moves can
+    # slot between them; previously unordered cards keep their id order.
+    op.execute(
+        """
+        UPDATE tasks SET "order" = ranked.position * 1024.0
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY project_id, status
+                ORDER BY "order" NULLS LAST, id
+            ) AS position
+            FROM tasks
+        ) AS ranked
+        WHERE tasks.id = ranked.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "tasks",
+        "order",
+        existing_type=sa.Float(),
+        type_=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using='round("order")::integer',
+    )
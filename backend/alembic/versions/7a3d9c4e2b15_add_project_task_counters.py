@@ -0,0 +1,52 @@
+"""add project task counters
+
+Revision ID: 7a3d9c4e2b15
+Revises: 5c8e1f0d2a67
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3d9c4e2b15"
+down_revision: Union[str, Sequence[str], None] = "5c8e1f0d2a67"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "project_task_counters",
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("todo", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("in_progress", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("done", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("last_activity_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id"),
+    )
+
+    # Backfill from the current tasks; last activity is the newest task change.
+    op.execute(
+        """
+        INSERT INTO project_task_counters (project_id, todo, in_progress, done, last_activity_at)
+        SELECT p.id,
+               COUNT(t.id) FILTER (WHERE t.status = 'todo'),
+               COUNT(t.id) FILTER (WHERE t.status = 'in_progress'),
+               COUNT(t.id) FILTER (WHERE t.status = 'done'),
+               MAX(t.updated_at)
+        FROM projects p
+        LEFT JOIN tasks t ON t.project_id = p.id
+        GROUP BY p.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("project_task_counters")
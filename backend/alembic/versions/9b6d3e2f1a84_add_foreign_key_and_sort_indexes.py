@@ -0,0 +1,52 @@
+"""add foreign key and sort indexes
+
+Revision ID: 9b6d3e2f1a84
+Revises: 4f2a9c1e7b30
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b6d3e2f1a84"
+down_revision: Union[str, Sequence[str], None] = "4f2a9c1e7b30"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# comments (project_id, created_at) and (author_id, created_at) already exist
+# from c21b41e7a08d.
+INDEXES = (
+    ("ix_tasks_project_status_order", "tasks", ["project_id", "status", "order"]),
+    ("ix_tasks_assignee_project", "tasks", ["assignee_id", "project_id"]),
+    ("ix_projects_owner_id", "projects", ["owner_id"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY avoids locking writes on large tables; it cannot run
+    # inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
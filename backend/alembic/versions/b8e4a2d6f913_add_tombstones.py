@@ -0,0 +1,67 @@
+"""add tombstones and updated_at indexes for delta sync
+
+Revision ID: b8e4a2d6f913
+Revises: 3e8b6f1c9d20
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b8e4a2d6f913"
+down_revision: Union[str, Sequence[str], None] = "3e8b6f1c9d20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+UPDATED_AT_INDEXES = (
+    ("ix_tasks_project_updated_at", "tasks", ["project_id", "updated_at"]),
+    ("ix_comments_project_updated_at", "comments", ["project_id", "updated_at"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tombstones",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("record_id", sa.Integer(), nullable=False),
+        sa.Column("deleted_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_tombstones_project_deleted_at", "tombstones", ["project_id", "deleted_at"], unique=False
+    )
+    # tasks and comments are busy tables: CONCURRENTLY keeps them writable while
+    # the indexes build. It cannot run inside a transaction, hence the
+    # autocommit block after the transactional table creation above.
+    with op.get_context().autocommit_block():
+        for name, table, columns in UPDATED_AT_INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(UPDATED_AT_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+    op.drop_index("ix_tombstones_project_deleted_at", table_name="tombstones")
+    op.drop_table("tombstones")
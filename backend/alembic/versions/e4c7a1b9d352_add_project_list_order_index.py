@@ -0,0 +1,43 @@
+"""add project list order index
+
+Revision ID: e4c7a1b9d352
+Revises: b8e4a2d6f913
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4c7a1b9d352"
+down_revision: Union[str, Sequence[str], None] = "b8e4a2d6f913"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps projects writable while the index builds; it cannot
+    # run inside a transaction, hence the autocommit block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_projects_due_date_created_at",
+            "projects",
+            ["due_date", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_projects_due_date_created_at",
+            table_name="projects",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
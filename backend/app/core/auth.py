@@ -1,11 +1,13 @@
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from typing import Union
 
 import os
 from dotenv import load_dotenv
 
+# The app-wide CryptContext lives in app.utils.security; re-exported here.
+from app.utils.security import hash_password, pwd_context, verify_password  # noqa: F401
+
 load_dotenv()
 
 class Settings:
@@ -15,16 +17,6 @@ class Settings:
 
 settings = Settings()
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
-
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
 
 def create_access_token(data: dict, expires_delta: Union[timedelta, None] = None) -> str:
     to_encode = data.copy()
@@ -0,0 +1,96 @@
+import os
+import tempfile
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return int(value)
+
+
+def env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None or not value.strip():
+        return default
+    return float(value)
+
+
+class Settings:
+    DATABASE_URL = os.getenv("DATABASE_URL")
+    # Serve requests through an AsyncSession (asyncpg / aiosqlite) instead of
+    # the threadpool-bound sync Session.
+    DATABASE_ASYNC = env_bool("DATABASE_ASYNC")
+    # Optional streaming replica for read-only routes. After a write, that
+    # client's reads stay on the primary for READ_YOUR_WRITES_SECONDS so it
+    # never sees data older than its own change.
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL") or None
+    READ_YOUR_WRITES_SECONDS = env_int("READ_YOUR_WRITES_SECONDS", 5)
+
+    DB_ECHO = env_bool("DB_ECHO")
+    DB_POOL_SIZE = env_int("DB_POOL_SIZE", 5)
+    DB_MAX_OVERFLOW = env_int("DB_MAX_OVERFLOW", 10)
+    DB_POOL_TIMEOUT = env_int("DB_POOL_TIMEOUT", 30)
+    DB_POOL_RECYCLE = env_int("DB_POOL_RECYCLE", 1800)
+    DB_POOL_PRE_PING = env_bool("DB_POOL_PRE_PING", True)
+    # Server-side statement timeout in milliseconds (PostgreSQL only, 0 = off).
+    DB_STATEMENT_TIMEOUT_MS = env_int("DB_STATEMENT_TIMEOUT_MS", 0)
+    # Statements at least this slow (ms) are logged with their route (0 = off).
+    SLOW_QUERY_MS = env_int("SLOW_QUERY_MS", 200)
+    # Report each request's DB time and statement count in a Server-Timing header.
+    SERVER_TIMING_ENABLED = env_bool("SERVER_TIMING_ENABLED", True)
+
+    # In-process cache of authenticated users; bounds how long a change made
+    # by another worker process can go unnoticed. Set the TTL to 0 to disable.
+    USER_CACHE_TTL_SECONDS = env_int("USER_CACHE_TTL_SECONDS", 30)
+    USER_CACHE_MAX_SIZE = env_int("USER_CACHE_MAX_SIZE", 10000)
+
+    # bcrypt cost factor; raising it rehashes existing passwords on next login.
+    BCRYPT_ROUNDS = env_int("BCRYPT_ROUNDS", 12)
+    # Worker processes for bcrypt (0 = run in the threadpool instead) and the
+    # cap on hashes allowed to run or queue at once per event loop.
+    PASSWORD_HASH_WORKERS = env_int("PASSWORD_HASH_WORKERS", 2)
+    PASSWORD_HASH_MAX_CONCURRENCY = env_int("PASSWORD_HASH_MAX_CONCURRENCY", 8)
+
+    # Response compression: bodies below the threshold (bytes) go out as-is;
+    # brotli is preferred when the client accepts it and the package is installed.
+    COMPRESSION_MINIMUM_SIZE = env_int("COMPRESSION_MINIMUM_SIZE", 1024)
+    GZIP_LEVEL = env_int("GZIP_LEVEL", 6)
+    BROTLI_ENABLED = env_bool("BROTLI_ENABLED", True)
+    BROTLI_QUALITY = env_int("BROTLI_QUALITY", 4)
+
+    # Real-time project events: "memory" delivers within this process only;
+    # "postgres" relays them through LISTEN/NOTIFY so every worker sees them.
+    EVENTS_BACKEND = os.getenv("EVENTS_BACKEND", "memory").strip().lower()
+    # Events buffered per WebSocket before a slow client is told to resync.
+    EVENTS_QUEUE_SIZE = env_int("EVENTS_QUEUE_SIZE", 256)
+
+    # How long deletes stay visible to delta sync; older cursors must reload.
+    TOMBSTONE_RETENTION_DAYS = env_int("TOMBSTONE_RETENTION_DAYS", 30)
+
+    # Shared secret for /internal and /metrics; while unset those endpoints answer 403.
+    INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
+    # On-demand request profiling (see app.core.profiling). When enabled, a
+    # request with "X-Profile: 1" and the internal token is profiled, plus a
+    # random PROFILING_SAMPLE_RATE fraction of all requests. Stays off while
+    # INTERNAL_API_TOKEN is unset.
+    PROFILING_ENABLED = env_bool("PROFILING_ENABLED")
+    PROFILING_SAMPLE_RATE = env_float("PROFILING_SAMPLE_RATE", 0.0)
+    PROFILING_INTERVAL_MS = env_int("PROFILING_INTERVAL_MS", 5)
+    # Newest profiles kept on disk; older ones are deleted.
+    PROFILING_MAX_PROFILES = env_int("PROFILING_MAX_PROFILES", 50)
+    PROFILING_DIR = os.getenv("PROFILING_DIR") or os.path.join(tempfile.gettempdir(), "smart_team_profiles")
+
+
+settings = Settings()
@@ -0,0 +1,211 @@
+"""
+Project change events for real-time board updates.
+
+CRUD functions call ``emit`` inside their transaction. Events wait on the
+session and are published only once it commits, so subscribers never see a
+change that was rolled back. ``broadcaster`` fans them out to the WebSocket
+connections subscribed to each project.
+
+Backends (``EVENTS_BACKEND``):
+
+- ``memory``: delivers in-process. Enough for one worker and for tests.
+- ``postgres``: sends the events with ``pg_notify`` as part of the committing
+  transaction. Every worker LISTENs on one channel, so all of them see every
+  change no matter which worker made it.
+"""
+import asyncio
+import logging
+import threading
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set
+
+import orjson
+from sqlalchemy import event, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "project_events"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+PG_NOTIFY_MAX_BYTES = 7900
+PENDING_EVENTS_KEY = "pending_events"
+
+RESYNC = "resync"
+
+
+def emit(db: Session, project_id: int, event_type: str, **data: Any) -> None:
+    """
+    Queue a change event to publish when ``db`` commits.
+
+    Args:
+        db (Session): Session whose transaction carries the change.
+        project_id (int): Project whose subscribers receive the event.
+        event_type (str): Event name, e.g. ``tasks.updated``.
+        **data: JSON-serializable event fields.
+    """
+    db.info.setdefault(PENDING_EVENTS_KEY, []).append(
+        {"type": event_type, "project_id": project_id, **data}
+    )
+
+
+def encode_event(payload: Dict[str, Any]) -> str:
+    return orjson.dumps(payload).decode()
+
+
+def _resync(project_id: int) -> str:
+    return encode_event({"type": RESYNC, "project_id": project_id})
+
+
+class Subscription:
+    """
+    One WebSocket's bounded queue of encoded events for a project.
+
+    ``put`` may be called from any thread; the event is handed to the loop
+    that created the subscription. When a slow client lets the queue fill
+    up, its backlog is dropped and replaced by a single ``resync`` event.
+    """
+
+    def __init__(self, project_id: int, maxsize: int) -> None:
+        self.project_id = project_id
+        self.queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max(1, maxsize))
+        self._loop = asyncio.get_running_loop()
+
+    def put(self, message: str) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._put, message)
+        except RuntimeError:
+            # The loop has shut down; the connection is gone.
+            pass
+
+    def _put(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(_resync(self.project_id))
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+
+class Broadcaster:
+    """Routes published project events to the subscriptions for that project."""
+
+    def __init__(self, backend: str = "memory", queue_size: int = 256) -> None:
+        if backend not in ("memory", "postgres"):
+            raise ValueError(f"Unknown events backend '{backend}'")
+        self.backend = backend
+        self.queue_size = queue_size
+        self._subscriptions: Dict[int, Set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+        self._listener = None
+
+    def subscribe(self, project_id: int) -> Subscription:
+        subscription = Subscription(project_id, self.queue_size)
+        with self._lock:
+            self._subscriptions[project_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.project_id)
+            if subscriptions is None:
+                return
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._subscriptions[subscription.project_id]
+
+    def subscriber_count(self, project_id: Optional[int] = None) -> int:
+        with self._lock:
+            if project_id is not None:
+                return len(self._subscriptions.get(project_id, ()))
+            return sum(len(s) for s in self._subscriptions.values())
+
+    def deliver(self, message: str, project_id: int) -> None:
+        """Hand an encoded event to every local subscriber of ``project_id``."""
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(project_id, ()))
+        for subscription in subscriptions:
+            subscription.put(message)
+
+    def publish(self, events: List[Dict[str, Any]]) -> None:
+        for payload in events:
+            self.deliver(encode_event(payload), payload["project_id"])
+
+    def notify_statement(self, events: List[Dict[str, Any]]):
+        """
+        One ``SELECT pg_notify(...), ...`` sending every event of a transaction.
+
+        Events too large for a NOTIFY payload are replaced by ``resync``, which
+        tells clients to refetch the board.
+        """
+        payloads = []
+        for payload in events:
+            message = encode_event(payload)
+            if len(message.encode()) > PG_NOTIFY_MAX_BYTES:
+                message = _resync(payload["project_id"])
+            payloads.append(message)
+        return select(*(func.pg_notify(EVENTS_CHANNEL, message) for message in payloads))
+
+    async def start(self, database_url: Optional[str]) -> None:
+        """Start LISTENing when the postgres backend is configured."""
+        if self.backend != "postgres" or self._listener is not None:
+            return
+        import asyncpg
+
+        url = make_url(database_url).set(drivername="postgresql")
+        self._listener = await asyncpg.connect(url.render_as_string(hide_password=False))
+        self._listener.add_termination_listener(self._on_listener_lost)
+        await self._listener.add_listener(EVENTS_CHANNEL, self._on_notify)
+
+    async def stop(self) -> None:
+        listener, self._listener = self._listener, None
+        if listener is not None and not listener.is_closed():
+            await listener.close()
+
+    def _on_notify(self, connection, pid, channel, message: str) -> None:
+        try:
+            project_id = orjson.loads(message)["project_id"]
+        except (orjson.JSONDecodeError, KeyError, TypeError):
+            logger.warning("Ignoring malformed project event: %r", message[:200])
+            return
+        self.deliver(message, project_id)
+
+    def _on_listener_lost(self, connection) -> None:
+        logger.error("Project events listener connection closed; real-time updates stopped")
+        # Clients keep whatever they have; make them refetch once.
+        with self._lock:
+            project_ids = list(self._subscriptions)
+        for project_id in project_ids:
+            self.deliver(_resync(project_id), project_id)
+
+
+broadcaster = Broadcaster(settings.EVENTS_BACKEND, settings.EVENTS_QUEUE_SIZE)
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_before_commit(session: Session) -> None:
+    # NOTIFY is transactional: sent with the commit, discarded on rollback.
+    events = session.info.get(PENDING_EVENTS_KEY)
+    if not events or broadcaster.backend != "postgres":
+        return
+    if session.get_bind().dialect.name != "postgresql":
+        return
+    session.execute(broadcaster.notify_statement(events))
+    session.info[PENDING_EVENTS_KEY] = []
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_after_commit(session: Session) -> None:
+    events = session.info.pop(PENDING_EVENTS_KEY, None)
+    if events:
+        broadcaster.publish(events)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(PENDING_EVENTS_KEY, None)
@@ -0,0 +1,124 @@
+import asyncio
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.metrics import observe_password_hash
+from app.utils import security
+
+T = TypeVar("T")
+
+
+def _timed(fn: Callable[..., T], *args) -> Tuple[float, T]:
+    # Runs in the worker process; wall-clock start time lets the parent
+    # compute how long the job waited in the executor queue.
+    return time.time(), fn(*args)
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt off the event loop on a bounded process pool.
+
+    bcrypt holds the CPU for hundreds of milliseconds, so hashing in worker
+    processes keeps the GIL free for request handling. At most
+    ``max_concurrency`` jobs may run or queue per event loop; further callers
+    wait on a semaphore and that wait counts as queue time.
+    """
+
+    def __init__(self, workers: int, max_concurrency: int) -> None:
+        self.workers = workers
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats_lock = threading.Lock()
+        self.completed = 0
+        self.in_flight = 0
+        self.queue_seconds_total = 0.0
+        self.queue_seconds_max = 0.0
+        self.run_seconds_total = 0.0
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.workers <= 0:
+            return None
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def _run(self, operation: str, fn: Callable[..., T], *args) -> T:
+        submitted = time.time()
+        async with self._get_semaphore():
+            with self._stats_lock:
+                self.in_flight += 1
+            try:
+                executor = self._get_executor()
+                if executor is None:
+                    started, result = await run_in_threadpool(_timed, fn, *args)
+                else:
+                    loop = asyncio.get_running_loop()
+                    started, result = await loop.run_in_executor(executor, _timed, fn, *args)
+            finally:
+                with self._stats_lock:
+                    self.in_flight -= 1
+        self._record(operation, queued=max(0.0, started - submitted), ran=max(0.0, time.time() - started))
+        return result
+
+    def _record(self, operation: str, queued: float, ran: float) -> None:
+        observe_password_hash(operation, queued, ran)
+        with self._stats_lock:
+            self.completed += 1
+            self.queue_seconds_total += queued
+            self.queue_seconds_max = max(self.queue_seconds_max, queued)
+            self.run_seconds_total += ran
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", security.hash_password, password)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """
+        Verify a password and return a replacement hash if the cost factor changed.
+
+        Returns:
+            tuple[bool, str | None]: Match result and, when outdated, a new hash.
+        """
+        return await self._run("verify", security.verify_and_update_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, float]:
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "max_concurrency": self.max_concurrency,
+                "completed": self.completed,
+                "in_flight": self.in_flight,
+                "queue_seconds_total": round(self.queue_seconds_total, 6),
+                "queue_seconds_max": round(self.queue_seconds_max, 6),
+                "run_seconds_total": round(self.run_seconds_total, 6),
+            }
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_concurrency=settings.PASSWORD_HASH_MAX_CONCURRENCY,
+)
@@ -0,0 +1,134 @@
+import threading
+import time
+from typing import Dict, Optional, Type
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+
+class PoolMetrics:
+    """
+    Cumulative checkout counters for one connection pool.
+
+    Wait time is measured around ``Pool.connect()``, so it covers both time
+    spent queueing for a free connection and opening a new one.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.overflow_checkouts = 0
+
+    def record_checkout(self, waited: float, overflowed: bool) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+            if overflowed:
+                self.overflow_checkouts += 1
+
+    def record_timeout(self, waited: float) -> None:
+        with self._lock:
+            self.timeouts += 1
+            self.wait_seconds_total += waited
+            self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self, pool: Optional[Pool] = None) -> Dict[str, float]:
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "timeouts": self.timeouts,
+                "overflow_checkouts": self.overflow_checkouts,
+                "wait_seconds_total": round(self.wait_seconds_total, 6),
+                "wait_seconds_max": round(self.wait_seconds_max, 6),
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                {
+                    "size": pool.size(),
+                    "checked_in": pool.checkedin(),
+                    "checked_out": pool.checkedout(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return data
+
+
+class InstrumentedPoolMixin:
+    """Times every checkout and records it on the pool's ``PoolMetrics``."""
+
+    metrics: PoolMetrics
+
+    def connect(self):
+        started = time.perf_counter()
+        overflow_before = self.overflow()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_timeout(time.perf_counter() - started)
+            raise
+        # Only a checkout that opened a connection beyond pool_size counts;
+        # reusing a pooled one while overflow connections exist does not.
+        overflow_after = self.overflow()
+        overflowed = overflow_after > 0 and overflow_after > overflow_before
+        self.metrics.record_checkout(time.perf_counter() - started, overflowed)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrumented_pool_class(is_async: bool) -> Type[Pool]:
+    return InstrumentedAsyncAdaptedQueuePool if is_async else InstrumentedQueuePool
+
+
+def attach_pool_metrics(pool: Pool) -> PoolMetrics:
+    """
+    Attach a fresh ``PoolMetrics`` to ``pool`` and subscribe it to pool events.
+
+    Args:
+        pool (Pool): The engine's pool (``engine.pool`` / ``async_engine.sync_engine.pool``).
+
+    Returns:
+        PoolMetrics: The metrics object now recording for this pool.
+    """
+    metrics = PoolMetrics()
+    pool.metrics = metrics
+
+    @event.listens_for(pool, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        metrics.increment("connects")
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        metrics.increment("checkins")
+
+    @event.listens_for(pool, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        metrics.increment("invalidations")
+
+    return metrics
@@ -0,0 +1,366 @@
+"""
+On-demand statistical profiles of single requests.
+
+``ProfilingMiddleware`` starts a ``StackSampler`` for a request when it
+carries ``X-Profile: 1`` and the internal token, or when it falls in the
+``PROFILING_SAMPLE_RATE`` fraction. The sampler reads
+``sys._current_frames()`` every ``PROFILING_INTERVAL_MS``. Samples are
+wall-clock, so time spent waiting on the database shows up too.
+
+Two kinds of thread are sampled:
+- The event loop thread, only while it is running this request's coroutine
+  chain. A stack counts when it passes through the middleware's own frame,
+  so other requests sharing the loop are left out. This covers routing,
+  dependency resolution and response serialization.
+- Threadpool workers, while they run one of this request's ``run_db`` calls.
+  This covers the CRUD layer and the ORM.
+
+Finished profiles go to a bounded on-disk ring buffer (``ProfileStore``) and
+can be downloaded as a pstats file or speedscope JSON from
+``/internal/profiles``.
+
+Profiling stays off while ``INTERNAL_API_TOKEN`` is unset: nobody could be
+authorized to trigger it or download the results.
+"""
+import contextvars
+import json
+import logging
+import marshal
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.dependencies.internal import is_internal_token_valid
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+PROFILE_HEADER = "x-profile"
+PROFILE_ID_HEADER = "x-profile-id"
+# Profiling is for spot checks; beyond this many at once requests run unprofiled.
+MAX_CONCURRENT_PROFILES = 4
+LOOP_THREAD = "event loop"
+PROFILE_ID = re.compile(r"^\d{8}T\d{6}-[0-9a-f]{8}$")
+
+FrameKey = Tuple[str, str, int]
+
+
+class StackSampler:
+    """Samples the stacks of one request's threads from a background thread."""
+
+    def __init__(self, loop_thread_id: int, anchor, interval: float) -> None:
+        self.loop_thread_id = loop_thread_id
+        self.anchor = anchor
+        self.interval = interval
+        self.frames: List[FrameKey] = []
+        self._frame_index: Dict[FrameKey, int] = {}
+        self.stacks: Dict[str, List[List[int]]] = {}
+        self._workers: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def add_worker(self, thread_id: int) -> None:
+        with self._lock:
+            self._workers[thread_id] = self._workers.get(thread_id, 0) + 1
+
+    def remove_worker(self, thread_id: int) -> None:
+        with self._lock:
+            remaining = self._workers.pop(thread_id) - 1
+            if remaining:
+                self._workers[thread_id] = remaining
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def sample(self) -> None:
+        current = sys._current_frames()
+        loop_frame = current.get(self.loop_thread_id)
+        if loop_frame is not None:
+            self._record(LOOP_THREAD, loop_frame, self.anchor)
+        with self._lock:
+            workers = list(self._workers)
+        for thread_id in workers:
+            frame = current.get(thread_id)
+            if frame is not None:
+                self._record(f"worker {thread_id}", frame, None)
+
+    def _record(self, thread: str, frame, anchor) -> None:
+        # Walk leaf to root; with an anchor, stop there and drop the sample
+        # if the anchor is not on the stack (the loop is busy elsewhere).
+        stack = []
+        while frame is not None:
+            stack.append(self._index(frame.f_code))
+            if frame is anchor:
+                break
+            frame = frame.f_back
+        else:
+            if anchor is not None:
+                return
+        stack.reverse()
+        self.stacks.setdefault(thread, []).append(stack)
+
+    def _index(self, code) -> int:
+        key = (code.co_qualname, code.co_filename, code.co_firstlineno)
+        index = self._frame_index.get(key)
+        if index is None:
+            index = self._frame_index[key] = len(self.frames)
+            self.frames.append(key)
+        return index
+
+
+_active_sampler: contextvars.ContextVar[Optional[StackSampler]] = contextvars.ContextVar(
+    "active_stack_sampler", default=None
+)
+
+
+def track_thread(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap a function about to run in the threadpool so the request's sampler follows it.
+
+    Returns ``fn`` unchanged when the current request is not being profiled.
+    """
+    sampler = _active_sampler.get()
+    if sampler is None:
+        return fn
+
+    def tracked(*args: Any, **kwargs: Any) -> T:
+        thread_id = threading.get_ident()
+        sampler.add_worker(thread_id)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            sampler.remove_worker(thread_id)
+
+    return tracked
+
+
+def to_speedscope(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a stored profile to the speedscope file format, one profile per thread."""
+    interval_ms = profile["interval_ms"]
+    title = f"{profile['method']} {profile['route']}"
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": f"{title} ({profile['id']})",
+        "exporter": "smart_team_assistant",
+        "activeProfileIndex": 0,
+        "shared": {
+            "frames": [{"name": name, "file": file, "line": line} for name, file, line in profile["frames"]]
+        },
+        "profiles": [
+            {
+                "type": "sampled",
+                "name": f"{title} - {thread}",
+                "unit": "milliseconds",
+                "startValue": 0,
+                "endValue": len(stacks) * interval_ms,
+                "samples": stacks,
+                "weights": [interval_ms] * len(stacks),
+            }
+            for thread, stacks in profile["threads"].items()
+        ],
+    }
+
+
+def to_pstats(profile: Dict[str, Any]) -> bytes:
+    """
+    Convert a stored profile to the marshalled dict that ``pstats.Stats`` loads.
+
+    Call counts are sample counts. Times are samples multiplied by the
+    interval: a function's own time counts the samples where it is the leaf,
+    and its cumulative time counts the samples where it is on the stack.
+    """
+    interval = profile["interval_ms"] / 1000
+    keys = [(file, line, name) for name, file, line in profile["frames"]]
+    stats: Dict[Tuple, List] = {}
+    for stacks in profile["threads"].values():
+        for stack in stacks:
+            seen = set()
+            for depth, index in enumerate(stack):
+                key = keys[index]
+                entry = stats.setdefault(key, [0, 0, 0.0, 0.0, {}])
+                is_leaf = depth == len(stack) - 1
+                entry[1] += 1
+                if key not in seen:
+                    entry[0] += 1
+                    entry[3] += interval
+                    seen.add(key)
+                if is_leaf:
+                    entry[2] += interval
+                if depth:
+                    caller = entry[4].setdefault(keys[stack[depth - 1]], [0, 0, 0.0, 0.0])
+                    caller[0] += 1
+                    caller[1] += 1
+                    caller[3] += interval
+                    if is_leaf:
+                        caller[2] += interval
+    return marshal.dumps(
+        {
+            key: (cc, nc, tt, ct, {caller: tuple(values) for caller, values in callers.items()})
+            for key, (cc, nc, tt, ct, callers) in stats.items()
+        }
+    )
+
+
+class ProfileStore:
+    """Keeps the newest ``max_profiles`` profiles as JSON files in ``directory``."""
+
+    def __init__(self, directory: str, max_profiles: int) -> None:
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def _path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def _ids(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        # IDs start with a timestamp, so name order is age order.
+        return sorted(
+            name[: -len(".json")]
+            for name in os.listdir(self.directory)
+            if name.endswith(".json") and PROFILE_ID.match(name[: -len(".json")])
+        )
+
+    def save(self, profile: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(profile["id"])
+        with open(f"{path}.tmp", "w", encoding="utf-8") as handle:
+            json.dump(profile, handle)
+        os.replace(f"{path}.tmp", path)
+        ids = self._ids()
+        for stale in ids[: max(0, len(ids) - self.max_profiles)]:
+            try:
+                os.remove(self._path(stale))
+            except FileNotFoundError:
+                pass
+
+    def load(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        if not PROFILE_ID.match(profile_id):
+            return None
+        try:
+            with open(self._path(profile_id), encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            return None
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Summaries of the stored profiles, newest first."""
+        summaries = []
+        for profile_id in reversed(self._ids()):
+            profile = self.load(profile_id)
+            if profile is not None:
+                summaries.append(
+                    {key: value for key, value in profile.items() if key not in ("frames", "threads")}
+                )
+        return summaries
+
+
+profile_store = ProfileStore(settings.PROFILING_DIR, settings.PROFILING_MAX_PROFILES)
+
+
+def new_profile_id() -> str:
+    return f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{secrets.token_hex(4)}"
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that ask for it (admin only) or are randomly sampled.
+
+    Does nothing unless ``INTERNAL_API_TOKEN`` is configured.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        enabled: bool,
+        sample_rate: float = 0.0,
+        interval_ms: int = 5,
+        store: Optional[ProfileStore] = None,
+    ) -> None:
+        self.app = app
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.interval = max(1, interval_ms) / 1000
+        self.store = store
+        self._active = 0
+        if enabled and not settings.INTERNAL_API_TOKEN:
+            logger.warning("PROFILING_ENABLED is set but INTERNAL_API_TOKEN is not; profiling stays off")
+
+    def _trigger(self, scope: Scope) -> Optional[str]:
+        headers = Headers(scope=scope)
+        if headers.get(PROFILE_HEADER) == "1" and is_internal_token_valid(headers.get("x-internal-token")):
+            return "header"
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if not self.enabled or scope["type"] != "http" or not settings.INTERNAL_API_TOKEN:
+            await self.app(scope, receive, send)
+            return
+        trigger = self._trigger(scope)
+        if trigger is None or self._active >= MAX_CONCURRENT_PROFILES:
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = new_profile_id()
+        status_code = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if trigger == "header":
+                    MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile_id)
+            await send(message)
+
+        # This coroutine's frame sits under everything the request runs on the loop.
+        sampler = StackSampler(threading.get_ident(), sys._getframe(), self.interval)
+        token = _active_sampler.set(sampler)
+        self._active += 1
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            duration = time.perf_counter() - started
+            sampler.stop()
+            _active_sampler.reset(token)
+            self._active -= 1
+            route = scope.get("route")
+            profile = {
+                "id": profile_id,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "trigger": trigger,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(route, "path", None) or scope["path"],
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 3),
+                "interval_ms": self.interval * 1000,
+                "samples": sum(len(stacks) for stacks in sampler.stacks.values()),
+                "frames": sampler.frames,
+                "threads": sampler.stacks,
+            }
+            await run_in_threadpool((self.store or profile_store).save, profile)
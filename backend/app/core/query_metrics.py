@@ -0,0 +1,181 @@
+"""
+Per-request SQL statement counts and database time.
+
+``attach_query_metrics`` hooks an engine's cursor events. While a request
+runs inside ``QueryMetricsMiddleware``, every statement is added to that
+request's ``RequestQueryStats``. The stats are held in a context variable,
+which is copied into the threadpool and ``run_sync`` greenlets that run the
+CRUD layer. The middleware reports the totals in a ``Server-Timing`` header
+and a log record. Statements slower than ``SLOW_QUERY_MS`` are logged with
+their route and a fingerprint of their parameters, never the values.
+"""
+import contextvars
+import hashlib
+import logging
+import time
+from typing import Any, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+SERVER_TIMING_HEADER = "server-timing"
+_START_TIMES = "query_metrics_started"
+
+
+class RequestQueryStats:
+    """Statements run and seconds spent in the database for one request."""
+
+    def __init__(self, scope: Optional[Scope] = None) -> None:
+        self.scope = scope
+        self.queries = 0
+        self.db_seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.queries += 1
+        self.db_seconds += seconds
+
+    @property
+    def route(self) -> str:
+        """The matched route template (e.g. ``/api/projects/{project_id}``), else the raw path."""
+        if self.scope is None:
+            return "-"
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or self.scope.get("path", "-")
+
+
+_current_stats: contextvars.ContextVar[Optional[RequestQueryStats]] = contextvars.ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def current_stats() -> Optional[RequestQueryStats]:
+    """The stats of the request being served, or None outside a request."""
+    return _current_stats.get()
+
+
+def params_fingerprint(parameters: Any) -> str:
+    """Short stable hash of bound parameters, so slow queries can be grouped without logging values."""
+    return hashlib.blake2b(repr(parameters).encode(), digest_size=6).hexdigest()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info.setdefault(_START_TIMES, []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    started = conn.info[_START_TIMES].pop()
+    elapsed = time.perf_counter() - started
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(elapsed)
+
+    threshold_ms = settings.SLOW_QUERY_MS
+    if threshold_ms > 0 and elapsed * 1000 >= threshold_ms:
+        route = stats.route if stats is not None else "-"
+        fingerprint = params_fingerprint(parameters)
+        logger.warning(
+            "Slow query %.1fms on %s [params %s]: %s",
+            elapsed * 1000,
+            route,
+            fingerprint,
+            statement,
+            extra={
+                "route": route,
+                "duration_ms": round(elapsed * 1000, 3),
+                "statement": statement,
+                "params_fingerprint": fingerprint,
+                "executemany": executemany,
+            },
+        )
+
+
+def _on_handle_error(exception_context) -> None:
+    # A failed statement never reaches after_cursor_execute; drop its start time.
+    started = exception_context.connection.info.get(_START_TIMES) if exception_context.connection else None
+    if started:
+        started.pop()
+
+
+def attach_query_metrics(engine: Engine) -> None:
+    """
+    Count and time every statement run on ``engine``. Safe to call more than once.
+
+    Args:
+        engine (Engine): A sync engine (``async_engine.sync_engine`` for async ones).
+    """
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _on_handle_error)
+
+
+def server_timing(stats: RequestQueryStats, total_seconds: float) -> str:
+    """``Server-Timing`` value with the request's database time and statement count."""
+    return (
+        f'db;dur={stats.db_seconds * 1000:.3f};desc="{stats.queries} queries", '
+        f"app;dur={total_seconds * 1000:.3f}"
+    )
+
+
+class QueryMetricsMiddleware:
+    """
+    Collects each HTTP request's query stats and reports them.
+
+    The ``Server-Timing`` header is written when the response starts, so
+    statements run after that (background tasks, streamed bodies) only show
+    up in the log record emitted when the request finishes.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = True) -> None:
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats(scope)
+        token = _current_stats.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.server_timing:
+                    MutableHeaders(scope=message).append(
+                        SERVER_TIMING_HEADER, server_timing(stats, time.perf_counter() - started)
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current_stats.reset(token)
+            duration_ms = (time.perf_counter() - started) * 1000
+            logger.info(
+                "%s %s %s %.1fms db=%d queries/%.1fms",
+                scope["method"],
+                stats.route,
+                status_code,
+                duration_ms,
+                stats.queries,
+                stats.db_seconds * 1000,
+                extra={
+                    "method": scope["method"],
+                    "route": stats.route,
+                    "status_code": status_code,
+                    "duration_ms": round(duration_ms, 3),
+                    "db_queries": stats.queries,
+                    "db_ms": round(stats.db_seconds * 1000, 3),
+                },
+            )
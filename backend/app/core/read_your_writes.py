@@ -0,0 +1,61 @@
+"""
+Read-your-writes for replica routing.
+
+After a successful write (any non-GET request answered below 400) the
+response sets a short-lived ``primary_until`` cookie. ``get_read_db`` sees it
+and keeps that client's reads on the primary until it expires, so replica lag
+never hides the client's own change. The cookie travels with the browser, so
+it works across API workers without shared state.
+"""
+import time
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app import database
+
+PRIMARY_COOKIE = "primary_until"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+def is_primary_sticky(connection: HTTPConnection, now: Optional[float] = None) -> bool:
+    """Whether this client wrote recently and must read from the primary."""
+    value = connection.cookies.get(PRIMARY_COOKIE)
+    if value is None:
+        return False
+    try:
+        return float(value) > (now if now is not None else time.time())
+    except ValueError:
+        return False
+
+
+class ReadYourWritesMiddleware:
+    """Sets the ``primary_until`` cookie on successful writes while a replica is configured."""
+
+    def __init__(self, app: ASGIApp, window_seconds: int) -> None:
+        self.app = app
+        self.window_seconds = window_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or self.window_seconds <= 0
+            or database.ReadSessionLocal is None
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = int(time.time()) + self.window_seconds
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PRIMARY_COOKIE}={until}; Max-Age={self.window_seconds}; "
+                    "Path=/; HttpOnly; SameSite=lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
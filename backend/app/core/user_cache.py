@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.user import User
+
+CACHED_FIELDS = ("id", "username", "email", "is_active")
+
+
+class UserCache:
+    """
+    Bounded in-process TTL/LRU cache of active users keyed by id.
+
+    Entries hold plain column values rather than ORM instances, so nothing is
+    shared between sessions or threads; ``get`` builds a fresh transient
+    ``User`` on every hit. The password hash is never cached.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[int, tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[User]:
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+        return User(**values)
+
+    def set(self, user: User) -> None:
+        if self.max_size <= 0 or self.ttl_seconds <= 0 or not user.is_active:
+            return
+        values = {field: getattr(user, field) for field in CACHED_FIELDS}
+        with self._lock:
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, values)
+            self._entries.move_to_end(user.id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+user_cache = UserCache(
+    max_size=settings.USER_CACHE_MAX_SIZE,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+)
+
+
+_CHANGED_USERS = "user_cache_changed_ids"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session: Session, flush_context) -> None:
+    # Flushed changes (deactivation, username/email edits, deletion) are only
+    # remembered here; evicting before commit would let a concurrent request
+    # re-cache the old row, or drop an entry for a change that is rolled back.
+    changed = [obj.id for obj in (*session.dirty, *session.deleted) if isinstance(obj, User)]
+    if changed:
+        session.info.setdefault(_CHANGED_USERS, set()).update(changed)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    # Evict once the change is visible, so the next request reloads it.
+    for user_id in session.info.pop(_CHANGED_USERS, ()):
+        user_cache.invalidate(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_rolled_back_users(session: Session) -> None:
+    # Fires for the outer transaction only; a rolled-back savepoint can at
+    # worst cause an extra eviction.
+    session.info.pop(_CHANGED_USERS, None)
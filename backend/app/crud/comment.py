@@ -1,27 +1,53 @@
-from typing import List
+from typing import Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, raiseload
 
+from app.core.events import emit
 from app.crud.task import verify_project_access
+from app.crud.tombstones import COMMENT, record_deletions
 from app.models.comment import Comment
+from app.models.project_member import ProjectMember
 from app.models.user import User
-from app.schemas.comment import CommentCreate, CommentUpdate
+from app.schemas.comment import CommentAuthor, CommentCreate, CommentRead, CommentUpdate
+from app.utils.pagination import Page, PageParams, paginate
 
 
 def list_comments_for_project(
     db: Session,
     project_id: int,
     current_user: User,
-) -> List[Comment]:
+    page: Optional[PageParams] = None,
+) -> Page[Comment]:
     verify_project_access(db, project_id, current_user)
-    return (
+    return paginate(
         db.query(Comment)
-        .filter(Comment.project_id == project_id)
-        .order_by(Comment.created_at.asc())
-        .all()
+        .options(joinedload(Comment.author), raiseload("*"))
+        .filter(Comment.project_id == project_id),
+        order_by=[Comment.created_at, Comment.id],
+        key=lambda comment: (comment.created_at, comment.id),
+        page=page,
     )
 
 
+def get_comment_list_version(db: Session, project_id: int, current_user: User) -> Tuple:
+    """
+    Membership check plus ``(count, max(updated_at))`` of a project's comments.
+
+    Author renames are not reflected; they only show up once the thread changes.
+    """
+    row = db.execute(
+        select(func.count(Comment.id), func.max(Comment.updated_at))
+        .select_from(ProjectMember)
+        .outerjoin(Comment, Comment.project_id == ProjectMember.project_id)
+        .where(ProjectMember.project_id == project_id, ProjectMember.user_id == current_user.id)
+        .group_by(ProjectMember.project_id)
+    ).first()
+    if row is None:
+        raise ValueError("Project not found")
+    return tuple(row)
+
+
 def create_comment(
     db: Session,
     project_id: int,
@@ -39,9 +65,11 @@ def create_comment(
         author_id=current_user.id,
     )
     db.add(new_comment)
+    _emit_comment(db, new_comment, current_user)
     db.commit()
-    db.refresh(new_comment)
-    return new_comment
+    # Reload with the author attached so serialization never lazy-loads
+    # (which would fail outside the greenlet on an AsyncSession).
+    return _get_comment_or_error(db, project_id, new_comment.id)
 
 
 def _get_comment_or_error(
@@ -51,6 +79,7 @@ def _get_comment_or_error(
 ) -> Comment:
     comment = (
         db.query(Comment)
+        .options(joinedload(Comment.author))
         .filter(Comment.project_id == project_id, Comment.id == comment_id)
         .first()
     )
@@ -78,9 +107,9 @@ def update_comment(
     if comment.body != body:
         comment.body = body
         comment.edited = True
+        _emit_comment(db, comment, comment.author)
     db.commit()
-    db.refresh(comment)
-    return comment
+    return _get_comment_or_error(db, project_id, comment_id)
 
 
 def delete_comment(
@@ -95,4 +124,21 @@ def delete_comment(
         raise PermissionError("Not authorized to delete this comment")
 
     db.delete(comment)
+    record_deletions(db, project_id, COMMENT, [comment.id])
+    emit(db, project_id, "comments.deleted", ids=[comment.id])
     db.commit()
+
+
+def _emit_comment(db: Session, comment: Comment, author: User) -> None:
+    # Built by hand: the author may be a cached user from another session.
+    db.flush()
+    payload = CommentRead(
+        id=comment.id,
+        project_id=comment.project_id,
+        body=comment.body,
+        edited=comment.edited,
+        created_at=comment.created_at,
+        updated_at=comment.updated_at,
+        author=CommentAuthor.model_validate(author),
+    )
+    emit(db, comment.project_id, "comments.updated", comments=[payload.model_dump(mode="json")])
@@ -0,0 +1,130 @@
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Mapping, Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+from app.models.project_task_counter import ProjectTaskCounter
+from app.models.task import Task, TaskStatus
+
+COUNTED_FIELDS = tuple(task_status.value for task_status in TaskStatus)
+
+
+def init_counters(db: Session, project_id: int) -> None:
+    """
+    Create the zeroed counter row for a new project in the caller's transaction.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the (flushed) project.
+    """
+    db.add(ProjectTaskCounter(project_id=project_id))
+
+
+def record_task_changes(db: Session, project_id: int, deltas: Optional[Mapping] = None) -> None:
+    """
+    Apply per-status deltas to a project's counters and bump ``last_activity_at``.
+
+    Runs a single ``UPDATE ... SET todo = todo + :delta`` so concurrent task
+    changes never overwrite each other's increments. With no deltas only the
+    activity timestamp moves.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        deltas (Mapping[TaskStatus, int] | None): Change in task count per status.
+    """
+    values = {"last_activity_at": datetime.now(timezone.utc)}
+    for task_status, delta in (deltas or {}).items():
+        if delta:
+            column = TaskStatus(task_status).value
+            values[column] = getattr(ProjectTaskCounter, column) + delta
+    db.execute(
+        update(ProjectTaskCounter)
+        .where(ProjectTaskCounter.project_id == project_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def status_change(previous: TaskStatus, current: TaskStatus) -> Dict[TaskStatus, int]:
+    """Deltas for one task moving between columns (empty if it did not move)."""
+    if TaskStatus(previous) == TaskStatus(current):
+        return {}
+    return {previous: -1, current: 1}
+
+
+def count_statuses(statuses, sign: int = 1) -> Dict[str, int]:
+    """Deltas for tasks created (``sign=1``) or deleted (``sign=-1``) in bulk."""
+    return {task_status: sign * n for task_status, n in Counter(TaskStatus(s).value for s in statuses).items()}
+
+
+def reconcile_counters(db: Session, fix: bool = True) -> List[dict]:
+    """
+    Recompute every project's counters from ``tasks`` and report drift.
+
+    With ``fix`` the counter rows are locked (``SELECT ... FOR UPDATE``)
+    before the tasks are counted. A task change that already updated its
+    counter is waited for and then included in the count. One that has not
+    reached its counter yet blocks until this transaction commits, then
+    applies its increment on top of the corrected value. Either way no
+    increment is lost.
+
+    Args:
+        db (Session): Database session.
+        fix (bool): Overwrite drifted or missing rows with the recomputed values.
+
+    Returns:
+        list[dict]: One entry per drifted project with ``project_id``,
+        ``stored`` (None if the row was missing) and ``actual`` counts.
+    """
+    stored_query = db.query(ProjectTaskCounter).order_by(ProjectTaskCounter.project_id)
+    if fix:
+        stored_query = stored_query.with_for_update()
+    stored = {counter.project_id: counter for counter in stored_query}
+    actual_rows = db.execute(
+        select(
+            Project.id,
+            *[
+                func.count(Task.id).filter(Task.status == field).label(field)
+                for field in COUNTED_FIELDS
+            ],
+        )
+        .outerjoin(Task, Task.project_id == Project.id)
+        .group_by(Project.id)
+    ).all()
+
+    drift = []
+    for row in actual_rows:
+        actual = {field: getattr(row, field) for field in COUNTED_FIELDS}
+        counter = stored.get(row.id)
+        current = (
+            None if counter is None else {field: getattr(counter, field) for field in COUNTED_FIELDS}
+        )
+        if current == actual:
+            continue
+        if fix and counter is None and not _add_missing_counter(db, row.id, actual):
+            # Created with its counters after the lock was taken; nothing to fix.
+            continue
+        drift.append({"project_id": row.id, "stored": current, "actual": actual})
+        if fix and counter is not None:
+            for field, value in actual.items():
+                setattr(counter, field, value)
+
+    if fix:
+        # Also ends the transaction when nothing drifted, releasing the locks.
+        db.commit()
+    return drift
+
+
+def _add_missing_counter(db: Session, project_id: int, actual: Dict[str, int]) -> bool:
+    # A savepoint, so a row inserted concurrently by project creation is not an error.
+    try:
+        with db.begin_nested():
+            db.add(ProjectTaskCounter(project_id=project_id, **actual))
+    except IntegrityError:
+        return False
+    return True
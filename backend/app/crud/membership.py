@@ -0,0 +1,67 @@
+from typing import Optional
+
+from sqlalchemy import exists, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+
+_UPSERT_DIALECTS = {"postgresql": postgresql, "sqlite": sqlite}
+
+
+def add_member(db: Session, project_id: int, user_id: Optional[int]) -> None:
+    """
+    Grant a user access to a project within the caller's transaction.
+
+    Uses ``INSERT ... ON CONFLICT DO NOTHING`` so two requests assigning
+    the same user at once cannot both try to insert the row.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        user_id (int | None): ID of the user; ``None`` is ignored.
+    """
+    if user_id is None:
+        return
+    dialect = db.get_bind().dialect.name
+    if dialect not in _UPSERT_DIALECTS:
+        if db.get(ProjectMember, (project_id, user_id)) is None:
+            db.add(ProjectMember(project_id=project_id, user_id=user_id))
+        return
+    db.execute(
+        _UPSERT_DIALECTS[dialect]
+        .insert(ProjectMember)
+        .values(project_id=project_id, user_id=user_id)
+        .on_conflict_do_nothing(index_elements=["project_id", "user_id"])
+    )
+
+
+def sync_member(db: Session, project_id: int, user_id: Optional[int]) -> None:
+    """
+    Recompute one user's membership after they may have lost access.
+
+    The user stays a member while they own the project or are assigned at
+    least one of its tasks. Pending changes are flushed first so the check
+    sees the caller's updates.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        user_id (int | None): ID of the user; ``None`` is ignored.
+    """
+    if user_id is None:
+        return
+    db.flush()
+    still_member = db.scalar(
+        select(
+            exists().where(Project.id == project_id, Project.owner_id == user_id)
+            | exists().where(Task.project_id == project_id, Task.assignee_id == user_id)
+        )
+    )
+    membership = db.get(ProjectMember, (project_id, user_id))
+    if still_member and membership is None:
+        add_member(db, project_id, user_id)
+    elif not still_member and membership is not None:
+        db.delete(membership)
@@ -1,8 +1,28 @@
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
-from app.models.project import Project
-from app.models.task import Task
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.orm import Session, joinedload, raiseload
+from app.crud.counters import COUNTED_FIELDS, init_counters
+from app.crud.membership import add_member, sync_member
+from app.crud.tombstones import COMMENT, TASK, retention_cutoff
+from app.models.comment import Comment
+from app.models.project import Project, ProjectPriority, ProjectStatus
+from app.models.project_member import ProjectMember
+from app.models.project_task_counter import ProjectTaskCounter
+from app.models.task import Task, TaskStatus
+from app.models.tombstone import Tombstone
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.utils.pagination import (
+    InvalidCursorError,
+    NullsLast,
+    Page,
+    PageParams,
+    decode_cursor,
+    encode_cursor,
+    paginate,
+)
 
 
 def create_project(db: Session, project: ProjectCreate, owner_id: int) -> Project:
@@ -20,61 +40,357 @@ def create_project(db: Session, project: ProjectCreate, owner_id: int) -> Projec
     data = project.model_dump(exclude_unset=True)
     new_project = Project(owner_id=owner_id, **data)
     db.add(new_project)
+    db.flush()
+    add_member(db, new_project.id, owner_id)
+    init_counters(db, new_project.id)
     db.commit()
     db.refresh(new_project)
     return new_project
 
 
-def get_projects_by_user(db: Session, user_id: int):
+@dataclass
+class ProjectFilters:
+    """Optional filters for the project list; ``None`` leaves a field unfiltered."""
+
+    status: Optional[ProjectStatus] = None
+    priority: Optional[ProjectPriority] = None
+    archived: Optional[bool] = None
+    # Projects due strictly before this time; projects without a due date never match.
+    due_before: Optional[datetime] = None
+
+
+def get_projects_by_user(
+    db: Session,
+    user_id: int,
+    page: Optional[PageParams] = None,
+    filters: Optional[ProjectFilters] = None,
+) -> Page[Project]:
     """
-    Retrieve all projects owned by a specific user.
+    Retrieve projects owned by or assigned to a specific user.
+
+    Access comes from an EXISTS on ``project_members``, which holds the
+    owner and every assignee, so no rows need de-duplicating. Ordered by
+    due date (projects without one last), then creation time, matching
+    ``ix_projects_due_date_created_at``.
     Args:
         db (Session): Database session.
         user_id (int): ID of the user whose projects are to be retrieved.
+        page (PageParams | None): Keyset page; all projects when omitted.
+        filters (ProjectFilters | None): Status, priority, archived and due-date filters.
     Returns:
-        List[Project]: A list of projects owned by the user.
+        Page[Project]: The user's projects and the next-page cursor.
     """
-    owned_query = db.query(Project).filter(Project.owner_id == user_id)
-    assigned_query = (
-        db.query(Project)
-        .join(Task, Task.project_id == Project.id)
-        .filter(Task.assignee_id == user_id)
+    query = db.query(Project).filter(
+        exists().where(ProjectMember.project_id == Project.id, ProjectMember.user_id == user_id)
     )
+    filters = filters or ProjectFilters()
+    if filters.status is not None:
+        query = query.filter(Project.status == filters.status)
+    if filters.priority is not None:
+        query = query.filter(Project.priority == filters.priority)
+    if filters.archived is not None:
+        query = query.filter(Project.is_archived == filters.archived)
+    if filters.due_before is not None:
+        query = query.filter(Project.due_date < _naive_utc(filters.due_before))
 
-    projects = (
-        owned_query.union(assigned_query)
-        .order_by(
-            Project.due_date.is_(None),
-            Project.due_date.asc(),
-            Project.created_at.asc(),
-        )
-        .all()
+    return paginate(
+        query.options(raiseload("*")),
+        order_by=[NullsLast(Project.due_date), Project.created_at, Project.id],
+        key=lambda project: (project.due_date, project.created_at, project.id),
+        page=page,
     )
-    return projects
+
+
+def get_project_list_version(db: Session, user_id: int) -> Tuple:
+    """
+    Cheap fingerprint of a user's project list for conditional GETs.
+
+    Args:
+        db (Session): Database session.
+        user_id (int): ID of the user whose projects are listed.
+
+    Membership can change without touching any project, e.g. when a task
+    reassignment moves a user from one project to another. The newest
+    membership time and the sum of project IDs make such swaps change the
+    fingerprint even when the count and newest project stay the same.
+
+    Returns:
+        tuple: ``(count, max_updated_at, max_joined_at, project_id_sum)``
+        over the projects they are a member of.
+    """
+    row = db.execute(
+        select(
+            func.count(Project.id),
+            func.max(Project.updated_at),
+            func.max(ProjectMember.created_at),
+            func.sum(ProjectMember.project_id),
+        )
+        .join(ProjectMember, ProjectMember.project_id == Project.id)
+        .where(ProjectMember.user_id == user_id)
+    ).one()
+    return tuple(row)
 
 
 def get_project_by_id(db: Session, project_id: int, owner_id: int) -> Project:
     """
-    Retrieve a project by its ID.
+    Retrieve a project by its ID if the user is a member of it.
     
     Args:
         db (Session): Database session.
         project_id (int): ID of the project to retrieve.
+        owner_id (int): ID of the requesting user (owner or task assignee).
     
     Returns:
         Project: The project instance if found, otherwise None.
     """
     return (
         db.query(Project)
-        .outerjoin(Task, Task.project_id == Project.id)
+        .join(ProjectMember, ProjectMember.project_id == Project.id)
         .filter(
-            Project.id == project_id,
-            or_(Project.owner_id == owner_id, Task.assignee_id == owner_id),
+            ProjectMember.project_id == project_id,
+            ProjectMember.user_id == owner_id,
         )
         .first()
     )
 
 
+def get_project_full(db: Session, project_id: int, user_id: int, comment_limit: int) -> Optional[dict]:
+    """
+    Load a project with its tasks, latest comments and per-status task counts.
+
+    Runs three queries regardless of project size: the membership-checked
+    project, its tasks in board order, and the newest comments with their
+    authors joined. Counts are derived from the loaded tasks.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        user_id (int): ID of the requesting user; must be a project member.
+        comment_limit (int): How many of the most recent comments to include.
+
+    Returns:
+        dict: ``project``, ``tasks``, ``comments`` (oldest first),
+        ``task_counts`` and the delta-sync ``cursor``, or None if the project
+        is not accessible.
+    """
+    as_of = _utcnow()
+    project = get_project_by_id(db, project_id, user_id)
+    if not project:
+        return None
+
+    tasks = (
+        db.query(Task)
+        .options(raiseload("*"))
+        .filter(Task.project_id == project_id)
+        .order_by(Task.order.is_(None), Task.order, Task.id)
+        .all()
+    )
+    comments = []
+    if comment_limit > 0:
+        comments = (
+            db.query(Comment)
+            .options(joinedload(Comment.author), raiseload("*"))
+            .filter(Comment.project_id == project_id)
+            .order_by(Comment.created_at.desc(), Comment.id.desc())
+            .limit(comment_limit)
+            .all()
+        )
+        comments.reverse()
+
+    task_counts = {task_status: 0 for task_status in TaskStatus}
+    for task in tasks:
+        task_counts[task.status] += 1
+
+    return {
+        "project": project,
+        "tasks": tasks,
+        "comments": comments,
+        "task_counts": task_counts,
+        "cursor": changes_cursor(as_of),
+    }
+
+
+# Rows are stamped when flushed but become visible at commit, so a cursor
+# starts a little before the read that produced it. Clients apply changes
+# by ID, so receiving a row twice is harmless.
+CHANGES_OVERLAP = timedelta(seconds=5)
+
+
+class CursorExpiredError(Exception):
+    """The cursor predates the tombstone retention window; reload instead."""
+
+
+def changes_cursor(as_of: datetime) -> str:
+    return encode_cursor([as_of - CHANGES_OVERLAP])
+
+
+def get_project_changes(
+    db: Session,
+    project_id: int,
+    user_id: int,
+    since: Optional[str] = None,
+) -> Optional[dict]:
+    """
+    Tasks and comments changed after a cursor, plus the IDs deleted since.
+
+    Changed rows are found by ``updated_at`` and deletes by tombstone, one
+    query each after the membership check. Without ``since`` every task and
+    comment is returned. Pass the returned ``cursor`` on the next call.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        user_id (int): ID of the requesting user; must be a project member.
+        since (str | None): Cursor from ``/full`` or a previous call.
+
+    Returns:
+        dict: ``tasks``, ``comments``, ``deleted_task_ids``,
+        ``deleted_comment_ids`` and ``cursor``, or None if the project is not
+        accessible.
+
+    Raises:
+        InvalidCursorError: If ``since`` is malformed.
+        CursorExpiredError: If deletes from that far back are no longer kept.
+    """
+    as_of = _utcnow()
+    since_at = None
+    if since is not None:
+        values = decode_cursor(since)
+        if len(values) != 1 or not isinstance(values[0], datetime):
+            raise InvalidCursorError("Invalid cursor")
+        since_at = _naive_utc(values[0])
+        if since_at < retention_cutoff(as_of):
+            raise CursorExpiredError("Cursor has expired; reload the project")
+
+    if not get_project_by_id(db, project_id, user_id):
+        return None
+
+    tasks = db.query(Task).options(raiseload("*")).filter(Task.project_id == project_id)
+    comments = (
+        db.query(Comment)
+        .options(joinedload(Comment.author), raiseload("*"))
+        .filter(Comment.project_id == project_id)
+    )
+    deleted = {TASK: [], COMMENT: []}
+    if since_at is not None:
+        tasks = tasks.filter(Task.updated_at >= since_at)
+        comments = comments.filter(Comment.updated_at >= since_at)
+        for kind, record_id in db.execute(
+            select(Tombstone.kind, Tombstone.record_id)
+            .where(Tombstone.project_id == project_id, Tombstone.deleted_at >= since_at)
+            .order_by(Tombstone.id)
+        ):
+            deleted[kind].append(record_id)
+
+    return {
+        "tasks": tasks.order_by(Task.id).all(),
+        "comments": comments.order_by(Comment.created_at, Comment.id).all(),
+        "deleted_task_ids": deleted[TASK],
+        "deleted_comment_ids": deleted[COMMENT],
+        "cursor": changes_cursor(as_of),
+    }
+
+
+DUE_SOON_DAYS = 7
+
+
+def _utcnow() -> datetime:
+    # Due dates are stored as naive UTC timestamps.
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _naive_utc(value: datetime) -> datetime:
+    # Client-supplied times may carry any offset; compare them as stored.
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def get_project_stats(db: Session, user_id: int) -> Dict[str, int]:
+    """
+    Count the user's projects by status and upcoming due date in one query.
+
+    Task totals are summed from the per-project counters, so the query reads
+    one row per project and never scans ``tasks``.
+
+    Args:
+        db (Session): Database session.
+        user_id (int): ID of the user; counts cover projects they are a member of.
+
+    Returns:
+        dict: ``total``, ``active``, ``completed``, ``due_soon`` (due within
+        ``DUE_SOON_DAYS`` days from now) and ``tasks_<status>`` totals.
+    """
+    now = _utcnow()
+    row = db.execute(
+        select(
+            func.count().label("total"),
+            func.count().filter(Project.status == ProjectStatus.ACTIVE.value).label("active"),
+            func.count().filter(Project.status == ProjectStatus.COMPLETED.value).label("completed"),
+            func.count()
+            .filter(Project.due_date.between(now, now + timedelta(days=DUE_SOON_DAYS)))
+            .label("due_soon"),
+            *[
+                func.coalesce(func.sum(getattr(ProjectTaskCounter, field)), 0).label(f"tasks_{field}")
+                for field in COUNTED_FIELDS
+            ],
+        )
+        .select_from(Project)
+        .join(ProjectMember, ProjectMember.project_id == Project.id)
+        .outerjoin(ProjectTaskCounter, ProjectTaskCounter.project_id == Project.id)
+        .where(ProjectMember.user_id == user_id)
+    ).one()
+    return dict(row._mapping)
+
+
+def get_project_task_stats(db: Session, project_id: int, user_id: int) -> Optional[Dict[str, int]]:
+    """
+    Task counts per status, plus overdue ones, for one project.
+
+    Status counts come from the project's counter row; overdue depends on
+    the current time, so it is counted from ``tasks`` at read time. Projects
+    without a counter row (not yet reconciled) fall back to aggregating
+    ``tasks`` directly.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        user_id (int): ID of the requesting user; must be a project member.
+
+    Returns:
+        dict: ``total``, ``todo``, ``in_progress``, ``done`` and ``overdue``
+        (past due and not done), or None if the project is not accessible.
+    """
+    if not get_project_by_id(db, project_id, user_id):
+        return None
+
+    overdue = (
+        select(func.count())
+        .where(
+            Task.project_id == project_id,
+            Task.status != TaskStatus.DONE.value,
+            Task.due_date < _utcnow(),
+        )
+        .scalar_subquery()
+        .label("overdue")
+    )
+    row = db.execute(
+        select(*[getattr(ProjectTaskCounter, field) for field in COUNTED_FIELDS], overdue)
+        .where(ProjectTaskCounter.project_id == project_id)
+    ).first()
+    if row is None:
+        row = db.execute(
+            select(
+                *[func.count().filter(Task.status == field).label(field) for field in COUNTED_FIELDS],
+                overdue,
+            ).where(Task.project_id == project_id)
+        ).one()
+
+    stats = dict(row._mapping)
+    stats["total"] = sum(stats[field] for field in COUNTED_FIELDS)
+    return stats
+
+
 def update_project(db: Session, project_id: int, updates: ProjectUpdate, owner_id: int) -> Project:
     """
     Update an existing project.
@@ -91,9 +407,14 @@ def update_project(db: Session, project_id: int, updates: ProjectUpdate, owner_i
     if not project:
         return None
 
+    previous_owner_id = project.owner_id
     for field, value in updates.model_dump(exclude_unset=True).items():
         setattr(project, field, value)
 
+    if project.owner_id != previous_owner_id:
+        add_member(db, project.id, project.owner_id)
+        sync_member(db, project.id, previous_owner_id)
+
     db.commit()
     db.refresh(project)
     return project
@@ -0,0 +1,101 @@
+import re
+from typing import Optional
+
+from sqlalchemy import Float, String, column, func, literal_column, select, table, union_all
+from sqlalchemy.orm import Session
+
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.search import SEARCH_VECTOR_COLUMN, TS_CONFIG, fts_table
+from app.models.task import Task
+from app.utils.pagination import Page, PageParams, paginate
+
+SNIPPET_LENGTH = 200
+
+# (kind, model, title column, project id column)
+_SOURCES = (
+    ("project", Project, Project.name, Project.id),
+    ("task", Task, Task.title, Task.project_id),
+    ("comment", Comment, func.substr(Comment.body, 1, SNIPPET_LENGTH), Comment.project_id),
+)
+
+
+def _postgres_hits(user_id: int, q: str):
+    tsquery = func.websearch_to_tsquery(literal_column(f"'{TS_CONFIG}'::regconfig"), q)
+    selects = []
+    for kind, model, title, project_id in _SOURCES:
+        vector = literal_column(f"{model.__tablename__}.{SEARCH_VECTOR_COLUMN}")
+        selects.append(
+            select(
+                literal_column(f"'{kind}'", String).label("kind"),
+                model.id.label("id"),
+                project_id.label("project_id"),
+                title.label("title"),
+                # Lower is better, matching SQLite's bm25().
+                (-func.ts_rank(vector, tsquery, type_=Float)).label("score"),
+            )
+            .join(ProjectMember, ProjectMember.project_id == project_id)
+            .where(ProjectMember.user_id == user_id, vector.op("@@")(tsquery))
+        )
+    return union_all(*selects).subquery("hits")
+
+
+def _fts5_query(q: str) -> str:
+    # Quote every word so user input can never be read as FTS5 operators.
+    return " ".join('"{}"'.format(word) for word in re.findall(r"\w+", q))
+
+
+def _sqlite_hits(user_id: int, q: str):
+    match = _fts5_query(q)
+    selects = []
+    for kind, model, title, project_id in _SOURCES:
+        name = fts_table(model.__tablename__)
+        fts = table(name, column("rowid"))
+        selects.append(
+            select(
+                literal_column(f"'{kind}'", String).label("kind"),
+                model.id.label("id"),
+                project_id.label("project_id"),
+                title.label("title"),
+                func.bm25(literal_column(name), type_=Float).label("score"),
+            )
+            .join(fts, fts.c.rowid == model.id)
+            .join(ProjectMember, ProjectMember.project_id == project_id)
+            .where(ProjectMember.user_id == user_id, literal_column(name).op("MATCH")(match))
+        )
+    return union_all(*selects).subquery("hits")
+
+
+def search(db: Session, user_id: int, q: str, page: Optional[PageParams] = None) -> Page:
+    """
+    Full-text search over the projects, tasks and comments a user can access.
+
+    Uses the ``search_vector`` GIN indexes on PostgreSQL and the FTS5 tables
+    on SQLite (see ``app.models.search``). Hits are ranked best first and
+    paginated by keyset on ``(score, kind, id)``.
+
+    Args:
+        db (Session): Database session.
+        user_id (int): ID of the searching user; only their projects are searched.
+        q (str): Search text; words are matched after stemming (PostgreSQL)
+            or tokenization (SQLite), and every word must match.
+        page (PageParams | None): Keyset page.
+
+    Returns:
+        Page: Rows with ``kind``, ``id``, ``project_id``, ``title`` and ``score``.
+    """
+    if not re.search(r"\w", q):
+        return Page()
+
+    if db.get_bind().dialect.name == "postgresql":
+        hits = _postgres_hits(user_id, q)
+    else:
+        hits = _sqlite_hits(user_id, q)
+
+    return paginate(
+        db.query(hits),
+        order_by=[hits.c.score, hits.c.kind, hits.c.id],
+        key=lambda hit: (hit.score, hit.kind, hit.id),
+        page=page,
+    )
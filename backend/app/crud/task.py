@@ -1,9 +1,18 @@
-from typing import List
-from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, exists, func, insert, select, update
+from sqlalchemy.orm import Session, raiseload
 
-from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
+from app.core.events import emit
+from app.crud.counters import count_statuses, record_task_changes, status_change
+from app.crud.membership import add_member, sync_member
+from app.crud.project import get_project_by_id
+from app.crud.task_order import ColumnTail, InvalidMoveError, next_order, next_order_expr, place_task
+from app.crud.tombstones import TASK, record_deletions
+from app.schemas.task import TaskBulkUpdateItem, TaskCreate, TaskMove, TaskRead, TaskUpdate
+from app.utils.pagination import Page, PageParams, paginate
 from app.models.project import Project
+from app.models.project_member import ProjectMember
 from app.models.task import Task
 from app.models.user import User
 
@@ -13,18 +22,7 @@ def verify_project_access(
     project_id: int,
     current_user: User,
 ) -> Project:
-    project = (
-        db.query(Project)
-        .outerjoin(Task, Task.project_id == Project.id)
-        .filter(
-            Project.id == project_id,
-            or_(
-                Project.owner_id == current_user.id,
-                Task.assignee_id == current_user.id,
-            ),
-        )
-        .first()
-    )
+    project = get_project_by_id(db, project_id, current_user.id)
     if not project:
         raise ValueError("Project not found")
     return project
@@ -62,7 +60,12 @@ def create_task(
     verify_project_ownership(db, project_id, current_user)
 
     new_task = Task(**task.model_dump(), project_id=project_id)
+    if new_task.order is None:
+        new_task.order = next_order(db, project_id, new_task.status)
     db.add(new_task)
+    add_member(db, project_id, new_task.assignee_id)
+    record_task_changes(db, project_id, {new_task.status: 1})
+    _emit_tasks(db, project_id, [new_task])
     db.commit()
     db.refresh(new_task)
     return new_task
@@ -70,21 +73,55 @@ def create_task(
 def get_tasks_for_project(
     db: Session, 
     project_id: int, 
-    current_user: User
-) -> List[TaskRead]:
+    current_user: User,
+    page: Optional[PageParams] = None,
+) -> Page[Task]:
     """
-    Retrieve all tasks for a specific project.
+    Retrieve tasks for a specific project, ordered by ID.
     
     Args:
         db (Session): Database session.
         project_id (int): ID of the project.
         current_user (User): The user requesting the tasks.
+        page (PageParams | None): Keyset page; all tasks when omitted.
     
     Returns:
-        list[TaskRead]: A list of tasks in the specified project.
+        Page[Task]: Tasks in the specified project and the next-page cursor.
     """
     verify_project_access(db, project_id, current_user)
-    return db.query(Task).filter(Task.project_id == project_id).all()
+    return paginate(
+        db.query(Task).options(raiseload("*")).filter(Task.project_id == project_id),
+        order_by=[Task.id],
+        key=lambda task: (task.id,),
+        page=page,
+    )
+
+
+def get_task_list_version(db: Session, project_id: int, current_user: User) -> Tuple:
+    """
+    Cheap fingerprint of a project's task list for conditional GETs.
+
+    One query checks membership and returns the task count and newest
+    ``updated_at``; any insert, update or delete changes one of them.
+    
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        current_user (User): The user requesting the tasks.
+    
+    Returns:
+        tuple: ``(count, max_updated_at)``.
+    """
+    row = db.execute(
+        select(func.count(Task.id), func.max(Task.updated_at))
+        .select_from(ProjectMember)
+        .outerjoin(Task, Task.project_id == ProjectMember.project_id)
+        .where(ProjectMember.project_id == project_id, ProjectMember.user_id == current_user.id)
+        .group_by(ProjectMember.project_id)
+    ).first()
+    if row is None:
+        raise ValueError("Project not found")
+    return tuple(row)
 
 
 def get_task_by_id(
@@ -95,6 +132,8 @@ def get_task_by_id(
 ) -> TaskRead:
     """
     Retrieve a specific task by its ID within a project.
+
+    Membership is checked in the same query that loads the task.
     
     Args:
         db (Session): Database session.
@@ -105,10 +144,17 @@ def get_task_by_id(
     Returns:
         TaskRead: The requested task instance.
     """
-    verify_project_access(db, project_id, current_user)
-    task = db.query(Task).filter(Task.id == task_id, Task.project_id == project_id).first()
-    if not task:
-        raise ValueError("Task not found")
+    task = db.scalar(
+        select(Task)
+        .join(ProjectMember, ProjectMember.project_id == Task.project_id)
+        .where(
+            Task.id == task_id,
+            Task.project_id == project_id,
+            ProjectMember.user_id == current_user.id,
+        )
+    )
+    if task is None:
+        raise _task_error(db, project_id, current_user, verify_project_access)
     return task
 
 
@@ -118,7 +164,7 @@ def update_task(
     task_id: int, 
     task_update: TaskCreate, 
     current_user: User
-) -> TaskUpdate:
+) -> TaskRead:
     """
     Update an existing task in a project.
     
@@ -130,20 +176,9 @@ def update_task(
         current_user (User): The user updating the task.
     
     Returns:
-        TaskRead: The updated task instance.
+        TaskRead: The updated task.
     """
-    verify_project_ownership(db, project_id, current_user)
-    
-    task = get_task_by_id(db, project_id, task_id, current_user)
-    if not task:
-        raise ValueError("Task not found")
-    
-    for key, value in task_update.model_dump(exclude_unset=True).items():
-        setattr(task, key, value)
-    
-    db.commit()
-    db.refresh(task)
-    return task
+    return _update_task(db, project_id, task_id, task_update.model_dump(exclude_unset=True), current_user)
 
 
 def partial_update_task(
@@ -152,7 +187,7 @@ def partial_update_task(
     task_id: int, 
     task_update: TaskUpdate, 
     current_user: User
-) -> TaskUpdate:
+) -> TaskRead:
     """
     Partially update an existing task in a project.
     
@@ -164,20 +199,9 @@ def partial_update_task(
         current_user (User): The user updating the task.
     
     Returns:
-        TaskRead: The updated task instance.
+        TaskRead: The updated task.
     """
-    verify_project_ownership(db, project_id, current_user)
-    
-    task = get_task_by_id(db, project_id, task_id, current_user)
-    if not task:
-        raise ValueError("Task not found")
-    
-    for key, value in task_update.model_dump(exclude_unset=True).items():
-        setattr(task, key, value)
-    
-    db.commit()
-    db.refresh(task)
-    return task
+    return _update_task(db, project_id, task_id, task_update.model_dump(exclude_unset=True), current_user)
 
 
 def delete_task(
@@ -188,21 +212,317 @@ def delete_task(
 ) -> None:
     """
     Delete a task from a project.
+
+    A single ``DELETE ... RETURNING`` checks ownership, removes the row and
+    returns what the counters and membership bookkeeping need.
     
     Args:
         db (Session): Database session.
         project_id (int): ID of the project.
         task_id (int): ID of the task to delete.
         current_user (User): The user deleting the task.
+    """
+    task = db.execute(
+        delete(Task)
+        .where(
+            Task.id == task_id,
+            Task.project_id == project_id,
+            exists().where(Project.id == project_id, Project.owner_id == current_user.id),
+        )
+        .returning(Task.id, Task.status, Task.assignee_id)
+        .execution_options(synchronize_session="fetch")
+    ).first()
+    if task is None:
+        raise _task_error(db, project_id, current_user, verify_project_ownership)
+
+    sync_member(db, project_id, task.assignee_id)
+    record_task_changes(db, project_id, {task.status: -1})
+    record_deletions(db, project_id, TASK, [task.id])
+    emit(db, project_id, "tasks.deleted", ids=[task.id])
+    db.commit()
+
+
+def reorder_tasks(
+    db: Session,
+    project_id: int,
+    moves: List[TaskMove],
+    current_user: User
+) -> List[Task]:
+    """
+    Apply a batch of Kanban moves in a single transaction.
+
+    Each move places one task in a column relative to its new neighbours
+    using fractional ordering, so a move normally rewrites only that task.
+    Moves are applied in order; later moves see the result of earlier ones.
+    
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        moves (list[TaskMove]): Moves to apply.
+        current_user (User): The user reordering the tasks.
     
     Returns:
-        bool: True if the task was deleted, False if not found.
+        list[Task]: Every task whose column or position changed.
     """
     verify_project_ownership(db, project_id, current_user)
-    
-    task = get_task_by_id(db, project_id, task_id, current_user)
-    if not task:
+
+    task_ids = {move.task_id for move in moves}
+    task_ids |= {move.after_id for move in moves if move.after_id is not None}
+    task_ids |= {move.before_id for move in moves if move.before_id is not None}
+    tasks = {
+        task.id: task
+        for task in db.query(Task).filter(Task.project_id == project_id, Task.id.in_(task_ids))
+    }
+    if len(tasks) != len(task_ids):
         raise ValueError("Task not found")
+
+    original_status = {move.task_id: tasks[move.task_id].status for move in moves}
+    changed: Dict[int, Task] = {}
+    for move in moves:
+        task = tasks[move.task_id]
+        status = move.status or task.status
+        after = tasks.get(move.after_id)
+        before = tasks.get(move.before_id)
+        place_task(db, task, status, after=after, before=before)
+        # Includes tasks rewritten when a column had to be renumbered.
+        changed.update((obj.id, obj) for obj in db.dirty if isinstance(obj, Task))
+        db.flush()
+
+    deltas = Counter()
+    for task_id, previous_status in original_status.items():
+        deltas.update(status_change(previous_status, tasks[task_id].status))
+    record_task_changes(db, project_id, deltas)
+    _emit_tasks(db, project_id, changed.values())
+    db.commit()
+    return (
+        db.query(Task)
+        .filter(Task.id.in_(changed.keys()))
+        .order_by(Task.status, Task.order, Task.id)
+        .all()
+    )
+
+
+def bulk_create_tasks(
+    db: Session,
+    project_id: int,
+    tasks: List[TaskCreate],
+    current_user: User
+) -> List[dict]:
+    """
+    Create many tasks with one access check and one multi-row INSERT.
     
-    db.delete(task)
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        tasks (list[TaskCreate]): Tasks to create, in order.
+        current_user (User): The user creating the tasks.
+    
+    Returns:
+        list[dict]: One result per input item with the created task.
+    """
+    verify_project_ownership(db, project_id, current_user)
+
+    tail = ColumnTail(db, project_id)
+    rows = []
+    for task in tasks:
+        row = task.model_dump()
+        row["project_id"] = project_id
+        if row["order"] is None:
+            row["order"] = tail.next(row["status"])
+        rows.append(row)
+
+    new_tasks = db.scalars(
+        insert(Task).returning(Task, sort_by_parameter_order=True), rows
+    ).all()
+    created_ids = [task.id for task in new_tasks]
+    for assignee_id in {row["assignee_id"] for row in rows}:
+        add_member(db, project_id, assignee_id)
+    record_task_changes(db, project_id, count_statuses(row["status"] for row in rows))
+    _emit_tasks(db, project_id, new_tasks)
+    db.commit()
+
+    created = _load_tasks(db, created_ids)
+    return [
+        {"index": index, "id": task_id, "status": "created", "task": created[task_id]}
+        for index, task_id in enumerate(created_ids)
+    ]
+
+
+def bulk_update_tasks(
+    db: Session,
+    project_id: int,
+    items: List[TaskBulkUpdateItem],
+    current_user: User
+) -> List[dict]:
+    """
+    Partially update many tasks in one transaction.
+
+    Items referring to tasks outside the project are reported as
+    ``not_found``; the rest are applied in order and flushed together.
+    
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        items (list[TaskBulkUpdateItem]): Task IDs with the fields to change.
+        current_user (User): The user updating the tasks.
+    
+    Returns:
+        list[dict]: One result per input item.
+    """
+    verify_project_ownership(db, project_id, current_user)
+
+    tasks = _load_tasks(db, {item.id for item in items}, project_id)
+    tail = ColumnTail(db, project_id)
+    gained, lost = set(), set()
+    deltas = Counter()
+    results = []
+    for index, item in enumerate(items):
+        task = tasks.get(item.id)
+        if task is None:
+            results.append({"index": index, "id": item.id, "status": "not_found"})
+            continue
+
+        previous_assignee_id = task.assignee_id
+        previous_status = task.status
+        changes = item.model_dump(exclude_unset=True, exclude={"id"})
+        for key, value in changes.items():
+            setattr(task, key, value)
+
+        if task.status != previous_status and "order" not in changes:
+            task.order = tail.next(task.status)
+        deltas.update(status_change(previous_status, task.status))
+        if task.assignee_id != previous_assignee_id:
+            gained.add(task.assignee_id)
+            lost.add(previous_assignee_id)
+        results.append({"index": index, "id": task.id, "status": "updated"})
+
+    for user_id in gained:
+        add_member(db, project_id, user_id)
+    for user_id in lost - gained:
+        sync_member(db, project_id, user_id)
+    record_task_changes(db, project_id, deltas)
+    _emit_tasks(db, project_id, {r["id"]: tasks[r["id"]] for r in results if r["status"] == "updated"}.values())
+    db.commit()
+
+    updated = _load_tasks(db, {r["id"] for r in results if r["status"] == "updated"})
+    for result in results:
+        if result["status"] == "updated":
+            result["task"] = updated[result["id"]]
+    return results
+
+
+def bulk_delete_tasks(
+    db: Session,
+    project_id: int,
+    task_ids: List[int],
+    current_user: User
+) -> List[dict]:
+    """
+    Delete many tasks with a single DELETE statement.
+    
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        task_ids (list[int]): IDs of the tasks to delete.
+        current_user (User): The user deleting the tasks.
+    
+    Returns:
+        list[dict]: One result per input ID (``deleted`` or ``not_found``).
+    """
+    verify_project_ownership(db, project_id, current_user)
+
+    found = db.execute(
+        select(Task.id, Task.assignee_id, Task.status).where(
+            Task.project_id == project_id, Task.id.in_(set(task_ids))
+        )
+    ).all()
+    assignees = {row.id: row.assignee_id for row in found}
+    if assignees:
+        db.execute(delete(Task).where(Task.id.in_(assignees.keys())))
+    for user_id in set(assignees.values()):
+        sync_member(db, project_id, user_id)
+    record_task_changes(db, project_id, count_statuses((row.status for row in found), sign=-1))
+    record_deletions(db, project_id, TASK, assignees)
+    if assignees:
+        emit(db, project_id, "tasks.deleted", ids=list(assignees))
     db.commit()
+
+    return [
+        {
+            "index": index,
+            "id": task_id,
+            "status": "deleted" if task_id in assignees else "not_found",
+        }
+        for index, task_id in enumerate(task_ids)
+    ]
+
+
+def _task_error(db: Session, project_id: int, current_user: User, check) -> ValueError:
+    # Only reached when the combined query found nothing: rerun the project
+    # check on its own so the caller gets the specific reason.
+    check(db, project_id, current_user)
+    return ValueError("Task not found")
+
+
+def _update_task(db: Session, project_id: int, task_id: int, changes: dict, current_user: User) -> TaskRead:
+    """
+    Apply field changes with one ownership-checked SELECT and one UPDATE.
+
+    The SELECT joins the project so ownership and the task's previous
+    column and assignee come back together. The UPDATE returns the new row,
+    including ``updated_at``, so nothing is re-read after the commit.
+    """
+    task = db.scalar(
+        select(Task)
+        .join(Project, Project.id == Task.project_id)
+        .where(
+            Task.id == task_id,
+            Task.project_id == project_id,
+            Project.owner_id == current_user.id,
+        )
+    )
+    if task is None:
+        raise _task_error(db, project_id, current_user, verify_project_ownership)
+
+    previous_assignee_id = task.assignee_id
+    previous_status = task.status
+    values = dict(changes)
+    if "status" in values and values["status"] != previous_status and "order" not in values:
+        # Moved to another column without an explicit position: append it.
+        values["order"] = next_order_expr(project_id, values["status"], exclude_id=task_id)
+    if values:
+        task = db.scalars(
+            update(Task)
+            .where(Task.id == task_id)
+            .values(**values)
+            .returning(Task)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        ).one()
+
+    if task.assignee_id != previous_assignee_id:
+        add_member(db, project_id, task.assignee_id)
+        sync_member(db, project_id, previous_assignee_id)
+
+    record_task_changes(db, project_id, status_change(previous_status, task.status))
+    _emit_tasks(db, project_id, [task])
+    updated = TaskRead.model_validate(task)
+    db.commit()
+    return updated
+
+
+def _load_tasks(db: Session, task_ids, project_id: Optional[int] = None) -> Dict[int, Task]:
+    # One SELECT for a whole batch; also refreshes instances expired by commit.
+    if not task_ids:
+        return {}
+    query = db.query(Task).filter(Task.id.in_(set(task_ids)))
+    if project_id is not None:
+        query = query.filter(Task.project_id == project_id)
+    return {task.id: task for task in query}
+
+
+def _emit_tasks(db: Session, project_id: int, tasks: Iterable[Task]) -> None:
+    # Flushed first so new rows have their ids and timestamps in the event.
+    db.flush()
+    payload = [TaskRead.model_validate(task).model_dump(mode="json") for task in tasks]
+    if payload:
+        emit(db, project_id, "tasks.updated", tasks=payload)
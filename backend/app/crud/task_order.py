@@ -0,0 +1,242 @@
+"""
+Fractional ordering for Kanban columns.
+
+``Task.order`` is a float and a column is sorted by ``(order, id)`` with
+unordered (legacy) tasks last. Moving a card writes a value between its new
+neighbours, so a move updates one row. Only when the gap between neighbours
+is exhausted, or a neighbour has no order yet, is the column renumbered.
+"""
+from typing import Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.orm import Session, aliased
+
+from app.models.task import Task, TaskStatus
+
+ORDER_STEP = 1024.0
+MIN_ORDER_GAP = 1e-6
+
+
+class InvalidMoveError(Exception):
+    """Raised when a move's neighbours are not in the target column or not adjacent."""
+
+
+def _column_filter(project_id: int, status: TaskStatus, exclude_id: Optional[int]):
+    criteria = [Task.project_id == project_id, Task.status == status]
+    if exclude_id is not None:
+        criteria.append(Task.id != exclude_id)
+    return criteria
+
+
+def next_order(db: Session, project_id: int, status: TaskStatus, exclude_id: Optional[int] = None) -> float:
+    """
+    Order value that appends a task to the end of a column.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): ID of the project.
+        status (TaskStatus): The column.
+        exclude_id (int | None): Task to ignore (the one being moved).
+
+    Returns:
+        float: One step past the current maximum.
+    """
+    current_max = db.scalar(
+        select(func.max(Task.order)).where(*_column_filter(project_id, status, exclude_id))
+    )
+    return (current_max or 0.0) + ORDER_STEP
+
+
+def next_order_expr(project_id: int, status: TaskStatus, exclude_id: Optional[int] = None):
+    """
+    ``next_order`` as a scalar subquery, to append inside an UPDATE.
+
+    Lets a column change and its new position go out as one statement
+    instead of a SELECT followed by the UPDATE.
+
+    Args:
+        project_id (int): ID of the project.
+        status (TaskStatus): The column.
+        exclude_id (int | None): Task to ignore (the one being moved).
+
+    Returns:
+        ScalarSelect: One step past the column's maximum when executed.
+    """
+    # Aliased so the subquery is not correlated to the UPDATE's own table.
+    column = aliased(Task)
+    criteria = [column.project_id == project_id, column.status == status]
+    if exclude_id is not None:
+        criteria.append(column.id != exclude_id)
+    return (
+        select(func.coalesce(func.max(column.order), 0.0) + ORDER_STEP)
+        .where(*criteria)
+        .scalar_subquery()
+    )
+
+
+class ColumnTail:
+    """
+    Hands out end-of-column orders for many tasks in one transaction.
+
+    Each column's current maximum is read once; later appends to the same
+    column continue from there without re-querying unflushed state.
+    """
+
+    def __init__(self, db: Session, project_id: int) -> None:
+        self.db = db
+        self.project_id = project_id
+        self._next: Dict[str, float] = {}
+
+    def next(self, status: TaskStatus) -> float:
+        key = TaskStatus(status).value
+        if key not in self._next:
+            self._next[key] = next_order(self.db, self.project_id, key)
+        order = self._next[key]
+        self._next[key] += ORDER_STEP
+        return order
+
+
+def _following_order(db: Session, task: Task, after: Task) -> Optional[float]:
+    # Order of the card directly below ``after``, honouring the id tie-break.
+    return db.scalar(
+        select(Task.order)
+        .where(
+            *_column_filter(after.project_id, after.status, task.id),
+            or_(
+                Task.order > after.order,
+                and_(Task.order == after.order, Task.id > after.id),
+            ),
+        )
+        .order_by(Task.order, Task.id)
+        .limit(1)
+    )
+
+
+def _preceding_order(db: Session, task: Task, before: Task) -> Optional[float]:
+    # Order of the card directly above ``before``, honouring the id tie-break.
+    return db.scalar(
+        select(Task.order)
+        .where(
+            *_column_filter(before.project_id, before.status, task.id),
+            or_(
+                Task.order < before.order,
+                and_(Task.order == before.order, Task.id < before.id),
+            ),
+        )
+        .order_by(Task.order.desc(), Task.id.desc())
+        .limit(1)
+    )
+
+
+def _card_below(db: Session, task: Task, after: Task) -> Optional[int]:
+    # ID of the card directly below ``after`` in its column, unordered cards last.
+    if after.order is None:
+        below = and_(Task.order.is_(None), Task.id > after.id)
+    else:
+        below = or_(
+            Task.order > after.order,
+            and_(Task.order == after.order, Task.id > after.id),
+            Task.order.is_(None),
+        )
+    return db.scalar(
+        select(Task.id)
+        .where(*_column_filter(after.project_id, after.status, task.id), below)
+        .order_by(Task.order.is_(None), Task.order, Task.id)
+        .limit(1)
+    )
+
+
+def _check_neighbours(
+    db: Session,
+    task: Task,
+    status: TaskStatus,
+    after: Optional[Task],
+    before: Optional[Task],
+) -> None:
+    for neighbour in (after, before):
+        if neighbour is None:
+            continue
+        if neighbour.id == task.id:
+            raise InvalidMoveError("A task cannot be placed relative to itself")
+        if neighbour.project_id != task.project_id or neighbour.status != status:
+            raise InvalidMoveError("Neighbour task is not in the target column")
+    if after is not None and before is not None and _card_below(db, task, after) != before.id:
+        raise InvalidMoveError("after_id and before_id must be adjacent, after_id above before_id")
+
+
+def _renumber_column(
+    db: Session,
+    task: Task,
+    status: TaskStatus,
+    after: Optional[Task],
+    before: Optional[Task],
+) -> None:
+    """Rewrite the whole column with evenly spaced orders, ``task`` in place."""
+    column: List[Task] = (
+        db.query(Task)
+        .filter(*_column_filter(task.project_id, status, task.id))
+        .order_by(Task.order.is_(None), Task.order, Task.id)
+        .all()
+    )
+    if after is not None:
+        position = column.index(after) + 1
+    elif before is not None:
+        position = column.index(before)
+    else:
+        position = len(column)
+    column.insert(position, task)
+    for index, item in enumerate(column, start=1):
+        item.order = index * ORDER_STEP
+
+
+def place_task(
+    db: Session,
+    task: Task,
+    status: TaskStatus,
+    after: Optional[Task] = None,
+    before: Optional[Task] = None,
+) -> None:
+    """
+    Move ``task`` into ``status`` between ``after`` (above) and ``before`` (below).
+
+    With neither neighbour the task goes to the end of the column. Neighbours
+    must already be in the target column and, when both are given, directly
+    follow each other.
+
+    Args:
+        db (Session): Database session.
+        task (Task): The task being moved.
+        status (TaskStatus): Target column.
+        after (Task | None): Card that should end up directly above ``task``.
+        before (Task | None): Card that should end up directly below ``task``.
+
+    Raises:
+        InvalidMoveError: If a neighbour is in another column, or ``after``
+            and ``before`` are swapped or not adjacent.
+    """
+    _check_neighbours(db, task, status, after, before)
+    task.status = status
+
+    if after is None and before is None:
+        task.order = next_order(db, task.project_id, status, exclude_id=task.id)
+        return
+
+    if (after is not None and after.order is None) or (before is not None and before.order is None):
+        _renumber_column(db, task, status, after, before)
+        return
+
+    if after is not None:
+        lower = after.order
+        upper = before.order if before is not None else _following_order(db, task, after)
+    else:
+        upper = before.order
+        lower = _preceding_order(db, task, before)
+
+    if lower is None:
+        task.order = upper - ORDER_STEP
+    elif upper is None:
+        task.order = lower + ORDER_STEP
+    elif upper - lower > MIN_ORDER_GAP:
+        task.order = (lower + upper) / 2
+    else:
+        _renumber_column(db, task, status, after, before)
@@ -0,0 +1,50 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.tombstone import Tombstone
+
+TASK = "task"
+COMMENT = "comment"
+
+
+def retention_cutoff(now: Optional[datetime] = None) -> datetime:
+    """Oldest moment whose deletes are still recorded (naive UTC)."""
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    return now - timedelta(days=settings.TOMBSTONE_RETENTION_DAYS)
+
+
+def record_deletions(db: Session, project_id: int, kind: str, record_ids: Iterable[int]) -> None:
+    """
+    Leave tombstones for deleted rows in the caller's transaction.
+
+    One multi-row INSERT however many rows were deleted.
+
+    Args:
+        db (Session): Database session.
+        project_id (int): Project the rows belonged to.
+        kind (str): ``task`` or ``comment``.
+        record_ids (Iterable[int]): IDs of the deleted rows.
+    """
+    rows = [{"project_id": project_id, "kind": kind, "record_id": record_id} for record_id in record_ids]
+    if rows:
+        db.execute(insert(Tombstone), rows)
+
+
+def purge_tombstones(db: Session, before: Optional[datetime] = None) -> int:
+    """
+    Delete tombstones older than the retention window.
+
+    Args:
+        db (Session): Database session.
+        before (datetime | None): Cutoff; defaults to ``retention_cutoff()``.
+
+    Returns:
+        int: Number of tombstones removed.
+    """
+    result = db.execute(delete(Tombstone).where(Tombstone.deleted_at < (before or retention_cutoff())))
+    db.commit()
+    return result.rowcount
@@ -1,7 +1,12 @@
+from typing import Optional
+
 from app.models.user import User
 from app.schemas.user import UserCreate
-from sqlalchemy.orm import Session
-from app.utils.security import hash_password
+from sqlalchemy.orm import Session, raiseload
+from app.utils.pagination import PageParams, paginate
+
+def get_user_by_id(db: Session, user_id: int):
+    return db.query(User).filter(User.id == user_id).first()
 
 def get_user_by_email(db: Session, email: str):
     return db.query(User).filter(User.email == email).first()
@@ -9,16 +14,26 @@ def get_user_by_email(db: Session, email: str):
 def get_user_by_username(db: Session, username: str):
     return db.query(User).filter(User.username == username).first()
 
-def create_user(db: Session, user: UserCreate):
+def create_user(db: Session, user: UserCreate, hashed_password: str):
     db_user = User(
         username=user.username,
         email=user.email,
-        hashed_password=hash_password(user.password),
+        hashed_password=hashed_password,
     )
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
     return db_user
 
-def get_users(db: Session):
-    return db.query(User).order_by(User.username.asc()).all()
+def update_password_hash(db: Session, user: User, hashed_password: str):
+    user.hashed_password = hashed_password
+    db.commit()
+    return user
+
+def get_users(db: Session, page: Optional[PageParams] = None):
+    return paginate(
+        db.query(User).options(raiseload("*")),
+        order_by=[User.username, User.id],
+        key=lambda user: (user.username, user.id),
+        page=page,
+    )
@@ -1,16 +1,31 @@
-from app.dependencies.db import get_db
+from app.dependencies.db import DbSession, get_db, run_db
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jose import ExpiredSignatureError, JWTError, jwt
 
+from app.crud.user import get_user_by_id
 from app.models import User
 from app.core.auth import settings
+from app.core.metrics import auth_token_failures_total
+from app.core.user_cache import user_cache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+async def get_current_user(token: str = Depends(oauth2_scheme), db: DbSession = Depends(get_db)) -> User:
+    return await user_from_token(token, db)
+
+
+async def user_from_token(token: str, db: DbSession) -> User:
+    """
+    Resolve a bearer token to an active user.
+
+    Shared by the HTTP dependency and the WebSocket endpoints, which receive
+    the token as a query parameter because browsers cannot set headers there.
+
+    Raises:
+        HTTPException: 401 when the token is invalid or the user is inactive.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials.",
@@ -19,14 +34,22 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
 
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+        user_id = int(payload.get("sub"))
+    except ExpiredSignatureError:
+        auth_token_failures_total.inc(reason="expired")
+        raise credentials_exception
+    except (JWTError, TypeError, ValueError):
+        auth_token_failures_total.inc(reason="invalid")
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    user = user_cache.get(user_id)
+    if user is not None:
+        return user
+
+    user = await run_db(db, get_user_by_id, user_id)
+    if user is None or not user.is_active:
+        auth_token_failures_total.inc(reason="unknown_user")
         raise credentials_exception
 
+    user_cache.set(user)
     return user
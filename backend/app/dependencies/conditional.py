@@ -0,0 +1,44 @@
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+ETAG_HEADER = "ETag"
+
+# Lists are per user, so browsers must revalidate and never share entries.
+CACHE_HEADERS = {"Cache-Control": "private, no-cache", "Vary": "Authorization"}
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from a list's version (e.g. row count and newest ``updated_at``).
+
+    Include everything that changes the body: the version, the requesting
+    user and the page parameters.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Whether ``If-None-Match`` already names ``etag`` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return _opaque(etag) in {_opaque(tag) for tag in header.split(",")}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={ETAG_HEADER: etag, **CACHE_HEADERS})
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers[ETAG_HEADER] = etag
+    response.headers.update(CACHE_HEADERS)
@@ -1,15 +1,84 @@
-from app.database import SessionLocal
+from typing import Any, Callable, TypeVar, Union
 
+from fastapi import Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-def get_db():
+from app import database
+from app.core.profiling import track_thread
+from app.core.read_your_writes import is_primary_sticky
+
+T = TypeVar("T")
+
+DbSession = Union[Session, AsyncSession]
+
+
+async def get_db():
     """
     Dependency that provides a database session for each request.
-    
+
+    Yields an ``AsyncSession`` when ``DATABASE_ASYNC`` is enabled, otherwise a
+    regular ``Session``. Use ``run_db`` to call CRUD functions with either.
+
     Yields:
-        Session: A SQLAlchemy database session.
+        DbSession: A SQLAlchemy database session.
     """
-    db = SessionLocal()
+    if database.AsyncSessionLocal is not None:
+        async with database.AsyncSessionLocal() as db:
+            yield db
+        return
+
+    db = database.SessionLocal()
     try:
         yield db
     finally:
-        db.close()
+        await run_in_threadpool(db.close)
+
+
+async def get_read_db(request: Request, db: DbSession = Depends(get_db)):
+    """
+    Dependency for read-only routes: a session on the read replica.
+
+    Falls back to the primary session from ``get_db`` when no replica is
+    configured, or when the client wrote within ``READ_YOUR_WRITES_SECONDS``
+    (see ``app.core.read_your_writes``). The primary session is created
+    either way but never checks out a connection unless it is used.
+
+    Yields:
+        DbSession: A replica or primary session.
+    """
+    if database.ReadSessionLocal is None or is_primary_sticky(request):
+        yield db
+        return
+
+    if database.AsyncReadSessionLocal is not None:
+        async with database.AsyncReadSessionLocal() as read_db:
+            yield read_db
+        return
+
+    read_db = database.ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        await run_in_threadpool(read_db.close)
+
+
+async def run_db(db: DbSession, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a sync CRUD function without blocking the event loop.
+
+    With an ``AsyncSession`` the function runs through ``run_sync`` on the
+    async driver, so no threadpool worker is held while waiting on the
+    database. With a sync ``Session`` it falls back to the threadpool.
+
+    Args:
+        db (DbSession): Session yielded by ``get_db``.
+        fn (Callable): CRUD function taking a ``Session`` as first argument.
+
+    Returns:
+        The return value of ``fn``.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(track_thread(fn), db, *args, **kwargs)
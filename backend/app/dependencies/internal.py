@@ -0,0 +1,27 @@
+import secrets
+from typing import Optional
+
+from fastapi import Header, HTTPException, status
+
+from app.core.config import settings
+
+
+def is_internal_token_valid(token: Optional[str]) -> bool:
+    """Whether ``token`` matches ``INTERNAL_API_TOKEN`` (never true when none is configured)."""
+    expected = settings.INTERNAL_API_TOKEN
+    if not expected:
+        return False
+    return bool(token) and secrets.compare_digest(token, expected)
+
+
+def verify_internal_token(x_internal_token: Optional[str] = Header(default=None)) -> None:
+    """
+    Guard for operational endpoints under ``/internal`` and ``/metrics``.
+
+    Requests must send ``INTERNAL_API_TOKEN`` in the ``X-Internal-Token``
+    header. Without a configured token the endpoints are closed.
+    """
+    if not settings.INTERNAL_API_TOKEN:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Internal endpoints are disabled")
+    if not is_internal_token_valid(x_internal_token):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid internal token")
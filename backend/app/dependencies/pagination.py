@@ -0,0 +1,36 @@
+from typing import List, Optional, TypeVar
+
+from fastapi import Query, Response
+
+from app.utils.pagination import MAX_PAGE_SIZE, Page, PageParams
+
+T = TypeVar("T")
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def get_page_params(
+    limit: Optional[int] = Query(
+        None,
+        ge=1,
+        le=MAX_PAGE_SIZE,
+        description="Page size. Omit to receive the full list.",
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description=f"Opaque cursor from the previous page's {NEXT_CURSOR_HEADER} header.",
+    ),
+) -> PageParams:
+    return PageParams(limit=limit, cursor=cursor)
+
+
+def page_response(response: Response, page: Page[T]) -> List[T]:
+    """
+    Return the page's items as the body and advertise the next cursor.
+
+    The body stays a plain list so clients that never pass ``limit`` are
+    unaffected; the next cursor travels in the ``X-Next-Cursor`` header.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
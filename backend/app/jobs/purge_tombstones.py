@@ -0,0 +1,27 @@
+"""
+Delete tombstones older than TOMBSTONE_RETENTION_DAYS.
+
+Run daily (e.g. from cron) with ``python -m app.jobs.purge_tombstones``.
+Clients whose delta-sync cursor predates the retention window are told to
+reload the whole project, so nothing is lost by purging.
+"""
+import argparse
+import sys
+
+from app.crud.tombstones import purge_tombstones
+from app.database import SessionLocal
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args(argv)
+
+    with SessionLocal() as db:
+        removed = purge_tombstones(db)
+
+    print(f"{removed} tombstone(s) purged", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+"""
+Recompute per-project task counters and report drift.
+
+Run periodically (e.g. from cron) with ``python -m app.jobs.reconcile_counters``;
+pass ``--dry-run`` to report without writing. Exits with status 1 when drift
+was found so schedulers can alert on it.
+"""
+import argparse
+import json
+import sys
+
+from app.crud.counters import reconcile_counters
+from app.database import SessionLocal
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true", help="report drift without fixing it")
+    args = parser.parse_args(argv)
+
+    with SessionLocal() as db:
+        drift = reconcile_counters(db, fix=not args.dry_run)
+
+    for entry in drift:
+        print(json.dumps(entry))
+    print(f"{len(drift)} project(s) drifted", file=sys.stderr)
+    return 1 if drift else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,6 +2,10 @@ from .user import User
 from .project import Project
 from .task import Task
 from .comment import Comment
+from .project_member import ProjectMember
+from .project_task_counter import ProjectTaskCounter
+from .tombstone import Tombstone
 from .base import Base
+from . import search  # noqa: F401  (registers full-text search DDL)
 
-__all__ = ["User", "Project", "Task", "Comment", "Base"]
+__all__ = ["User", "Project", "Task", "Comment", "ProjectMember", "ProjectTaskCounter", "Tombstone", "Base"]
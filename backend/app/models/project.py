@@ -1,9 +1,9 @@
 from __future__ import annotations
 from datetime import datetime, timezone
 from enum import Enum
-from sqlalchemy import ForeignKey, String
+from sqlalchemy import ForeignKey, Index, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from typing import List
+from typing import List, Optional
 from app.models.base import Base
 
 class ProjectStatus(str, Enum):
@@ -19,6 +19,11 @@ class ProjectPriority(str, Enum):
 
 class Project(Base):
     __tablename__ = 'projects'
+    __table_args__ = (
+        Index("ix_projects_owner_id", "owner_id"),
+        # Project list order: due date (NULLS LAST, the btree default), then creation time.
+        Index("ix_projects_due_date_created_at", "due_date", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str]
@@ -50,6 +55,12 @@ class Project(Base):
     comments: Mapped[List["Comment"]] = relationship(
         back_populates="project", cascade="all, delete-orphan"
     )
+    members: Mapped[List["ProjectMember"]] = relationship(
+        cascade="all, delete-orphan"
+    )
+    task_counter: Mapped[Optional["ProjectTaskCounter"]] = relationship(
+        cascade="all, delete-orphan"
+    )
 
     def __repr__(self):
         return f"<Project(id={self.id}, name='{self.name}', owner_id={self.owner_id}, status='{self.status}', priority='{self.priority}')>"
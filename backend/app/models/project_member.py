@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ProjectMember(Base):
+    """
+    Access index: one row per user who may see a project.
+
+    Members are the project owner plus every user assigned to at least one of
+    its tasks. Rows are maintained by the CRUD layer (see
+    ``app.crud.membership``) so access checks are a primary-key lookup.
+    """
+
+    __tablename__ = "project_members"
+    __table_args__ = (
+        Index("ix_project_members_user_project", "user_id", "project_id"),
+    )
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<ProjectMember(project_id={self.project_id}, user_id={self.user_id})>"
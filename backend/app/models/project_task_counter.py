@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class ProjectTaskCounter(Base):
+    """
+    Denormalized per-project task counts, one row per project.
+
+    Kept in step with ``tasks`` by the CRUD layer (see ``app.crud.counters``)
+    in the same transaction as each task change, so dashboards read one row
+    per project instead of scanning tasks. ``reconcile_counters`` recomputes
+    them from ``tasks`` and reports any drift. Overdue counts depend on the
+    clock and are therefore computed at read time, not stored.
+    """
+
+    __tablename__ = "project_task_counters"
+
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+    todo: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    in_progress: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    done: Mapped[int] = mapped_column(default=0, server_default="0", nullable=False)
+    last_activity_at: Mapped[Optional[datetime]] = mapped_column(nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProjectTaskCounter(project_id={self.project_id}, todo={self.todo}, "
+            f"in_progress={self.in_progress}, done={self.done})>"
+        )
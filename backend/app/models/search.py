@@ -0,0 +1,91 @@
+"""
+Full-text search indexes kept outside the ORM models.
+
+PostgreSQL gets a generated ``search_vector tsvector`` column with a GIN
+index on each searchable table (created by migration 3e8b6f1c9d20, or here
+when the schema is built with ``create_all``). SQLite, used by the tests,
+gets FTS5 external-content tables kept in sync by triggers. Neither is
+mapped on the models, so the ORM never reads or writes them.
+"""
+from typing import Dict, List, Tuple
+
+from sqlalchemy import event, text
+
+from app.models.base import Base
+
+TS_CONFIG = "english"
+
+# Table -> searchable columns, most important first (ranked higher on PostgreSQL).
+SEARCH_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "projects": ("name", "description"),
+    "tasks": ("title", "description"),
+    "comments": ("body",),
+}
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+
+
+def fts_table(table: str) -> str:
+    return f"{table}_fts"
+
+
+def postgres_search_vector(columns: Tuple[str, ...]) -> str:
+    """``tsvector`` expression weighting each column A, B, ... in order."""
+    return " || ".join(
+        f"setweight(to_tsvector('{TS_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in zip(columns, "ABCD")
+    )
+
+
+def postgres_search_ddl() -> List[str]:
+    statements = []
+    for table, columns in SEARCH_COLUMNS.items():
+        statements += [
+            f"ALTER TABLE {table} ADD COLUMN IF NOT EXISTS {SEARCH_VECTOR_COLUMN} tsvector "
+            f"GENERATED ALWAYS AS ({postgres_search_vector(columns)}) STORED",
+            f"CREATE INDEX IF NOT EXISTS ix_{table}_{SEARCH_VECTOR_COLUMN} "
+            f"ON {table} USING GIN ({SEARCH_VECTOR_COLUMN})",
+        ]
+    return statements
+
+
+def sqlite_search_ddl() -> List[str]:
+    statements = []
+    for table, columns in SEARCH_COLUMNS.items():
+        fts = fts_table(table)
+        cols = ", ".join(columns)
+        new = ", ".join(f"new.{c}" for c in columns)
+        old = ", ".join(f"old.{c}" for c in columns)
+        statements += [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} "
+            f"USING fts5({cols}, content='{table}', content_rowid='id')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.id, {new}); END",
+            f"INSERT INTO {fts}({fts}) VALUES ('rebuild')",
+        ]
+    return statements
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_indexes(target, connection, **kw):
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        statements = postgres_search_ddl()
+    elif dialect == "sqlite":
+        statements = sqlite_search_ddl()
+    else:
+        return
+    for statement in statements:
+        connection.execute(text(statement))
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _drop_search_indexes(target, connection, **kw):
+    if connection.dialect.name == "sqlite":
+        for table in SEARCH_COLUMNS:
+            connection.execute(text(f"DROP TABLE IF EXISTS {fts_table(table)}"))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import String, ForeignKey, DateTime
+from sqlalchemy import String, ForeignKey, DateTime, Float, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.models.base import Base
 from enum import Enum
@@ -18,6 +18,14 @@ class TaskPriority(str, Enum):
 
 class Task(Base):
     __tablename__ = 'tasks'
+    __table_args__ = (
+        # Kanban board: tasks of a project grouped by column, in card order.
+        # Also serves every plain ``project_id`` lookup via its prefix.
+        Index("ix_tasks_project_status_order", "project_id", "status", "order"),
+        Index("ix_tasks_assignee_project", "assignee_id", "project_id"),
+        # Delta sync: tasks of a project changed since a cursor.
+        Index("ix_tasks_project_updated_at", "project_id", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str]
@@ -31,7 +39,8 @@ class Task(Base):
     due_date: Mapped[datetime] = mapped_column(
         DateTime, nullable=True
     )
-    order: Mapped[Optional[int]] = mapped_column(nullable=True)
+    # Fractional position within the status column (see app.crud.task_order).
+    order: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=lambda: datetime.now(timezone.utc)
     )
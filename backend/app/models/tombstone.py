@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class Tombstone(Base):
+    """
+    Record of a deleted task or comment, kept so delta sync can report it.
+
+    ``GET /projects/{id}/changes`` reads tombstones newer than the client's
+    cursor. They are purged after ``TOMBSTONE_RETENTION_DAYS``; older cursors
+    are rejected and the client reloads the project instead.
+    """
+
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_project_deleted_at", "project_id", "deleted_at"),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    project_id: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    # "task" or "comment"
+    kind: Mapped[str] = mapped_column(String(16), nullable=False)
+    record_id: Mapped[int] = mapped_column(nullable=False)
+    deleted_at: Mapped[datetime] = mapped_column(
+        default=lambda: datetime.now(timezone.utc), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"<Tombstone(kind={self.kind!r}, record_id={self.record_id}, project_id={self.project_id})>"
@@ -1,30 +1,36 @@
 from app.dependencies.auth import get_current_user
-from app.dependencies.db import get_db
+from app.dependencies.db import DbSession, get_db, run_db
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 
+from app.crud.user import get_user_by_username, update_password_hash
 from app.models import User
 from app.schemas import Token
 from app.core import auth
+from app.core.password_hasher import password_hasher
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.username == form_data.username).first()
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: DbSession = Depends(get_db)):
+    user = await run_db(db, get_user_by_username, form_data.username)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    if not auth.verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = await password_hasher.verify_and_update(form_data.password, user.hashed_password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+    if new_hash:
+        # Stored hash predates the current BCRYPT_ROUNDS; upgrade it transparently.
+        await run_db(db, update_password_hash, user, new_hash)
+
     access_token = auth.create_access_token(data={"sub": str(user.id)})
 
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/protected")
-def read_protected_data(current_user: User = Depends(get_current_user)):
-    return {"message": f"Hello, {current_user.username}!"}
\ No newline at end of file
+async def read_protected_data(current_user: User = Depends(get_current_user)):
+    return {"message": f"Hello, {current_user.username}!"}
@@ -1,25 +1,37 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from app.crud import comment as crud
 from app.dependencies.auth import get_current_user
-from app.dependencies.db import get_db
+from app.dependencies.conditional import is_not_modified, make_etag, not_modified, set_etag
+from app.dependencies.db import DbSession, get_db, get_read_db, run_db
+from app.dependencies.pagination import get_page_params, page_response
 from app.models import User
 from app.schemas.comment import CommentCreate, CommentRead, CommentUpdate
+from app.utils.pagination import PageParams
+from app.utils.serialization import json_response
 
 router = APIRouter(prefix="/projects/{project_id}/comments", tags=["Comments"])
 
 
 @router.get("/", response_model=List[CommentRead])
-def list_project_comments(
+async def list_project_comments(
     project_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db: DbSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
-        return crud.list_comments_for_project(db, project_id, current_user)
+        version = await run_db(db, crud.get_comment_list_version, project_id, current_user)
+        etag = make_etag("comments", project_id, current_user.id, version, page.limit, page.cursor)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+        comments = await run_db(db, crud.list_comments_for_project, project_id, current_user, page)
+        set_etag(response, etag)
+        return json_response(List[CommentRead], page_response(response, comments), response)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except PermissionError as exc:
@@ -27,14 +39,14 @@ def list_project_comments(
 
 
 @router.post("/", response_model=CommentRead, status_code=status.HTTP_201_CREATED)
-def create_project_comment(
+async def create_project_comment(
     project_id: int,
     comment: CommentCreate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
-        return crud.create_comment(db, project_id, comment, current_user)
+        return await run_db(db, crud.create_comment, project_id, comment, current_user)
     except ValueError as exc:
         status_code = (
             status.HTTP_400_BAD_REQUEST
@@ -47,15 +59,15 @@ def create_project_comment(
 
 
 @router.patch("/{comment_id}", response_model=CommentRead)
-def update_project_comment(
+async def update_project_comment(
     project_id: int,
     comment_id: int,
     comment_update: CommentUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
-        return crud.update_comment(db, project_id, comment_id, comment_update, current_user)
+        return await run_db(db, crud.update_comment, project_id, comment_id, comment_update, current_user)
     except ValueError as exc:
         status_code = (
             status.HTTP_400_BAD_REQUEST
@@ -68,14 +80,14 @@ def update_project_comment(
 
 
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project_comment(
+async def delete_project_comment(
     project_id: int,
     comment_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     try:
-        crud.delete_comment(db, project_id, comment_id, current_user)
+        await run_db(db, crud.delete_comment, project_id, comment_id, current_user)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except PermissionError as exc:
@@ -0,0 +1,74 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, Response
+
+from app import database
+from app.core import profiling
+from app.core.password_hasher import password_hasher
+from app.crud.counters import reconcile_counters
+from app.dependencies.db import DbSession, get_db, run_db
+from app.dependencies.internal import verify_internal_token
+
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    dependencies=[Depends(verify_internal_token)],
+)
+
+
+@router.get("/db/pool")
+async def read_pool_stats():
+    """
+    Connection pool checkout, wait and overflow counters per engine.
+    """
+    return database.pool_stats()
+
+
+@router.get("/auth/password-hashing")
+async def read_password_hashing_stats():
+    """
+    bcrypt worker pool queue time, run time and in-flight counts.
+    """
+    return password_hasher.stats()
+
+
+@router.post("/counters/reconcile")
+async def reconcile_project_counters(fix: bool = True, db: DbSession = Depends(get_db)):
+    """
+    Recompute per-project task counters from ``tasks`` and report drift.
+
+    Pass ``fix=false`` for a dry run that only reports.
+    """
+    drift = await run_db(db, reconcile_counters, fix)
+    return {"drifted": len(drift), "fixed": fix, "projects": drift}
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """
+    Stored request profiles, newest first (without their samples).
+    """
+    return await run_in_threadpool(profiling.profile_store.list)
+
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str, format: Literal["speedscope", "pstats"] = "speedscope"):
+    """
+    Download one profile as speedscope JSON (open at speedscope.app) or a
+    pstats file (``python -m pstats``, snakeviz).
+    """
+    profile = await run_in_threadpool(profiling.profile_store.load, profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    if format == "pstats":
+        return Response(
+            profiling.to_pstats(profile),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{profile_id}.pstats"'},
+        )
+    return JSONResponse(
+        profiling.to_speedscope(profile),
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.speedscope.json"'},
+    )
@@ -0,0 +1,64 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from app import database
+from app.core.metrics import CONTENT_TYPE, REGISTRY
+from app.core.password_hasher import password_hasher
+from app.dependencies.internal import verify_internal_token
+
+router = APIRouter(tags=["metrics"], dependencies=[Depends(verify_internal_token)])
+
+# Cumulative pool counters; the rest of ``PoolMetrics.snapshot`` are gauges.
+POOL_COUNTERS = {
+    "checkouts": "Connections checked out of the pool.",
+    "checkins": "Connections returned to the pool.",
+    "connects": "New DBAPI connections opened.",
+    "invalidations": "Connections invalidated after errors.",
+    "timeouts": "Checkouts that gave up waiting for a connection.",
+    "overflow_checkouts": "Checkouts served by an overflow connection.",
+    "wait_seconds": "Time spent waiting for a connection.",
+}
+POOL_GAUGES = {
+    "wait_seconds_max": "Longest wait for a connection so far.",
+    "size": "Configured pool size.",
+    "checked_in": "Idle connections in the pool.",
+    "checked_out": "Connections currently in use.",
+    "overflow": "Overflow connections currently open.",
+}
+
+
+def collect_pool_stats():
+    stats = database.pool_stats()
+    for key, documentation in POOL_COUNTERS.items():
+        field = "wait_seconds_total" if key == "wait_seconds" else key
+        yield (
+            f"db_pool_{key}_total",
+            "counter",
+            documentation,
+            [({"engine": engine}, data[field]) for engine, data in stats.items() if field in data],
+        )
+    for key, documentation in POOL_GAUGES.items():
+        yield (
+            f"db_pool_{key}",
+            "gauge",
+            documentation,
+            [({"engine": engine}, data[key]) for engine, data in stats.items() if key in data],
+        )
+
+
+def collect_password_hasher_stats():
+    stats = password_hasher.stats()
+    yield "password_hash_in_flight", "gauge", "bcrypt jobs currently running.", [({}, stats["in_flight"])]
+    yield "password_hash_workers", "gauge", "bcrypt worker processes (0 = threadpool).", [({}, stats["workers"])]
+
+
+REGISTRY.register_collector(collect_pool_stats)
+REGISTRY.register_collector(collect_password_hasher_stats)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def read_metrics():
+    """
+    Request, auth and database pool metrics in the Prometheus text format.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -1,65 +1,172 @@
-from app.dependencies.db import get_db
-from app.schemas.project import ProjectRead, ProjectCreate, ProjectUpdate
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from app.dependencies.db import DbSession, get_db, get_read_db, run_db
+from app.schemas.project import (
+    ProjectCreate,
+    ProjectChanges,
+    ProjectFull,
+    ProjectRead,
+    ProjectStats,
+    ProjectTaskStats,
+    ProjectUpdate,
+)
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from typing import List, Optional
 
 from app.models import User
+from app.models.project import ProjectPriority, ProjectStatus
 from app.dependencies.auth import get_current_user
+from app.dependencies.conditional import is_not_modified, make_etag, not_modified, set_etag
+from app.dependencies.pagination import get_page_params, page_response
+from app.utils.pagination import PageParams
+from app.utils.serialization import json_response
 from app.crud import project as crud
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
 
 @router.post("/", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
-def create_project(
+async def create_project(
     project: ProjectCreate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return crud.create_project(db, project, current_user.id)
+    return await run_db(db, crud.create_project, project, current_user.id)
+
+
+def get_project_filters(
+    status: Optional[ProjectStatus] = Query(None, description="Only projects in this status."),
+    priority: Optional[ProjectPriority] = Query(None, description="Only projects with this priority."),
+    archived: Optional[bool] = Query(None, description="Only archived (true) or unarchived (false) projects."),
+    due_before: Optional[datetime] = Query(None, description="Only projects due before this time."),
+) -> crud.ProjectFilters:
+    return crud.ProjectFilters(status=status, priority=priority, archived=archived, due_before=due_before)
 
 
 @router.get("/", response_model=List[ProjectRead])
-def read_projects(
-    db: Session = Depends(get_db),
+async def read_projects(
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    filters: crud.ProjectFilters = Depends(get_project_filters),
+    db: DbSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Retrieve projects for the current user; pass ``limit`` to page through them.
+
+    ``status``, ``priority``, ``archived`` and ``due_before`` filter in SQL.
+    Answers 304 when ``If-None-Match`` matches the list's ETag.
+    """
+    version = await run_db(db, crud.get_project_list_version, current_user.id)
+    etag = make_etag("projects", current_user.id, version, page.limit, page.cursor, filters)
+    if is_not_modified(request, etag):
+        return not_modified(etag)
+    projects = await run_db(db, crud.get_projects_by_user, current_user.id, page, filters)
+    set_etag(response, etag)
+    return json_response(List[ProjectRead], page_response(response, projects), response)
+
+
+@router.get("/stats", response_model=ProjectStats)
+async def read_project_stats(
+    db: DbSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Retrieve all projects for the current user.
+    Dashboard counters for the current user's projects, aggregated in SQL.
     """
-    return crud.get_projects_by_user(db, current_user.id)
+    return await run_db(db, crud.get_project_stats, current_user.id)
+
 
 @router.put("/{project_id}", response_model=ProjectRead)
-def update_project(
+async def update_project(
     project_id: int,
     project_update: ProjectUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    project = crud.update_project(db, project_id, project_update, current_user.id)
+    project = await run_db(db, crud.update_project, project_id, project_update, current_user.id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found or not authorized to update")
     return project
 
 
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_project(
+async def delete_project(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    success = crud.delete_project(db, project_id, current_user.id)
+    success = await run_db(db, crud.delete_project, project_id, current_user.id)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found or not authorized to delete")
 
 @router.get("/{project_id}", response_model=ProjectRead)
-def read_project_by_id(
+async def read_project_by_id(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
-    project = crud.get_project_by_id(db, project_id, current_user.id)
+    project = await run_db(db, crud.get_project_by_id, project_id, current_user.id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found or not authorized to view")
-    return project
\ No newline at end of file
+    return project
+
+
+@router.get("/{project_id}/full", response_model=ProjectFull)
+async def read_project_full(
+    project_id: int,
+    comments: int = Query(20, ge=0, le=100, description="Number of latest comments to include"),
+    db: DbSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Retrieve a project with its tasks, latest comments and task counts in one call.
+
+    Served from the primary, like ``/changes``: the returned sync cursor comes
+    from this server's clock, so the rows must not lag behind it on a replica.
+    """
+    full = await run_db(db, crud.get_project_full, project_id, current_user.id, comments)
+    if not full:
+        raise HTTPException(status_code=404, detail="Project not found or not authorized to view")
+    return json_response(ProjectFull, full)
+
+
+@router.get("/{project_id}/changes", response_model=ProjectChanges)
+async def read_project_changes(
+    project_id: int,
+    since: Optional[str] = Query(
+        None, description="Cursor from /full or the previous /changes call. Omit for everything."
+    ),
+    db: DbSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Tasks and comments created, updated or deleted since a cursor.
+
+    Returns 410 when the cursor is older than the delete history; reload
+    the project with ``/full`` in that case. Always reads the primary: a
+    replica lagging by more than the cursor's overlap would return rows
+    older than the new cursor and they would never be sent.
+    """
+    try:
+        changes = await run_db(db, crud.get_project_changes, project_id, current_user.id, since)
+    except crud.CursorExpiredError as exc:
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail=str(exc))
+    if changes is None:
+        raise HTTPException(status_code=404, detail="Project not found or not authorized to view")
+    return json_response(ProjectChanges, changes)
+
+
+@router.get("/{project_id}/stats", response_model=ProjectTaskStats)
+async def read_project_task_stats(
+    project_id: int,
+    db: DbSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Task counts per status (and overdue) for one project, aggregated in SQL.
+    """
+    stats = await run_db(db, crud.get_project_task_stats, project_id, current_user.id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Project not found or not authorized to view")
+    return stats
@@ -0,0 +1,76 @@
+import anyio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, WebSocketException, status
+from sqlalchemy.orm import Session
+
+from app.core.events import Subscription, broadcaster
+from app.crud.project import get_project_by_id
+from app.dependencies.auth import user_from_token
+from app.dependencies.db import DbSession, get_db, run_db
+
+router = APIRouter(prefix="/ws", tags=["realtime"])
+
+
+@router.websocket("/projects/{project_id}")
+async def project_events(
+    websocket: WebSocket,
+    project_id: int,
+    token: str = Query(..., description="Access token; browsers cannot send headers on WebSockets."),
+    db: DbSession = Depends(get_db),
+):
+    """
+    Push task and comment changes for one project as JSON messages.
+
+    Messages are ``{"type", "project_id", ...}`` with types ``tasks.updated``
+    (``tasks``: created, edited or moved tasks), ``tasks.deleted`` (``ids``),
+    ``comments.updated`` (``comments``), ``comments.deleted`` (``ids``) and
+    ``resync``, which asks the client to refetch the board because events
+    were dropped. Anything the client sends is ignored.
+    """
+    try:
+        user = await user_from_token(token, db)
+    except HTTPException:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason="Not authenticated")
+
+    project = await run_db(db, get_project_by_id, project_id, user.id)
+    # End the read transaction so the pooled connection is not held while
+    # the socket stays open.
+    await run_db(db, Session.rollback)
+    if project is None:
+        raise WebSocketException(
+            code=status.WS_1008_POLICY_VIOLATION,
+            reason="Project not found or not authorized to view",
+        )
+
+    # Subscribe before accepting so no change made after the handshake is missed.
+    subscription = broadcaster.subscribe(project_id)
+    try:
+        await websocket.accept()
+        async with anyio.create_task_group() as group:
+            async def run(fn, *args):
+                await fn(*args)
+                # Either side finishing (client gone) ends the other.
+                group.cancel_scope.cancel()
+
+            group.start_soon(run, _forward, websocket, subscription)
+            group.start_soon(run, _drain, websocket)
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+async def _forward(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        message = await subscription.get()
+        try:
+            await websocket.send_text(message)
+        except (WebSocketDisconnect, RuntimeError):
+            return
+
+
+async def _drain(websocket: WebSocket) -> None:
+    # Reading is how a closed connection is noticed.
+    try:
+        while True:
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        return
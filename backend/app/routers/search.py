@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query, Response
+
+from app.crud import search as crud
+from app.dependencies.auth import get_current_user
+from app.dependencies.db import DbSession, get_read_db, run_db
+from app.dependencies.pagination import NEXT_CURSOR_HEADER, page_response
+from app.models import User
+from app.schemas.search import SearchHit
+from app.utils.pagination import PageParams
+from app.utils.serialization import json_response
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+@router.get("", response_model=List[SearchHit])
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200, description="Words to search for"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None,
+        description=f"Opaque cursor from the previous page's {NEXT_CURSOR_HEADER} header.",
+    ),
+    db: DbSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Ranked full-text search across the caller's projects, tasks and comments.
+    """
+    hits = await run_db(db, crud.search, current_user.id, q, PageParams(limit=limit, cursor=cursor))
+    return json_response(List[SearchHit], page_response(response, hits), response)
@@ -1,86 +1,182 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from app.schemas.task import TaskCreate, TaskRead, TaskUpdate
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from app.schemas.task import (
+    TaskBulkCreate,
+    TaskBulkDelete,
+    TaskBulkResult,
+    TaskBulkUpdate,
+    TaskCreate,
+    TaskRead,
+    TaskReorder,
+    TaskUpdate,
+)
 from app.models import Task, User
-from app.dependencies.db import get_db
+from app.dependencies.db import DbSession, get_db, get_read_db, run_db
 from app.dependencies.auth import get_current_user
+from app.dependencies.conditional import is_not_modified, make_etag, not_modified, set_etag
+from app.dependencies.pagination import get_page_params, page_response
+from app.utils.pagination import PageParams
+from app.utils.serialization import json_response
 from app.crud import task as crud
 
 router = APIRouter(prefix="/project/{project_id}/tasks", tags=["tasks"])
 
 @router.post("/", response_model=TaskCreate, status_code=201)
-def create_task(
+async def create_task(
     project_id: int,
     task: TaskCreate, 
-    db: Session = Depends(get_db), 
+    db: DbSession = Depends(get_db), 
     current_user: User = Depends(get_current_user)
 ):
     try:
-        return crud.create_task(db, task, project_id, current_user)
+        return await run_db(db, crud.create_task, task, project_id, current_user)
+    except (ValueError, PermissionError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+@router.post("/reorder", response_model=List[TaskRead])
+async def reorder_tasks(
+    project_id: int,
+    reorder: TaskReorder,
+    db: DbSession = Depends(get_db), 
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Apply one or more Kanban moves (column and position) in one transaction.
+
+    Answers 400, applying none of the moves, when a move's neighbours are in
+    another column or are not adjacent in the given order.
+    """
+    try:
+        return await run_db(db, crud.reorder_tasks, project_id, reorder.moves, current_user)
+    except crud.InvalidMoveError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except (ValueError, PermissionError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+@router.post("/bulk", response_model=TaskBulkResult, status_code=201)
+async def bulk_create_tasks(
+    project_id: int,
+    bulk: TaskBulkCreate,
+    db: DbSession = Depends(get_db), 
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Create many tasks in one transaction; results follow the input order.
+    """
+    try:
+        results = await run_db(db, crud.bulk_create_tasks, project_id, bulk.items, current_user)
+        return {"results": results}
+    except (ValueError, PermissionError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+@router.patch("/bulk", response_model=TaskBulkResult)
+async def bulk_update_tasks(
+    project_id: int,
+    bulk: TaskBulkUpdate,
+    db: DbSession = Depends(get_db), 
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Partially update many tasks in one transaction; unknown IDs are reported as ``not_found``.
+    """
+    try:
+        results = await run_db(db, crud.bulk_update_tasks, project_id, bulk.items, current_user)
+        return {"results": results}
+    except (ValueError, PermissionError) as e:
+        raise HTTPException(status_code=403, detail=str(e))
+
+
+@router.delete("/bulk", response_model=TaskBulkResult)
+async def bulk_delete_tasks(
+    project_id: int,
+    bulk: TaskBulkDelete,
+    db: DbSession = Depends(get_db), 
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Delete many tasks with one statement; unknown IDs are reported as ``not_found``.
+    """
+    try:
+        results = await run_db(db, crud.bulk_delete_tasks, project_id, bulk.ids, current_user)
+        return {"results": results}
     except (ValueError, PermissionError) as e:
         raise HTTPException(status_code=403, detail=str(e))
 
 
 @router.get("/", response_model=List[TaskRead])
-def list_tasks(
+async def list_tasks(
     project_id: int,
-    db: Session = Depends(get_db), 
+    request: Request,
+    response: Response,
+    page: PageParams = Depends(get_page_params),
+    db: DbSession = Depends(get_read_db), 
     current_user: User = Depends(get_current_user)
 ):
+    """
+    List a project's tasks; answers 304 when ``If-None-Match`` matches the list's ETag.
+    """
     try:
-        return crud.get_tasks_for_project(db, project_id, current_user)
+        version = await run_db(db, crud.get_task_list_version, project_id, current_user)
+        etag = make_etag("tasks", project_id, current_user.id, version, page.limit, page.cursor)
+        if is_not_modified(request, etag):
+            return not_modified(etag)
+        tasks = await run_db(db, crud.get_tasks_for_project, project_id, current_user, page)
+        set_etag(response, etag)
+        return json_response(List[TaskRead], page_response(response, tasks), response)
     except (ValueError, PermissionError) as e:
         raise HTTPException(status_code=403, detail=str(e))
 
 
 @router.get("/{task_id}", response_model=TaskRead)
-def get_task(
+async def get_task(
     project_id: int,
     task_id: int, 
-    db: Session = Depends(get_db), 
+    db: DbSession = Depends(get_read_db), 
     current_user: User = Depends(get_current_user)
 ):
     try:
-        return crud.get_task_by_id(db, project_id, task_id, current_user)
+        return await run_db(db, crud.get_task_by_id, project_id, task_id, current_user)
     except (ValueError, PermissionError) as e:
         raise HTTPException(status_code=403, detail=str(e))
 
 
 @router.put("/{task_id}", response_model=TaskRead)
-def update_task(
+async def update_task(
     project_id: int,
     task_id: int, 
     task_update: TaskUpdate, 
-    db: Session = Depends(get_db), 
+    db: DbSession = Depends(get_db), 
     current_user: User = Depends(get_current_user)
 ):
     try:
-        return crud.update_task(db, project_id, task_id, task_update, current_user)
+        return await run_db(db, crud.update_task, project_id, task_id, task_update, current_user)
     except (ValueError, PermissionError) as e:
         raise HTTPException(status_code=403, detail=str(e))
 
 @router.patch("/{task_id}", response_model=TaskRead)
-def partial_update_task(
+async def partial_update_task(
     project_id: int,
     task_id: int, 
     task_update: TaskUpdate, 
-    db: Session = Depends(get_db), 
+    db: DbSession = Depends(get_db), 
     current_user: User = Depends(get_current_user)
 ):
     try:
-        return crud.partial_update_task(db, project_id, task_id, task_update, current_user)
+        return await run_db(db, crud.partial_update_task, project_id, task_id, task_update, current_user)
     except (ValueError, PermissionError) as e:
         raise HTTPException(status_code=403, detail=str(e))
 
 @router.delete("/{task_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_task(
+async def delete_task(
     project_id: int,
     task_id: int, 
-    db: Session = Depends(get_db), 
+    db: DbSession = Depends(get_db), 
     current_user: User = Depends(get_current_user)
 ):
     try:
-        crud.delete_task(db, project_id, task_id, current_user)
+        await run_db(db, crud.delete_task, project_id, task_id, current_user)
     except (ValueError, PermissionError) as e:
         raise HTTPException(status_code=403, detail=str(e))
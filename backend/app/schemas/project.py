@@ -1,7 +1,10 @@
 from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
 from app.models.project import ProjectStatus, ProjectPriority
+from app.models.task import TaskStatus
+from app.schemas.comment import CommentRead
+from app.schemas.task import TaskRead
 
 
 class ProjectBase(BaseModel):
@@ -36,3 +39,40 @@ class ProjectUpdate(BaseModel):
     priority: Optional[ProjectPriority] = None
     is_archived: bool = None
     owner_id: Optional[int] = None
+
+
+class ProjectStats(BaseModel):
+    total: int
+    active: int
+    completed: int
+    due_soon: int
+    tasks_todo: int
+    tasks_in_progress: int
+    tasks_done: int
+
+
+class ProjectTaskStats(BaseModel):
+    total: int
+    todo: int
+    in_progress: int
+    done: int
+    overdue: int
+
+
+class ProjectFull(BaseModel):
+    """Everything the project detail page needs, loaded in one request."""
+    project: ProjectRead
+    tasks: List[TaskRead]
+    comments: List[CommentRead]
+    task_counts: Dict[TaskStatus, int]
+    # Pass to /changes to fetch only what changed after this load.
+    cursor: str
+
+
+class ProjectChanges(BaseModel):
+    """Tasks and comments changed since a cursor, and the IDs deleted since."""
+    tasks: List[TaskRead]
+    comments: List[CommentRead]
+    deleted_task_ids: List[int]
+    deleted_comment_ids: List[int]
+    cursor: str
@@ -0,0 +1,12 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SearchHit(BaseModel):
+    kind: Literal["project", "task", "comment"]
+    id: int
+    project_id: int
+    title: str
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,16 +1,19 @@
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from typing import List, Literal, Optional
 from datetime import datetime
 
 from app.models.task import TaskPriority, TaskStatus
 
+BULK_MAX_ITEMS = 1000
+
 class TaskCreate(BaseModel):
     title: str
     description: str
-    status: Optional[TaskStatus] = TaskStatus.TODO
-    priority: Optional[TaskPriority] = TaskPriority.MEDIUM
+    # Omit to take the default; an explicit null is a 422, not a NULL column.
+    status: TaskStatus = TaskStatus.TODO
+    priority: TaskPriority = TaskPriority.MEDIUM
     due_date: Optional[datetime] = None
-    order: Optional[int] = None
+    order: Optional[float] = None
     assignee_id: Optional[int] = None
 
 class TaskUpdate(BaseModel):
@@ -19,9 +22,17 @@ class TaskUpdate(BaseModel):
     status: Optional[TaskStatus] = None
     priority: Optional[TaskPriority] = None
     due_date: Optional[datetime] = None
-    order: Optional[int] = None
+    order: Optional[float] = None
     assignee_id: Optional[int] = None
 
+    @field_validator("title", "description", "status", "priority")
+    @classmethod
+    def _not_null(cls, value):
+        # Omitted means "leave unchanged"; an explicit null would hit a NOT NULL column.
+        if value is None:
+            raise ValueError("may be omitted but not null")
+        return value
+
 class TaskRead(BaseModel):
     id: int
     title: str
@@ -29,9 +40,46 @@ class TaskRead(BaseModel):
     status: TaskStatus
     priority: TaskPriority
     due_date: Optional[datetime]
-    order: Optional[int]
+    order: Optional[float]
     created_at: datetime
     updated_at: datetime
     project_id: int
     assignee_id: Optional[int]
     model_config = ConfigDict(from_attributes=True)
+
+class TaskMove(BaseModel):
+    """Place one card in ``status`` directly below ``after_id`` and/or above ``before_id``."""
+    task_id: int
+    status: Optional[TaskStatus] = None
+    after_id: Optional[int] = None
+    before_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def _check_neighbours(self):
+        if self.task_id in (self.after_id, self.before_id):
+            raise ValueError("A task cannot be placed relative to itself")
+        return self
+
+class TaskReorder(BaseModel):
+    moves: List[TaskMove] = Field(..., min_length=1, max_length=200)
+
+class TaskBulkCreate(BaseModel):
+    items: List[TaskCreate] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkUpdateItem(TaskUpdate):
+    id: int
+
+class TaskBulkUpdate(BaseModel):
+    items: List[TaskBulkUpdateItem] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+class TaskBulkItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status: Literal["created", "updated", "deleted", "not_found"]
+    task: Optional[TaskRead] = None
+
+class TaskBulkResult(BaseModel):
+    results: List[TaskBulkItemResult]
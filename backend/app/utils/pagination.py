@@ -0,0 +1,203 @@
+import base64
+import binascii
+import enum
+import json
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+
+from sqlalchemy import and_, false, literal, or_
+from sqlalchemy.orm import Query
+
+T = TypeVar("T")
+
+MAX_PAGE_SIZE = 500
+
+
+class InvalidCursorError(Exception):
+    """Raised when a pagination cursor cannot be decoded or does not fit the listing."""
+
+
+@dataclass
+class PageParams:
+    """Requested page: ``limit=None`` returns the full list."""
+
+    limit: Optional[int] = None
+    cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class NullsLast:
+    """
+    Nullable sort column ordered ``ASC NULLS LAST``.
+
+    Lets the ``ORDER BY`` match a plain ascending index (PostgreSQL keeps
+    NULLs last in one), where the older ``c IS NULL, c`` pair needed an
+    expression index.
+    """
+
+    column: Any
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "d" in value:
+            return date.fromisoformat(value["d"])
+        raise InvalidCursorError("Invalid cursor")
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the sort key of the last returned row as an opaque cursor.
+
+    Args:
+        values (Sequence): Sort key values, in ``ORDER BY`` order.
+
+    Returns:
+        str: URL-safe cursor string.
+    """
+    payload = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list):
+            raise InvalidCursorError("Invalid cursor")
+        return [_decode_value(v) for v in values]
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise InvalidCursorError("Invalid cursor") from exc
+
+
+def _fits(column: Any, value: Any) -> bool:
+    """Whether a decoded cursor value can be bound against ``column``'s type."""
+    if value is None:
+        return True
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return isinstance(value, (str, int, float))
+    if python_type is bool:
+        return isinstance(value, bool)
+    if isinstance(value, bool):
+        return False
+    if python_type is int:
+        return isinstance(value, int) and -(2**63) <= value < 2**63
+    if python_type is float:
+        return isinstance(value, (int, float))
+    if python_type is datetime:
+        return isinstance(value, datetime)
+    if python_type is date:
+        return isinstance(value, date) and not isinstance(value, datetime)
+    if isinstance(python_type, type) and issubclass(python_type, enum.Enum):
+        return value in {member.value for member in python_type}
+    return isinstance(value, python_type)
+
+
+def _check_cursor(order_by: Sequence[Any], values: Sequence[Any]) -> None:
+    """
+    Reject cursors that do not match the listing's sort key.
+
+    A cursor is client input; checking each value against its column's type
+    turns a tampered cursor into ``InvalidCursorError`` (400) instead of a
+    database error.
+    """
+    if len(values) != len(order_by):
+        raise InvalidCursorError("Invalid cursor")
+    for column, value in zip(order_by, values):
+        if not _fits(column.column if isinstance(column, NullsLast) else column, value):
+            raise InvalidCursorError("Invalid cursor")
+
+
+def _after(columns: Sequence[Any], values: Sequence[Any]):
+    """
+    Build ``(c1, c2, ...) > (v1, v2, ...)`` for ascending sort columns.
+
+    Expanded into OR/AND form so NULL keys compare correctly on every
+    backend. NULLs sort last, either via a preceding ``IS NULL`` column or
+    a ``NullsLast`` column; rows after a non-NULL value include the NULLs.
+    """
+    nulls_last = [isinstance(c, NullsLast) for c in columns]
+    columns = [c.column if isinstance(c, NullsLast) else c for c in columns]
+    values = [None if v is None else literal(v, c.type) for c, v in zip(columns, values)]
+    clauses = []
+    for i, (column, value) in enumerate(zip(columns, values)):
+        equal_prefix = [
+            c.is_(None) if v is None else c == v
+            for c, v in zip(columns[:i], values[:i])
+        ]
+        if value is None:
+            greater = false()
+        elif nulls_last[i]:
+            greater = or_(column > value, column.is_(None))
+        else:
+            greater = column > value
+        clauses.append(and_(*equal_prefix, greater))
+    return or_(*clauses)
+
+
+def paginate(
+    query: Query,
+    order_by: Sequence[Any],
+    key: Callable[[T], Sequence[Any]],
+    page: Optional[PageParams] = None,
+) -> Page[T]:
+    """
+    Apply keyset pagination to a query.
+
+    Rows are ordered by ``order_by`` (ascending, ending in a unique column)
+    and the cursor holds the last row's key, so pages stay stable when rows
+    are inserted concurrently. Without a limit the full list is returned.
+
+    Args:
+        query (Query): Query selecting a single entity.
+        order_by (Sequence): Sort columns (or ``NullsLast`` wrappers); the last one must be unique.
+        key (Callable): Extracts the sort key values from a row.
+        page (PageParams | None): Requested limit and cursor.
+
+    Returns:
+        Page: The rows and, when more remain, the cursor for the next page.
+    """
+    page = page or PageParams()
+    query = query.order_by(
+        *(c.column.asc().nulls_last() if isinstance(c, NullsLast) else c for c in order_by)
+    )
+
+    if page.cursor:
+        values = decode_cursor(page.cursor)
+        _check_cursor(order_by, values)
+        query = query.filter(_after(order_by, values))
+
+    if page.limit is None:
+        return Page(items=query.all())
+
+    rows = query.limit(page.limit + 1).all()
+    if len(rows) <= page.limit:
+        return Page(items=rows)
+    items = rows[: page.limit]
+    return Page(items=items, next_cursor=encode_cursor(key(items[-1])))
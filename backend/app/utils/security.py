@@ -1,9 +1,25 @@
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.config import settings
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+)
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
\ No newline at end of file
+    return pwd_context.verify(plain_password, hashed_password)
+
+def verify_and_update_password(plain_password: str, hashed_password: str):
+    """
+    Verify a password and return a replacement hash if its parameters are outdated.
+
+    Returns:
+        tuple[bool, str | None]: Whether it matched, and a new hash when the
+        stored one uses a deprecated scheme or a different cost factor.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
@@ -0,0 +1,38 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=None)
+def adapter_for(model: Any) -> TypeAdapter:
+    """Cached ``TypeAdapter`` for a response type such as ``List[TaskRead]``."""
+    return TypeAdapter(model)
+
+
+def json_response(model: Any, content: Any, response: Optional[Response] = None, status_code: int = 200) -> Response:
+    """
+    Validate ``content`` against ``model`` and render it straight to JSON bytes.
+
+    Skips FastAPI's generic response path (validate, dump to Python objects,
+    then encode) in favour of pydantic-core's single validate + ``dump_json``.
+    Headers already set on the injected ``response`` (cursors, ETags) are kept.
+
+    Args:
+        model: Response type, e.g. ``List[TaskRead]``.
+        content: ORM objects or dicts to serialize.
+        response (Response | None): The endpoint's ``Response`` parameter.
+        status_code (int): HTTP status of the rendered response.
+
+    Returns:
+        Response: An ``application/json`` response.
+    """
+    adapter = adapter_for(model)
+    body = adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+    rendered = Response(content=body, status_code=status_code, media_type="application/json")
+    if response is not None:
+        for name, value in response.headers.items():
+            if name != "content-length":
+                rendered.headers.append(name, value)
+    return rendered
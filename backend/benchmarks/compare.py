@@ -0,0 +1,81 @@
+"""
+Compare two ``benchmarks.load`` result files.
+
+Usage (from backend/):
+
+    python -m benchmarks.compare base.json head.json [--threshold 0.10]
+
+Prints p50/p95/p99, requests per second and queries per request for every
+scenario and step. Exits with status 1 when a scenario's p95 grew by more
+than ``--threshold`` (a fraction), or when any scenario or step runs more
+queries per request than before.
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms", "rps", "queries_per_request")
+
+
+def _change(before: Optional[float], after: Optional[float]) -> str:
+    if before is None or after is None:
+        return "-"
+    if before == 0:
+        return "new" if after else "0%"
+    return f"{(after - before) / before:+.0%}"
+
+
+def compare(base: Dict[str, Any], head: Dict[str, Any], threshold: float) -> List[str]:
+    """Print the comparison table and return the regressions found."""
+    regressions = []
+    print(f"base: {base['meta'].get('commit')}  head: {head['meta'].get('commit')}")
+    print("head values, change from base in parentheses")
+    print(f"{'scenario / step':<30}" + "".join(f"{metric:>22}" for metric in METRICS))
+
+    def row(label: str, before: Dict[str, Any], after: Dict[str, Any]) -> None:
+        cells = []
+        for metric in METRICS:
+            old, new = before.get(metric), after.get(metric)
+            cells.append(f"{'-' if new is None else new} ({_change(old, new)})".rjust(22))
+        print(f"{label:<30}" + "".join(cells))
+
+        old_queries, new_queries = before.get("queries_per_request"), after.get("queries_per_request")
+        if old_queries is not None and new_queries is not None and new_queries > old_queries:
+            regressions.append(f"{label.strip()}: queries per request {old_queries} -> {new_queries}")
+
+    for name, after in head["scenarios"].items():
+        before = base["scenarios"].get(name)
+        if before is None:
+            print(f"{name:<30}(not in base)")
+            continue
+        row(name, before, after)
+        if before["p95_ms"] and after["p95_ms"] > before["p95_ms"] * (1 + threshold):
+            regressions.append(f"{name}: p95 {before['p95_ms']}ms -> {after['p95_ms']}ms")
+        for step, step_after in after["steps"].items():
+            step_before = before["steps"].get(step)
+            if step_before is not None:
+                row(f"  {step}", step_before, step_after)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two load benchmark results")
+    parser.add_argument("base")
+    parser.add_argument("head")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed p95 growth (fraction)")
+    args = parser.parse_args(argv)
+
+    with open(args.base, encoding="utf-8") as handle:
+        base = json.load(handle)
+    with open(args.head, encoding="utf-8") as handle:
+        head = json.load(handle)
+
+    regressions = compare(base, head, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
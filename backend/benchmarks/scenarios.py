@@ -0,0 +1,92 @@
+"""
+Scripted user journeys for the load benchmark.
+
+Each scenario is one iteration of one virtual user. Steps go through
+``Http``, which times them and labels them for the per-step report, and
+returns the decoded JSON body (None on an error status).
+"""
+import random
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Protocol
+
+# Password of every seeded user (see ``benchmarks.seed``).
+BENCH_PASSWORD = "benchpass"
+
+STATUSES = ("todo", "in_progress", "done")
+
+
+@dataclass
+class VirtualUser:
+    user_id: int
+    username: str
+    token: str
+    project_ids: List[int]
+    rng: random.Random = field(default_factory=random.Random)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+class Http(Protocol):
+    """What the runner hands to scenarios (see ``benchmarks.load.Recorder``)."""
+
+    async def request(self, step: str, method: str, url: str, **kwargs: Any) -> Optional[Any]:
+        ...
+
+
+Scenario = Callable[[Http, VirtualUser], Awaitable[None]]
+
+
+async def login_storm(http: Http, user: VirtualUser) -> None:
+    """Password logins: bcrypt cost and the hashing pool under load."""
+    await http.request(
+        "login",
+        "POST",
+        "/api/auth/login",
+        data={"username": user.username, "password": BENCH_PASSWORD},
+        authenticated=False,
+    )
+
+
+async def dashboard(http: Http, user: VirtualUser) -> None:
+    """The projects page: who am I, my projects and the summary counters."""
+    await http.request("me", "GET", "/api/users/me")
+    await http.request("projects", "GET", "/api/projects/")
+    await http.request("project stats", "GET", "/api/projects/stats")
+
+
+async def kanban_drag(http: Http, user: VirtualUser) -> None:
+    """Open a board and drag one card to another column."""
+    project_id = user.rng.choice(user.project_ids)
+    board = await http.request("board", "GET", f"/api/projects/{project_id}/full")
+    if not board or not board["tasks"]:
+        return
+    task = user.rng.choice(board["tasks"])
+    target = user.rng.choice([s for s in STATUSES if s != task["status"]])
+    await http.request(
+        "reorder",
+        "POST",
+        f"/api/project/{project_id}/tasks/reorder",
+        json={"moves": [{"task_id": task["id"], "status": target}]},
+    )
+
+
+async def comment_thread(http: Http, user: VirtualUser) -> None:
+    """Read a project's thread, post a comment and edit it."""
+    project_id = user.rng.choice(user.project_ids)
+    url = f"/api/projects/{project_id}/comments/"
+    await http.request("comments", "GET", url, params={"limit": 50})
+    created = await http.request("post comment", "POST", url, json={"body": "Benchmark comment"})
+    if created:
+        await http.request(
+            "edit comment", "PATCH", f"{url}{created['id']}", json={"body": "Benchmark comment (edited)"}
+        )
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login": login_storm,
+    "dashboard": dashboard,
+    "kanban": kanban_drag,
+    "comments": comment_thread,
+}
@@ -0,0 +1,192 @@
+"""
+Seed a database with synthetic users, projects, tasks and comments.
+
+Usage (from backend/, against ``DATABASE_URL``):
+
+    python -m benchmarks.seed --users 50 --projects 3 --tasks 40 --comments 15
+
+The same ``--seed`` always produces the same data shape. Usernames are
+``<prefix>_<n>``, so seed a fresh database or pick a new ``--prefix``.
+Every user's password is ``BENCH_PASSWORD``.
+"""
+import argparse
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.crud.counters import reconcile_counters
+from app.models.comment import Comment
+from app.models.project import Project, ProjectPriority, ProjectStatus
+from app.models.project_member import ProjectMember
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.user import User
+from app.utils.security import hash_password
+from benchmarks.scenarios import BENCH_PASSWORD
+
+WORDS = (
+    "api billing cache dashboard deploy export import invoice kanban login "
+    "metrics migration onboarding pipeline report search settings sync webhook"
+).split()
+
+
+@dataclass
+class Dataset:
+    """What the scenarios need to know about the seeded data."""
+
+    users: List[Tuple[int, str]] = field(default_factory=list)
+    # Owned projects per user; reorder and task writes require ownership.
+    projects_by_owner: Dict[int, List[int]] = field(default_factory=dict)
+
+    @property
+    def project_count(self) -> int:
+        return sum(len(ids) for ids in self.projects_by_owner.values())
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+def _insert_ids(db: Session, model, rows: List[dict]) -> List[int]:
+    if not rows:
+        return []
+    return list(db.scalars(insert(model).returning(model.id, sort_by_parameter_order=True), rows))
+
+
+def seed(
+    db: Session,
+    users: int = 20,
+    projects_per_user: int = 3,
+    tasks_per_project: int = 30,
+    comments_per_project: int = 10,
+    members_per_project: int = 3,
+    seed: int = 0,
+    prefix: str = "bench",
+) -> Dataset:
+    """
+    Insert the synthetic dataset with multi-row INSERTs and commit it.
+
+    Each project gets its owner plus up to ``members_per_project`` other
+    users as assignees and comment authors, so membership checks and
+    joins see realistic fan-out. Task counters are filled in afterwards by
+    ``reconcile_counters``.
+
+    Args:
+        db (Session): Database session.
+        users (int): Number of users.
+        projects_per_user (int): Projects owned by each user.
+        tasks_per_project (int): Tasks per project, spread over the columns.
+        comments_per_project (int): Comments per project.
+        members_per_project (int): Extra members (assignees) per project.
+        seed (int): Random seed.
+        prefix (str): Username/email prefix.
+
+    Returns:
+        Dataset: User IDs and names, and owned project IDs per user.
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    password_hash = hash_password(BENCH_PASSWORD)
+
+    names = [f"{prefix}_{i}" for i in range(users)]
+    user_ids = _insert_ids(
+        db,
+        User,
+        [
+            {"username": name, "email": f"{name}@bench.example", "hashed_password": password_hash, "is_active": True}
+            for name in names
+        ],
+    )
+    dataset = Dataset(users=list(zip(user_ids, names)))
+
+    project_rows, owners = [], []
+    for owner_id in user_ids:
+        for _ in range(projects_per_user):
+            project_rows.append(
+                {
+                    "name": _sentence(rng, 3),
+                    "description": _sentence(rng, 12),
+                    "owner_id": owner_id,
+                    "due_date": now + timedelta(days=rng.randint(-10, 60)),
+                    "status": rng.choice(list(ProjectStatus)),
+                    "priority": rng.choice(list(ProjectPriority)),
+                }
+            )
+            owners.append(owner_id)
+    project_ids = _insert_ids(db, Project, project_rows)
+
+    member_rows, task_rows, comment_rows = [], [], []
+    for project_id, owner_id in zip(project_ids, owners):
+        dataset.projects_by_owner.setdefault(owner_id, []).append(project_id)
+        others = [user_id for user_id in user_ids if user_id != owner_id]
+        members = rng.sample(others, min(members_per_project, len(others)))
+        member_rows.extend({"project_id": project_id, "user_id": user_id} for user_id in [owner_id, *members])
+
+        column_tail = {task_status: 0.0 for task_status in TaskStatus}
+        for _ in range(tasks_per_project):
+            task_status = rng.choice(list(TaskStatus))
+            column_tail[task_status] += 1024.0
+            task_rows.append(
+                {
+                    "title": _sentence(rng, 4),
+                    "description": _sentence(rng, 20),
+                    "status": task_status,
+                    "priority": rng.choice(list(TaskPriority)),
+                    "due_date": now + timedelta(days=rng.randint(-5, 30)),
+                    "order": column_tail[task_status],
+                    "project_id": project_id,
+                    "assignee_id": rng.choice([None, *members]),
+                }
+            )
+        for _ in range(comments_per_project):
+            comment_rows.append(
+                {
+                    "body": _sentence(rng, 15),
+                    "project_id": project_id,
+                    "author_id": rng.choice([owner_id, *members]),
+                }
+            )
+
+    for model, rows in ((ProjectMember, member_rows), (Task, task_rows), (Comment, comment_rows)):
+        if rows:
+            db.execute(insert(model), rows)
+    reconcile_counters(db, fix=True)
+    db.commit()
+    return dataset
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Seed synthetic benchmark data")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--projects", type=int, default=3, help="projects per user")
+    parser.add_argument("--tasks", type=int, default=30, help="tasks per project")
+    parser.add_argument("--comments", type=int, default=10, help="comments per project")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--prefix", default="bench")
+    args = parser.parse_args(argv)
+
+    from app.database import SessionLocal
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        dataset = seed(
+            db,
+            users=args.users,
+            projects_per_user=args.projects,
+            tasks_per_project=args.tasks,
+            comments_per_project=args.comments,
+            seed=args.seed,
+            prefix=args.prefix,
+        )
+    print(
+        f"seeded {len(dataset.users)} users and {dataset.project_count} projects "
+        f"in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
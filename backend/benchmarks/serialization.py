@@ -0,0 +1,98 @@
+"""
+Bytes and CPU time per list response, before and after the JSON/compression changes.
+
+Usage (from backend/):
+
+    python -m benchmarks.serialization [--rows 500] [--repeat 50]
+
+"before" mirrors FastAPI's generic path (validate, ``jsonable_encoder``,
+stdlib ``json``); "orjson" is the default response class; "TypeAdapter"
+is ``app.utils.serialization.json_response``. Compression rows show the
+encoded size and the extra CPU spent compressing the TypeAdapter body.
+"""
+import argparse
+import gzip
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.schemas.task import TaskRead
+from app.utils.serialization import adapter_for, json_response
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def make_tasks(rows: int) -> List[Task]:
+    now = datetime.now(timezone.utc)
+    statuses = list(TaskStatus)
+    return [
+        Task(
+            id=i,
+            title=f"Task {i}: wire up the reporting pipeline",
+            description="Make sure the nightly export lands in the bucket before standup. " * 3,
+            status=statuses[i % len(statuses)],
+            priority=TaskPriority.MEDIUM,
+            due_date=now + timedelta(days=i % 30),
+            order=1024.0 * (i + 1),
+            created_at=now,
+            updated_at=now,
+            project_id=1,
+            assignee_id=i % 7 or None,
+        )
+        for i in range(rows)
+    ]
+
+
+def cpu_per_call(fn: Callable[[], bytes], repeat: int) -> float:
+    fn()  # warm caches (TypeAdapter build, imports)
+    started = time.process_time()
+    for _ in range(repeat):
+        fn()
+    return (time.process_time() - started) / repeat
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="List response serialization benchmark")
+    parser.add_argument("--rows", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    tasks = make_tasks(args.rows)
+    adapter = adapter_for(List[TaskRead])
+
+    def before() -> bytes:
+        validated = adapter.validate_python(tasks, from_attributes=True)
+        return JSONResponse(jsonable_encoder(validated)).body
+
+    def with_orjson() -> bytes:
+        validated = adapter.validate_python(tasks, from_attributes=True)
+        return ORJSONResponse(adapter.dump_python(validated, mode="json")).body
+
+    def with_type_adapter() -> bytes:
+        return json_response(List[TaskRead], tasks).body
+
+    body = with_type_adapter()
+    cases = [
+        ("before (jsonable_encoder + json)", before),
+        ("orjson response class", with_orjson),
+        ("TypeAdapter.dump_json", with_type_adapter),
+        ("TypeAdapter + gzip(6)", lambda: gzip.compress(with_type_adapter(), compresslevel=6)),
+    ]
+    if brotli is not None:
+        cases.append(("TypeAdapter + brotli(4)", lambda: brotli.compress(with_type_adapter(), quality=4)))
+
+    print(f"{args.rows} tasks, {args.repeat} runs each ({len(body)} bytes uncompressed)")
+    print(f"{'variant':<36}{'bytes':>10}{'cpu ms':>10}")
+    for label, fn in cases:
+        print(f"{label:<36}{len(fn()):>10}{cpu_per_call(fn, args.repeat) * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
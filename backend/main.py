@@ -3,10 +3,35 @@ from app.routers import user
 from app.routers import project
 from app.routers import task
 from app.routers import comment
-from fastapi import FastAPI
+from app.routers import internal
+from app.routers import search
+from app.routers import realtime
+from app.routers import metrics
+from contextlib import asynccontextmanager
+
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.metrics import HttpMetricsMiddleware
+from app.core.events import broadcaster
+from app.core.password_hasher import password_hasher
+from app.core.profiling import ProfilingMiddleware
+from app.core.query_metrics import QueryMetricsMiddleware
+from app.core.read_your_writes import ReadYourWritesMiddleware
+from app.dependencies.pagination import NEXT_CURSOR_HEADER
+from app.utils.pagination import InvalidCursorError
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await broadcaster.start(settings.DATABASE_URL)
+    yield
+    await broadcaster.stop()
+    password_hasher.shutdown()
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 app.add_middleware(
@@ -19,7 +44,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
+)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+    gzip_level=settings.GZIP_LEVEL,
+    brotli_quality=settings.BROTLI_QUALITY,
+    brotli_enabled=settings.BROTLI_ENABLED,
 )
+app.add_middleware(ReadYourWritesMiddleware, window_seconds=settings.READ_YOUR_WRITES_SECONDS)
+# Outermost, so their timings cover the whole stack.
+app.add_middleware(QueryMetricsMiddleware, server_timing=settings.SERVER_TIMING_ENABLED)
+app.add_middleware(HttpMetricsMiddleware)
+app.add_middleware(
+    ProfilingMiddleware,
+    enabled=settings.PROFILING_ENABLED,
+    sample_rate=settings.PROFILING_SAMPLE_RATE,
+    interval_ms=settings.PROFILING_INTERVAL_MS,
+)
+
+
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content={"detail": str(exc)})
 
 @app.get("/")
 def root():
@@ -30,3 +78,7 @@ app.include_router(auth.router, prefix="/api", tags=["Auth"])
 app.include_router(project.router, prefix="/api", tags=["Projects"])
 app.include_router(task.router, prefix="/api", tags=["Tasks"])
 app.include_router(comment.router, prefix="/api", tags=["Comments"])
+app.include_router(search.router, prefix="/api", tags=["Search"])
+app.include_router(realtime.router, prefix="/api", tags=["Realtime"])
+app.include_router(internal.router)
+app.include_router(metrics.router)
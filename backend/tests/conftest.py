@@ -3,7 +3,7 @@ from typing import Generator
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.orm import sessionmaker
 import sys
@@ -12,6 +12,9 @@ import pathlib
 # Ensure SECRET_KEY is set before importing the app/auth modules
 os.environ.setdefault("SECRET_KEY", "testsecret")
 os.environ.setdefault("DATABASE_URL", "sqlite:///./_tests_dummy.db")
+# Cheap bcrypt hashed inline; tests that need the process pool build their own
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+os.environ.setdefault("PASSWORD_HASH_WORKERS", "0")
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -22,6 +25,8 @@ from app.models.base import Base  # noqa: E402
 from app.dependencies.db import get_db  # noqa: E402
 from app.models.user import User  # noqa: E402
 from app.utils.security import hash_password  # noqa: E402
+from app.core.user_cache import user_cache  # noqa: E402
+from app.core.query_metrics import attach_query_metrics  # noqa: E402
 app = main.app
 
 
@@ -33,6 +38,7 @@ def db_session() -> Generator:
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+    attach_query_metrics(engine)
     TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
     # Create all tables
@@ -59,9 +65,11 @@ def _override_get_db(session):
 def client(db_session) -> Generator[TestClient, None, None]:
     # Override DB dependency
     app.dependency_overrides[get_db] = _override_get_db(db_session)
+    user_cache.clear()
     with TestClient(app) as c:
         yield c
     app.dependency_overrides.clear()
+    user_cache.clear()
 
 
 @pytest.fixture()
@@ -91,3 +99,66 @@ def auth_client(client: TestClient, test_user: User):
         yield client
     finally:
         app.dependency_overrides.pop(_get_current_user, None)
+
+
+@pytest.fixture()
+def internal_headers(monkeypatch):
+    """Configure ``INTERNAL_API_TOKEN`` and return the header that passes the internal guard."""
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", "s3cret")
+    return {"X-Internal-Token": "s3cret"}
+
+
+class QueryCounter:
+    """Records SQL statements executed on an engine while the block is active."""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@pytest.fixture()
+def count_queries(db_session):
+    return lambda: QueryCounter(db_session.bind)
+
+
+@pytest.fixture()
+def assert_constant_queries(auth_client, db_session, count_queries):
+    """
+    Fail when a GET endpoint's query count grows with the number of rows.
+
+    ``add_rows(n)`` must insert ``n`` more rows into the listing. The session
+    is expired before each measurement so relationship loads cannot be
+    served from the identity map and hide an N+1.
+    """
+
+    def _check(url, add_rows, params=None):
+        counts = []
+        for rows in (1, 20):
+            add_rows(rows)
+            db_session.expire_all()
+            with count_queries() as counter:
+                response = auth_client.get(url, params=params)
+            assert response.status_code == 200, response.text
+            counts.append(counter.count)
+        assert counts[0] == counts[1], (
+            f"{url} ran {counts[0]} queries for 1 row but {counts[1]} for 21 rows"
+        )
+        return counts[0]
+
+    return _check
@@ -0,0 +1,88 @@
+import pytest
+from fastapi import status
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import main
+from app.database import to_async_url
+from app.dependencies.auth import get_current_user
+from app.dependencies.db import get_db
+from app.models.base import Base
+from app.models.user import User
+
+
+@pytest.fixture()
+def async_client():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    AsyncTestingSessionLocal = async_sessionmaker(
+        engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def _setup() -> User:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with AsyncTestingSessionLocal() as session:
+            user = User(
+                username="alice",
+                email="alice@example.com",
+                hashed_password="hashed",
+                is_active=True,
+            )
+            session.add(user)
+            await session.commit()
+            return user
+
+    async def _get_db():
+        async with AsyncTestingSessionLocal() as session:
+            yield session
+
+    with TestClient(main.app) as client:
+        user = client.portal.call(_setup)
+        main.app.dependency_overrides[get_db] = _get_db
+        main.app.dependency_overrides[get_current_user] = lambda: user
+        try:
+            yield client
+        finally:
+            main.app.dependency_overrides.clear()
+            client.portal.call(engine.dispose)
+
+
+def test_to_async_url_picks_async_driver():
+    assert to_async_url("postgresql://u:p@db/app").drivername == "postgresql+asyncpg"
+    assert to_async_url("sqlite:///./app.db").drivername == "sqlite+aiosqlite"
+    with pytest.raises(ValueError):
+        to_async_url("mysql://u:p@db/app")
+
+
+def test_async_session_serves_project_task_and_comment_routes(async_client):
+    r = async_client.post("/api/projects/", json={"name": "Async", "description": "A"})
+    assert r.status_code == status.HTTP_201_CREATED
+    project_id = r.json()["id"]
+
+    r = async_client.post(
+        f"/api/project/{project_id}/tasks/",
+        json={"title": "T1", "description": "D"},
+    )
+    assert r.status_code == status.HTTP_201_CREATED
+
+    r = async_client.get(f"/api/project/{project_id}/tasks/")
+    assert r.status_code == status.HTTP_200_OK
+    assert [t["title"] for t in r.json()] == ["T1"]
+
+    r = async_client.post(
+        f"/api/projects/{project_id}/comments/", json={"body": "Hello"}
+    )
+    assert r.status_code == status.HTTP_201_CREATED
+    assert r.json()["author"]["username"] == "alice"
+
+    r = async_client.get(f"/api/projects/{project_id}/comments/")
+    assert r.status_code == status.HTTP_200_OK
+    assert [c["author"]["username"] for c in r.json()] == ["alice"]
+
+    r = async_client.get("/api/projects/")
+    assert [p["name"] for p in r.json()] == ["Async"]
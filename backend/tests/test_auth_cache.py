@@ -0,0 +1,83 @@
+from fastapi import status
+from sqlalchemy import event
+
+from app.core.auth import create_access_token
+from app.core.user_cache import UserCache, user_cache
+from app.models.user import User
+
+
+def _auth_headers(user: User) -> dict:
+    token = create_access_token(data={"sub": str(user.id)})
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _count_user_selects(db_session):
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", _before_cursor_execute)
+    return statements
+
+
+def test_cached_user_skips_lookup(client, db_session, test_user):
+    headers = _auth_headers(test_user)
+    user_selects = _count_user_selects(db_session)
+
+    first = client.get("/api/auth/protected", headers=headers)
+    assert first.status_code == status.HTTP_200_OK
+    assert len(user_selects) == 1
+
+    for _ in range(3):
+        resp = client.get("/api/auth/protected", headers=headers)
+        assert resp.status_code == status.HTTP_200_OK
+        assert resp.json() == {"message": "Hello, alice!"}
+    assert len(user_selects) == 1
+
+
+def test_deactivation_invalidates_cache(client, db_session, test_user):
+    headers = _auth_headers(test_user)
+    assert client.get("/api/auth/protected", headers=headers).status_code == 200
+    assert user_cache.get(test_user.id) is not None
+
+    test_user.is_active = False
+    db_session.flush()
+    # Not evicted until the change commits, so nothing can re-cache the old row after it.
+    assert user_cache.get(test_user.id) is not None
+    db_session.commit()
+
+    assert user_cache.get(test_user.id) is None
+    resp = client.get("/api/auth/protected", headers=headers)
+    assert resp.status_code == status.HTTP_401_UNAUTHORIZED
+    assert user_cache.get(test_user.id) is None
+
+
+def test_user_cache_is_bounded_and_expires(monkeypatch):
+    cache = UserCache(max_size=2, ttl_seconds=10)
+    for user_id in (1, 2, 3):
+        cache.set(User(id=user_id, username=f"u{user_id}", email=f"u{user_id}@x.io", is_active=True))
+    assert len(cache) == 2
+    assert cache.get(1) is None
+    assert cache.get(3).username == "u3"
+
+    cache.set(User(id=4, username="off", email="off@x.io", is_active=False))
+    assert cache.get(4) is None
+
+    import app.core.user_cache as module
+
+    now = module.time.monotonic()
+    monkeypatch.setattr(module.time, "monotonic", lambda: now + 11)
+    assert cache.get(3) is None
+
+
+def test_rolled_back_change_keeps_cache_entry(client, db_session, test_user):
+    headers = _auth_headers(test_user)
+    assert client.get("/api/auth/protected", headers=headers).status_code == 200
+
+    test_user.username = "renamed"
+    db_session.flush()
+    db_session.rollback()
+    db_session.commit()
+    assert user_cache.get(test_user.id).username == "alice"
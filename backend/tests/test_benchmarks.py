@@ -0,0 +1,56 @@
+import asyncio
+
+import httpx
+
+import main
+from app.crud.counters import reconcile_counters
+from app.models.comment import Comment
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+from benchmarks.load import login_users, percentile, queries_from_server_timing, run_scenario
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.seed import seed
+
+
+def test_seed_builds_consistent_dataset(db_session):
+    dataset = seed(db_session, users=4, projects_per_user=2, tasks_per_project=5, comments_per_project=3)
+
+    assert len(dataset.users) == 4
+    assert dataset.project_count == 8
+    assert db_session.query(Task).count() == 40
+    assert db_session.query(Comment).count() == 24
+    # Owner plus three other members per project.
+    assert db_session.query(ProjectMember).count() == 8 * 4
+    assert reconcile_counters(db_session, fix=False) == []
+
+
+def test_scenarios_run_in_process(client, db_session):
+    dataset = seed(db_session, users=3, projects_per_user=1, tasks_per_project=4, comments_per_project=2)
+    async def scenario_results():
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            users = await login_users(http, dataset, rng_seed=0)
+            return {
+                name: await run_scenario(scenario, users, [http] * len(users), concurrency=1, iterations=2)
+                for name, scenario in SCENARIOS.items()
+            }
+
+    results = asyncio.run(scenario_results())
+    for name, stats in results.items():
+        assert stats["requests"] > 0, name
+        assert stats["errors"] == 0, name
+        assert stats["queries_per_request"] >= 1, name
+    assert set(results["kanban"]["steps"]) == {"board", "reorder"}
+
+
+def test_queries_from_server_timing():
+    assert queries_from_server_timing('db;dur=1.250;desc="7 queries", app;dur=3.0') == 7
+    assert queries_from_server_timing("app;dur=3.0") is None
+    assert queries_from_server_timing(None) is None
+
+
+def test_percentile_interpolates():
+    assert percentile([], 0.5) == 0.0
+    assert percentile([10.0], 0.99) == 10.0
+    assert percentile([0.0, 10.0, 20.0, 30.0, 40.0], 0.5) == 20.0
+    assert percentile([0.0, 100.0], 0.95) == 95.0
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import update
+
+from app.crud.tombstones import purge_tombstones
+from app.models.comment import Comment
+from app.models.task import Task
+from app.models.tombstone import Tombstone
+from app.utils.pagination import encode_cursor
+
+
+def _age_everything(db_session, minutes=10):
+    # Push existing rows outside the cursor's overlap window.
+    past = datetime.utcnow() - timedelta(minutes=minutes)
+    db_session.execute(update(Task).values(updated_at=past))
+    db_session.execute(update(Comment).values(updated_at=past))
+    db_session.execute(update(Tombstone).values(deleted_at=past))
+    db_session.commit()
+
+
+def test_changes_since_cursor(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    tasks_url = f"/api/project/{pid}/tasks/"
+    comments_url = f"/api/projects/{pid}/comments/"
+    for title in ("keep", "edit", "drop"):
+        auth_client.post(tasks_url, json={"title": title, "description": "d"})
+    ids = {t["title"]: t["id"] for t in auth_client.get(tasks_url).json()}
+    old_comment = auth_client.post(comments_url, json={"body": "old"}).json()
+    _age_everything(db_session)
+
+    cursor = auth_client.get(f"/api/projects/{pid}/full").json()["cursor"]
+    auth_client.patch(f"{tasks_url}{ids['edit']}", json={"status": "done"})
+    auth_client.delete(f"{tasks_url}{ids['drop']}")
+    auth_client.post(tasks_url, json={"title": "new", "description": "d"})
+    auth_client.post(comments_url, json={"body": "fresh"})
+    auth_client.delete(f"{comments_url}{old_comment['id']}")
+
+    response = auth_client.get(f"/api/projects/{pid}/changes", params={"since": cursor})
+    assert response.status_code == 200
+    changes = response.json()
+    assert [t["title"] for t in changes["tasks"]] == ["edit", "new"]
+    assert changes["tasks"][0]["status"] == "done"
+    assert [c["body"] for c in changes["comments"]] == ["fresh"]
+    assert changes["deleted_task_ids"] == [ids["drop"]]
+    assert changes["deleted_comment_ids"] == [old_comment["id"]]
+
+    _age_everything(db_session)
+    quiet = auth_client.get(
+        f"/api/projects/{pid}/changes", params={"since": changes["cursor"]}
+    ).json()
+    assert quiet["tasks"] == quiet["comments"] == []
+    assert quiet["deleted_task_ids"] == quiet["deleted_comment_ids"] == []
+
+
+def test_changes_without_cursor_returns_everything(auth_client):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    auth_client.post(f"/api/project/{pid}/tasks/", json={"title": "A", "description": "d"})
+    auth_client.post(f"/api/projects/{pid}/comments/", json={"body": "hi"})
+
+    changes = auth_client.get(f"/api/projects/{pid}/changes").json()
+    assert [t["title"] for t in changes["tasks"]] == ["A"]
+    assert [c["body"] for c in changes["comments"]] == ["hi"]
+    assert changes["cursor"]
+
+
+def test_bulk_delete_leaves_tombstones(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    bulk = f"/api/project/{pid}/tasks/bulk"
+    created = auth_client.post(
+        bulk, json={"items": [{"title": t, "description": "d"} for t in "ABC"]}
+    ).json()["results"]
+    ids = [r["id"] for r in created]
+    cursor = auth_client.get(f"/api/projects/{pid}/full").json()["cursor"]
+
+    auth_client.request("DELETE", bulk, json={"ids": ids[:2]})
+    changes = auth_client.get(f"/api/projects/{pid}/changes", params={"since": cursor}).json()
+    assert sorted(changes["deleted_task_ids"]) == ids[:2]
+
+
+def test_changes_rejects_bad_expired_and_foreign_requests(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    url = f"/api/projects/{pid}/changes"
+
+    assert auth_client.get(url, params={"since": "garbage"}).status_code == 400
+    expired = encode_cursor([datetime.utcnow() - timedelta(days=365)])
+    assert auth_client.get(url, params={"since": expired}).status_code == 410
+    assert auth_client.get("/api/projects/9999/changes").status_code == 404
+
+
+def test_purge_tombstones_removes_old_entries(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    url = f"/api/project/{pid}/tasks/"
+    auth_client.post(url, json={"title": "A", "description": "d"})
+    task_id = auth_client.get(url).json()[0]["id"]
+    auth_client.delete(f"{url}{task_id}")
+
+    assert purge_tombstones(db_session) == 0
+    _age_everything(db_session, minutes=60 * 24 * 400)
+    assert purge_tombstones(db_session) == 1
+
+
+def test_changes_accepts_cursor_with_utc_offset(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    auth_client.post(f"/api/project/{pid}/tasks/", json={"title": "Old", "description": "d"})
+    _age_everything(db_session)
+    url = f"/api/projects/{pid}/changes"
+
+    # Five minutes ago, written in UTC-5: newer than the aged task once converted.
+    since = datetime.now(timezone(timedelta(hours=-5))) - timedelta(minutes=5)
+    response = auth_client.get(url, params={"since": encode_cursor([since])})
+    assert response.status_code == 200
+    assert response.json()["tasks"] == []
+
+    expired = datetime.now(timezone(timedelta(hours=2))) - timedelta(days=365)
+    assert auth_client.get(url, params={"since": encode_cursor([expired])}).status_code == 410
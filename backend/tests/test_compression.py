@@ -0,0 +1,88 @@
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from typing import List
+
+from app.core.compression import CompressionMiddleware, parse_accept_encoding
+from app.schemas.task import TaskRead
+from app.utils.serialization import json_response
+
+BIG = "x" * 5000
+
+
+def _app(**options):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1000, **options)
+
+    @app.get("/big")
+    def big():
+        return PlainTextResponse(BIG)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BIG, BIG]), media_type="text/plain")
+
+    return TestClient(app)
+
+
+def _get(client, path, accept):
+    # httpx decodes gzip/br transparently; read the raw bytes instead.
+    with client.stream("GET", path, headers={"Accept-Encoding": accept}) as resp:
+        return resp, b"".join(resp.iter_raw())
+
+
+def test_gzip_above_threshold_only():
+    client = _app(brotli_enabled=False)
+    resp, raw = _get(client, "/big", "gzip, br")
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in resp.headers["vary"]
+    assert int(resp.headers["content-length"]) == len(raw)
+    assert gzip.decompress(raw).decode() == BIG
+
+    resp, raw = _get(client, "/small", "gzip")
+    assert "content-encoding" not in resp.headers
+    assert raw == b"tiny"
+
+    resp, raw = _get(client, "/big", "identity")
+    assert "content-encoding" not in resp.headers
+
+
+def test_brotli_preferred_when_available():
+    brotli = pytest.importorskip("brotli")
+    client = _app()
+    resp, raw = _get(client, "/big", "gzip, br")
+    assert resp.headers["content-encoding"] == "br"
+    assert brotli.decompress(raw).decode() == BIG
+
+    resp, _ = _get(client, "/big", "gzip, br;q=0")
+    assert resp.headers["content-encoding"] == "gzip"
+
+
+def test_streaming_responses_pass_through():
+    resp, raw = _get(_app(), "/stream", "gzip")
+    assert "content-encoding" not in resp.headers
+    assert raw.decode() == BIG * 2
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip;q=0.5, br, *;q=0") == {"gzip": 0.5, "br": 1.0, "*": 0.0}
+
+
+def test_json_response_matches_default_encoding(auth_client):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    url = f"/api/project/{pid}/tasks/"
+    auth_client.post(url, json={"title": "A", "description": "d", "due_date": "2026-01-02T03:04:05"})
+    tasks = auth_client.get(url).json()
+    assert tasks[0]["due_date"] == "2026-01-02T03:04:05"
+    assert tasks[0]["order"] == 1024.0
+
+    response = json_response(List[TaskRead], tasks)
+    assert response.media_type == "application/json"
+    assert response.body.startswith(b'[{"id":')
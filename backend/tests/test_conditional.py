@@ -0,0 +1,117 @@
+from fastapi import status
+
+from app.models.user import User
+
+
+def _revalidate(client, url, etag):
+    return client.get(url, headers={"If-None-Match": etag})
+
+
+def test_task_list_etag_and_304(auth_client, test_user, count_queries):
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    url = f"/api/project/{pid}/tasks/"
+    auth_client.post(url, json={"title": "A", "description": "d"})
+
+    first = auth_client.get(url)
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    test_user.id  # reload the expired fixture user outside the counted block
+    with count_queries() as counter:
+        cached = _revalidate(auth_client, url, etag)
+    assert cached.status_code == status.HTTP_304_NOT_MODIFIED
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    assert counter.count == 1
+
+    task_id = first.json()[0]["id"]
+    auth_client.patch(f"{url}{task_id}", json={"title": "A2"})
+    changed = _revalidate(auth_client, url, etag)
+    assert changed.status_code == status.HTTP_200_OK
+    assert changed.headers["ETag"] != etag
+
+    deleted_etag = changed.headers["ETag"]
+    auth_client.delete(f"{url}{task_id}")
+    assert _revalidate(auth_client, url, deleted_etag).status_code == status.HTTP_200_OK
+
+    # Different pages of the same list have different tags.
+    assert auth_client.get(url, params={"limit": 1}).headers["ETag"] != auth_client.get(url).headers["ETag"]
+
+
+def test_project_and_comment_list_etags(auth_client):
+    projects = auth_client.get("/api/projects/")
+    etag = projects.headers["ETag"]
+    assert _revalidate(auth_client, "/api/projects/", etag).status_code == status.HTTP_304_NOT_MODIFIED
+    assert _revalidate(auth_client, "/api/projects/", f'"x", {etag}').status_code == status.HTTP_304_NOT_MODIFIED
+
+    pid = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    assert _revalidate(auth_client, "/api/projects/", etag).status_code == status.HTTP_200_OK
+
+    url = f"/api/projects/{pid}/comments/"
+    etag = auth_client.get(url).headers["ETag"]
+    assert _revalidate(auth_client, url, etag).status_code == status.HTTP_304_NOT_MODIFIED
+    auth_client.post(url, json={"body": "hello"})
+    assert _revalidate(auth_client, url, etag).status_code == status.HTTP_200_OK
+
+
+def test_etag_is_per_user(auth_client, db_session):
+    etag = auth_client.get("/api/projects/").headers["ETag"]
+
+    other = User(username="bob", email="bob@example.com", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    db_session.refresh(other)
+
+    import main
+    from app.dependencies.auth import get_current_user as _get_current_user
+
+    main.app.dependency_overrides[_get_current_user] = lambda: other
+    try:
+        # Both users have no projects, but a cached list must not cross users.
+        assert _revalidate(auth_client, "/api/projects/", etag).status_code == status.HTTP_200_OK
+    finally:
+        main.app.dependency_overrides.pop(_get_current_user, None)
+
+
+def test_etag_requires_access(auth_client):
+    resp = auth_client.get("/api/project/9999/tasks/", headers={"If-None-Match": "*"})
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_project_list_etag_follows_membership_swaps(auth_client, db_session, test_user):
+    import main
+    from app.dependencies.auth import get_current_user as _get_current_user
+
+    bob = User(username="bob", email="bob@example.com", hashed_password="x")
+    db_session.add(bob)
+    db_session.commit()
+    db_session.refresh(bob)
+
+    def create(name):
+        pid = auth_client.post("/api/projects/", json={"name": name, "description": "D"}).json()["id"]
+        url = f"/api/project/{pid}/tasks/"
+        auth_client.post(url, json={"title": "T", "description": "d"})
+        return url, auth_client.get(url).json()[0]["id"]
+
+    old_a, old_b, newest = create("Old A"), create("Old B"), create("Newest")
+    for url, task_id in (old_a, newest):
+        auth_client.patch(f"{url}{task_id}", json={"assignee_id": bob.id})
+
+    main.app.dependency_overrides[_get_current_user] = lambda: bob
+    try:
+        etag = auth_client.get("/api/projects/").headers["ETag"]
+    finally:
+        main.app.dependency_overrides[_get_current_user] = lambda: test_user
+
+    # Bob swaps one older project for another: same count, same newest project.
+    auth_client.patch(f"{old_a[0]}{old_a[1]}", json={"assignee_id": None})
+    auth_client.patch(f"{old_b[0]}{old_b[1]}", json={"assignee_id": bob.id})
+
+    main.app.dependency_overrides[_get_current_user] = lambda: bob
+    try:
+        resp = _revalidate(auth_client, "/api/projects/", etag)
+        assert resp.status_code == status.HTTP_200_OK
+        assert sorted(p["name"] for p in resp.json()) == ["Newest", "Old B"]
+    finally:
+        main.app.dependency_overrides.pop(_get_current_user, None)
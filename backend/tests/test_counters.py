@@ -0,0 +1,95 @@
+from app.crud.counters import reconcile_counters
+from app.models.project_task_counter import ProjectTaskCounter
+from app.models.task import Task
+
+
+def _counter(db_session, project_id):
+    db_session.expire_all()
+    counter = db_session.get(ProjectTaskCounter, project_id)
+    return {"todo": counter.todo, "in_progress": counter.in_progress, "done": counter.done}
+
+
+def test_counters_follow_task_changes(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "C", "description": "D"}).json()["id"]
+    url = f"/api/project/{pid}/tasks/"
+    assert _counter(db_session, pid) == {"todo": 0, "in_progress": 0, "done": 0}
+
+    auth_client.post(url, json={"title": "A", "description": "d"})
+    auth_client.post(url, json={"title": "B", "description": "d"})
+    auth_client.post(url, json={"title": "C", "description": "d", "status": "done"})
+    ids = {t["title"]: t["id"] for t in auth_client.get(url).json()}
+    a, b = ids["A"], ids["B"]
+    assert _counter(db_session, pid) == {"todo": 2, "in_progress": 0, "done": 1}
+
+    auth_client.patch(f"{url}{a}", json={"status": "in_progress"})
+    auth_client.put(f"{url}{b}", json={"title": "B2"})
+    assert _counter(db_session, pid) == {"todo": 1, "in_progress": 1, "done": 1}
+    assert db_session.get(ProjectTaskCounter, pid).last_activity_at is not None
+
+    auth_client.post(f"{url}reorder", json={"moves": [{"task_id": b, "status": "done"}]})
+    assert _counter(db_session, pid) == {"todo": 0, "in_progress": 1, "done": 2}
+
+    auth_client.delete(f"{url}{a}")
+    assert _counter(db_session, pid) == {"todo": 0, "in_progress": 0, "done": 2}
+
+
+def test_counters_follow_bulk_changes(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "C", "description": "D"}).json()["id"]
+    bulk = f"/api/project/{pid}/tasks/bulk"
+    created = auth_client.post(
+        bulk, json={"items": [{"title": t, "description": "d"} for t in "ABCD"]}
+    ).json()["results"]
+    ids = [r["id"] for r in created]
+    assert _counter(db_session, pid) == {"todo": 4, "in_progress": 0, "done": 0}
+
+    auth_client.patch(bulk, json={"items": [{"id": ids[0], "status": "done"}, {"id": ids[1], "status": "done"}]})
+    assert _counter(db_session, pid) == {"todo": 2, "in_progress": 0, "done": 2}
+
+    auth_client.request("DELETE", bulk, json={"ids": [ids[0], ids[2]]})
+    assert _counter(db_session, pid) == {"todo": 1, "in_progress": 0, "done": 1}
+    assert reconcile_counters(db_session) == []
+
+
+def test_reconcile_reports_and_fixes_drift(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "C", "description": "D"}).json()["id"]
+    auth_client.post(f"/api/project/{pid}/tasks/", json={"title": "A", "description": "d"})
+
+    # A write that bypasses the CRUD layer leaves the counters stale.
+    db_session.add(Task(title="B", description="d", project_id=pid, status="done"))
+    db_session.commit()
+
+    drift = reconcile_counters(db_session, fix=False)
+    assert drift == [{
+        "project_id": pid,
+        "stored": {"todo": 1, "in_progress": 0, "done": 0},
+        "actual": {"todo": 1, "in_progress": 0, "done": 1},
+    }]
+    assert _counter(db_session, pid)["done"] == 0
+
+    assert len(reconcile_counters(db_session)) == 1
+    assert _counter(db_session, pid) == {"todo": 1, "in_progress": 0, "done": 1}
+    assert reconcile_counters(db_session) == []
+
+
+def test_internal_reconcile_endpoint(auth_client, db_session, internal_headers):
+    pid = auth_client.post("/api/projects/", json={"name": "C", "description": "D"}).json()["id"]
+    db_session.add(Task(title="B", description="d", project_id=pid))
+    db_session.commit()
+
+    resp = auth_client.post("/internal/counters/reconcile", params={"fix": "false"}, headers=internal_headers)
+    assert resp.status_code == 200
+    assert resp.json()["drifted"] == 1
+    assert auth_client.post("/internal/counters/reconcile", headers=internal_headers).json()["drifted"] == 1
+    assert auth_client.post("/internal/counters/reconcile", headers=internal_headers).json()["drifted"] == 0
+
+
+def test_reconcile_recreates_missing_counter_rows(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "C", "description": "D"}).json()["id"]
+    auth_client.post(f"/api/project/{pid}/tasks/", json={"title": "A", "description": "d"})
+    db_session.query(ProjectTaskCounter).filter_by(project_id=pid).delete()
+    db_session.commit()
+
+    drift = reconcile_counters(db_session)
+    assert drift == [{"project_id": pid, "stored": None, "actual": {"todo": 1, "in_progress": 0, "done": 0}}]
+    assert _counter(db_session, pid) == {"todo": 1, "in_progress": 0, "done": 0}
+    assert reconcile_counters(db_session) == []
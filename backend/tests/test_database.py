@@ -0,0 +1,76 @@
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from app import database
+from app.core.config import settings
+from app.core.pool import InstrumentedQueuePool
+
+
+def test_engine_options_apply_pool_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 1)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 5000)
+
+    options = database.engine_options(make_url("postgresql://u:p@db/app"))
+    assert options["echo"] is False
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 3
+    assert options["max_overflow"] == 1
+    assert options["pool_pre_ping"] is True
+    assert options["connect_args"] == {"options": "-c statement_timeout=5000"}
+
+    async_options = database.engine_options(
+        make_url("postgresql+asyncpg://u:p@db/app"), is_async=True
+    )
+    assert async_options["connect_args"] == {
+        "server_settings": {"statement_timeout": "5000"}
+    }
+
+    memory_options = database.engine_options(make_url("sqlite:///:memory:"))
+    assert memory_options == {"echo": False}
+
+
+def test_pool_metrics_count_checkouts_and_overflow(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 1)
+    engine = database.create_db_engine(f"sqlite:///{tmp_path / 'pool.db'}")
+    try:
+        with engine.connect() as first, engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            live = engine.pool.metrics.snapshot(engine.pool)
+            assert live["checked_out"] == 2
+            assert live["overflow"] == 1
+
+            # Reusing the pooled connection while the overflow one is still
+            # open is not an overflow checkout.
+            first.close()
+            with engine.connect() as third:
+                third.execute(text("SELECT 1"))
+                assert engine.pool.metrics.snapshot(engine.pool)["overflow"] == 1
+
+        stats = engine.pool.metrics.snapshot(engine.pool)
+        assert stats["checkouts"] == 3
+        assert stats["checkins"] == 3
+        assert stats["connects"] == 2
+        assert stats["overflow_checkouts"] == 1
+        assert stats["wait_seconds_total"] >= 0
+    finally:
+        engine.dispose()
+
+
+def test_internal_pool_endpoint(client, internal_headers):
+    resp = client.get("/internal/db/pool", headers=internal_headers)
+    assert resp.status_code == 200
+    assert {"checkouts", "timeouts", "wait_seconds_max"} <= resp.json()["sync"].keys()
+
+    assert client.get("/internal/db/pool").status_code == 403
+    assert client.get("/internal/db/pool", headers={"X-Internal-Token": "wrong"}).status_code == 403
+
+
+def test_internal_endpoints_closed_without_token(client, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", None)
+    for path in ("/internal/db/pool", "/internal/auth/password-hashing", "/internal/profiles", "/metrics"):
+        assert client.get(path).status_code == 403, path
+        assert client.get(path, headers={"X-Internal-Token": ""}).status_code == 403, path
+    assert client.post("/internal/counters/reconcile").status_code == 403
@@ -0,0 +1,123 @@
+import os
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select, text
+
+from app.models.base import Base
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.task import Task
+from app.models.tombstone import Tombstone
+
+# Hot access paths and the index each one must use.
+HOT_QUERIES = {
+    "membership access check": (
+        select(Project)
+        .join(ProjectMember, ProjectMember.project_id == Project.id)
+        .where(ProjectMember.project_id == 1, ProjectMember.user_id == 1),
+        {"sqlite": "sqlite_autoindex_project_members_1", "postgresql": "project_members_pkey"},
+    ),
+    "kanban board": (
+        select(Task)
+        .where(Task.project_id == 1, Task.status == "todo")
+        .order_by(Task.order),
+        "ix_tasks_project_status_order",
+    ),
+    "tasks by project": (
+        select(Task).where(Task.project_id == 1),
+        ("ix_tasks_project_status_order", "ix_tasks_project_updated_at"),
+    ),
+    "task changes": (
+        select(Task).where(Task.project_id == 1, Task.updated_at >= datetime(2026, 1, 1)),
+        "ix_tasks_project_updated_at",
+    ),
+    "tasks by assignee": (
+        select(Task.project_id).where(Task.assignee_id == 1),
+        "ix_tasks_assignee_project",
+    ),
+    "projects by owner": (
+        select(Project).where(Project.owner_id == 1),
+        "ix_projects_owner_id",
+    ),
+    "project list": (
+        select(Project)
+        .where(Project.status == "active")
+        .order_by(Project.due_date.asc().nulls_last(), Project.created_at, Project.id),
+        "ix_projects_due_date_created_at",
+    ),
+    "comment thread": (
+        select(Comment).where(Comment.project_id == 1).order_by(Comment.created_at),
+        "ix_comments_project_created_at",
+    ),
+    "comment changes": (
+        select(Comment).where(Comment.project_id == 1, Comment.updated_at >= datetime(2026, 1, 1)),
+        "ix_comments_project_updated_at",
+    ),
+    "tombstones since cursor": (
+        select(Tombstone).where(Tombstone.project_id == 1, Tombstone.deleted_at >= datetime(2026, 1, 1)),
+        "ix_tombstones_project_deleted_at",
+    ),
+}
+
+
+def _explain(connection, statement) -> str:
+    sql = str(statement.compile(connection, compile_kwargs={"literal_binds": True}))
+    if connection.dialect.name == "sqlite":
+        rows = connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")).all()
+        return "\n".join(row[-1] for row in rows)
+    # Tiny test tables make a sequential scan cheapest; ask the planner
+    # whether an index path exists at all.
+    connection.execute(text("SET LOCAL enable_seqscan = off"))
+    rows = connection.execute(text(f"EXPLAIN {sql}")).all()
+    return "\n".join(row[0] for row in rows)
+
+
+def _assert_plans_use_indexes(engine):
+    with engine.begin() as connection:
+        for label, (statement, expected) in HOT_QUERIES.items():
+            if isinstance(expected, dict):
+                expected = expected[connection.dialect.name]
+            if isinstance(expected, str):
+                expected = (expected,)
+            plan = _explain(connection, statement)
+            assert any(name in plan for name in expected), f"{label} does not use {expected}:\n{plan}"
+
+
+def test_hot_queries_use_indexes_sqlite(db_session):
+    _assert_plans_use_indexes(db_session.get_bind())
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"),
+    reason="set TEST_POSTGRES_URL to check plans against PostgreSQL",
+)
+def test_hot_queries_use_indexes_postgres():
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+    Base.metadata.create_all(engine)
+    try:
+        _assert_plans_use_indexes(engine)
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_POSTGRES_URL"),
+    reason="set TEST_POSTGRES_URL to check plans against PostgreSQL",
+)
+def test_search_uses_gin_indexes_postgres():
+    from app.crud.search import _postgres_hits
+    from app.models.search import SEARCH_COLUMNS
+
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+    Base.metadata.create_all(engine)
+    try:
+        with engine.begin() as connection:
+            plan = _explain(connection, select(_postgres_hits(1, "launch plan")))
+        for table in SEARCH_COLUMNS:
+            assert f"ix_{table}_search_vector" in plan, plan
+    finally:
+        Base.metadata.drop_all(engine)
+        engine.dispose()
@@ -0,0 +1,90 @@
+from fastapi import status
+
+import main
+from app.crud.membership import add_member
+from app.dependencies.auth import get_current_user
+from app.models.project_member import ProjectMember
+from app.models.user import User
+
+
+def _make_user(db_session, username: str) -> User:
+    user = User(username=username, email=f"{username}@example.com", hashed_password="x")
+    db_session.add(user)
+    db_session.commit()
+    db_session.refresh(user)
+    return user
+
+
+def _members(db_session, project_id: int):
+    db_session.expire_all()
+    rows = db_session.query(ProjectMember).filter(ProjectMember.project_id == project_id)
+    return sorted(row.user_id for row in rows)
+
+
+def _as(user: User):
+    main.app.dependency_overrides[get_current_user] = lambda: user
+
+
+def test_membership_follows_task_assignment(auth_client, db_session, test_user):
+    bob = _make_user(db_session, "bob")
+    carol = _make_user(db_session, "carol")
+
+    project_id = auth_client.post(
+        "/api/projects/", json={"name": "Shared", "description": "S"}
+    ).json()["id"]
+    assert _members(db_session, project_id) == [test_user.id]
+
+    auth_client.post(
+        f"/api/project/{project_id}/tasks/",
+        json={"title": "T", "description": "D", "assignee_id": bob.id},
+    )
+    assert _members(db_session, project_id) == [test_user.id, bob.id]
+
+    task_id = auth_client.get(f"/api/project/{project_id}/tasks/").json()[0]["id"]
+    _as(bob)
+    assert auth_client.get(f"/api/projects/{project_id}").status_code == status.HTTP_200_OK
+
+    _as(test_user)
+    auth_client.patch(
+        f"/api/project/{project_id}/tasks/{task_id}", json={"assignee_id": carol.id}
+    )
+    assert _members(db_session, project_id) == [test_user.id, carol.id]
+
+    _as(bob)
+    assert auth_client.get(f"/api/projects/{project_id}").status_code == status.HTTP_404_NOT_FOUND
+    assert auth_client.get(f"/api/project/{project_id}/tasks/").status_code == status.HTTP_403_FORBIDDEN
+
+    _as(test_user)
+    auth_client.delete(f"/api/project/{project_id}/tasks/{task_id}")
+    assert _members(db_session, project_id) == [test_user.id]
+
+
+def test_membership_follows_ownership_transfer(auth_client, db_session, test_user):
+    bob = _make_user(db_session, "bob")
+    project_id = auth_client.post(
+        "/api/projects/", json={"name": "Handover", "description": "H"}
+    ).json()["id"]
+
+    resp = auth_client.put(f"/api/projects/{project_id}", json={"owner_id": bob.id})
+    assert resp.status_code == status.HTTP_200_OK
+    assert _members(db_session, project_id) == [bob.id]
+    assert auth_client.get(f"/api/projects/{project_id}").status_code == status.HTTP_404_NOT_FOUND
+
+    _as(bob)
+    assert auth_client.get(f"/api/projects/{project_id}").status_code == status.HTTP_200_OK
+    assert auth_client.delete(f"/api/projects/{project_id}").status_code == status.HTTP_204_NO_CONTENT
+    assert _members(db_session, project_id) == []
+
+
+def test_add_member_ignores_existing_row(auth_client, db_session, test_user):
+    bob = _make_user(db_session, "bob")
+    project_id = auth_client.post(
+        "/api/projects/", json={"name": "Shared", "description": "S"}
+    ).json()["id"]
+
+    # Two assignments that both saw no membership row, as concurrent requests would.
+    add_member(db_session, project_id, bob.id)
+    add_member(db_session, project_id, bob.id)
+    add_member(db_session, project_id, test_user.id)
+    db_session.commit()
+    assert _members(db_session, project_id) == [test_user.id, bob.id]
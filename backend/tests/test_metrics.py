@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from app.core import auth
+from app.core.metrics import (
+    Counter,
+    Histogram,
+    Registry,
+    auth_token_failures_total,
+    http_requests_total,
+    password_hash_queue_seconds,
+)
+
+
+def test_registry_renders_text_exposition_format():
+    registry = Registry()
+    requests = registry.register(Counter("demo_requests_total", "Requests.", ("path",)))
+    latency = registry.register(Histogram("demo_seconds", "Latency.", buckets=(0.1, 1.0)))
+    requests.inc(path='/a"b')
+    requests.inc(2, path='/a"b')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(3.0)
+
+    lines = registry.render().splitlines()
+    assert "# TYPE demo_requests_total counter" in lines
+    assert 'demo_requests_total{path="/a\\"b"} 3.0' in lines
+    assert "# TYPE demo_seconds histogram" in lines
+    assert 'demo_seconds_bucket{le="0.1"} 1.0' in lines
+    assert 'demo_seconds_bucket{le="1.0"} 2.0' in lines
+    assert 'demo_seconds_bucket{le="+Inf"} 3.0' in lines
+    assert "demo_seconds_sum 3.55" in lines
+    assert "demo_seconds_count 3.0" in lines
+
+
+def test_metrics_endpoint_reports_routes_and_pool(auth_client, internal_headers):
+    labels = {"method": "GET", "route": "/api/projects/", "status": "200"}
+    before = http_requests_total.value(**labels)
+    auth_client.get("/api/projects/")
+
+    response = auth_client.get("/metrics", headers=internal_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert http_requests_total.value(**labels) == before + 1
+    body = response.text
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/api/projects/",le="+Inf"}' in body
+    assert 'http_requests_in_progress{method="GET"} 1.0' in body
+    assert 'db_pool_checkouts_total{engine="sync"}' in body
+    assert "password_hash_in_flight 0" in body
+
+
+def test_unmatched_paths_share_one_route_label(client):
+    before = http_requests_total.value(method="GET", route="unmatched", status="404")
+    client.get("/no/such/path/123")
+    client.get("/no/such/path/456")
+    assert http_requests_total.value(method="GET", route="unmatched", status="404") == before + 2
+
+
+def test_token_failures_are_counted_by_reason(client, test_user):
+    invalid = auth_token_failures_total.value(reason="invalid")
+    expired = auth_token_failures_total.value(reason="expired")
+    unknown = auth_token_failures_total.value(reason="unknown_user")
+
+    def get_me(token):
+        return client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert get_me("not-a-jwt").status_code == 401
+    assert get_me(auth.create_access_token({"sub": str(test_user.id)}, timedelta(minutes=-1))).status_code == 401
+    assert get_me(auth.create_access_token({"sub": "999999"})).status_code == 401
+
+    assert auth_token_failures_total.value(reason="invalid") == invalid + 1
+    assert auth_token_failures_total.value(reason="expired") == expired + 1
+    assert auth_token_failures_total.value(reason="unknown_user") == unknown + 1
+
+
+def test_login_records_bcrypt_queue_time(client, test_user):
+    before = password_hash_queue_seconds.count(operation="verify")
+    response = client.post("/api/auth/login", data={"username": "alice", "password": "secretpassword"})
+    assert response.status_code == 200
+    assert password_hash_queue_seconds.count(operation="verify") == before + 1
@@ -0,0 +1,118 @@
+from fastapi import status
+
+from app.models.user import User
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def _collect(client, url: str, limit: int):
+    items, cursor, pages = [], None, 0
+    while True:
+        params = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get(url, params=params)
+        assert resp.status_code == status.HTTP_200_OK
+        batch = resp.json()
+        assert len(batch) <= limit
+        items.extend(batch)
+        pages += 1
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items, pages
+
+
+def test_cursor_round_trip():
+    from datetime import datetime, timezone
+
+    values = [True, None, datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 7]
+    assert decode_cursor(encode_cursor(values)) == values
+
+
+def test_projects_keyset_pages_match_full_list(auth_client):
+    payloads = [
+        {"name": "No Due A", "description": "x"},
+        {"name": "Late", "description": "x", "due_date": "2024-03-01T00:00:00Z"},
+        {"name": "Soon", "description": "x", "due_date": "2024-01-01T00:00:00Z"},
+        {"name": "Soon Twin", "description": "x", "due_date": "2024-01-01T00:00:00Z"},
+        {"name": "No Due B", "description": "x"},
+    ]
+    for payload in payloads:
+        assert auth_client.post("/api/projects/", json=payload).status_code == 201
+
+    full = auth_client.get("/api/projects/")
+    assert "X-Next-Cursor" not in full.headers
+    expected = [p["name"] for p in full.json()]
+    assert expected == ["Soon", "Soon Twin", "Late", "No Due A", "No Due B"]
+
+    for limit in (1, 2, 3):
+        items, pages = _collect(auth_client, "/api/projects/", limit)
+        assert [p["name"] for p in items] == expected
+        assert pages == -(-len(expected) // limit)
+
+
+def test_task_pages_are_stable_under_inserts(auth_client):
+    project_id = auth_client.post(
+        "/api/projects/", json={"name": "P", "description": "D"}
+    ).json()["id"]
+    url = f"/api/project/{project_id}/tasks/"
+    for i in range(5):
+        auth_client.post(url, json={"title": f"T{i}", "description": "d"})
+
+    first = auth_client.get(url, params={"limit": 2})
+    cursor = first.headers["X-Next-Cursor"]
+    auth_client.post(url, json={"title": "Late arrival", "description": "d"})
+
+    rest, _ = [], None
+    while cursor:
+        resp = auth_client.get(url, params={"limit": 2, "cursor": cursor})
+        rest.extend(resp.json())
+        cursor = resp.headers.get("X-Next-Cursor")
+
+    titles = [t["title"] for t in first.json() + rest]
+    assert titles == ["T0", "T1", "T2", "T3", "T4", "Late arrival"]
+
+
+def test_comments_and_users_paginate(auth_client, db_session):
+    project_id = auth_client.post(
+        "/api/projects/", json={"name": "P", "description": "D"}
+    ).json()["id"]
+    url = f"/api/projects/{project_id}/comments/"
+    for i in range(4):
+        auth_client.post(url, json={"body": f"c{i}"})
+    items, pages = _collect(auth_client, url, 3)
+    assert [c["body"] for c in items] == ["c0", "c1", "c2", "c3"]
+    assert pages == 2
+
+    for name in ("dave", "bob", "carol"):
+        db_session.add(User(username=name, email=f"{name}@example.com", hashed_password="x"))
+    db_session.commit()
+    users, _ = _collect(auth_client, "/api/users/", 2)
+    assert [u["username"] for u in users] == ["alice", "bob", "carol", "dave"]
+
+
+def test_invalid_cursor_and_limit_rejected(auth_client):
+    assert auth_client.get("/api/projects/", params={"cursor": "not-a-cursor"}).status_code == 400
+    wrong_shape = encode_cursor([1])
+    assert auth_client.get("/api/projects/", params={"cursor": wrong_shape}).status_code == 400
+    assert auth_client.get("/api/projects/", params={"limit": 0}).status_code == 422
+
+
+def test_cursor_values_must_match_sort_column_types(auth_client):
+    from datetime import datetime
+
+    project_id = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    created = datetime(2024, 1, 1)
+    tampered = {
+        "/api/projects/": [[None, "yesterday", 1], [None, created, "1"], [created, created, True]],
+        f"/api/project/{project_id}/tasks/": [["1"], [1.5], [2**64]],
+        f"/api/projects/{project_id}/comments/": [[1, 1], [created, None, 1]],
+        "/api/users/": [[1, 1], ["alice", {"d": "2024-01-01"}]],
+        "/api/search": [["high", "task", 1], [0.5, 7, 1]],
+    }
+    for url, cursors in tampered.items():
+        for values in cursors:
+            params = {"cursor": encode_cursor(values), "q": "p"}
+            assert auth_client.get(url, params=params).status_code == 400, (url, values)
+
+    valid = encode_cursor([None, created, 1])
+    assert auth_client.get("/api/projects/", params={"cursor": valid}).status_code == 200
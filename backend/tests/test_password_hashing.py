@@ -0,0 +1,64 @@
+import asyncio
+
+from fastapi import status
+from passlib.context import CryptContext
+
+from app.core.password_hasher import PasswordHasher
+from app.models.user import User
+
+
+def test_process_pool_hashes_and_verifies():
+    hasher = PasswordHasher(workers=1, max_concurrency=2)
+
+    async def _exercise():
+        hashed = await hasher.hash("correct horse")
+        results = await asyncio.gather(
+            hasher.verify_and_update("correct horse", hashed),
+            hasher.verify_and_update("wrong", hashed),
+            hasher.verify_and_update("correct horse", hashed),
+        )
+        return hashed, results
+
+    try:
+        hashed, results = asyncio.run(_exercise())
+    finally:
+        hasher.shutdown()
+
+    assert hashed.startswith("$2b$")
+    assert [ok for ok, _ in results] == [True, False, True]
+    stats = hasher.stats()
+    assert stats["completed"] == 4
+    assert stats["in_flight"] == 0
+    assert stats["queue_seconds_total"] >= 0
+
+
+def test_login_rehashes_outdated_cost_factor(client, db_session):
+    old_context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5)
+    user = User(
+        username="legacy",
+        email="legacy@example.com",
+        hashed_password=old_context.hash("secretpassword"),
+    )
+    db_session.add(user)
+    db_session.commit()
+
+    resp = client.post(
+        "/api/auth/login",
+        data={"username": "legacy", "password": "secretpassword"},
+    )
+    assert resp.status_code == status.HTTP_200_OK
+
+    db_session.refresh(user)
+    assert user.hashed_password.startswith("$2b$04$")
+
+    again = client.post(
+        "/api/auth/login",
+        data={"username": "legacy", "password": "secretpassword"},
+    )
+    assert again.status_code == status.HTTP_200_OK
+
+
+def test_password_hashing_stats_endpoint(client, internal_headers):
+    resp = client.get("/internal/auth/password-hashing", headers=internal_headers)
+    assert resp.status_code == status.HTTP_200_OK
+    assert {"completed", "in_flight", "queue_seconds_max"} <= resp.json().keys()
@@ -0,0 +1,111 @@
+import pstats
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+import main
+from app.core import profiling
+from app.core.config import settings
+from app.core.profiling import ProfileStore, ProfilingMiddleware
+
+
+@pytest.fixture()
+def store(tmp_path, monkeypatch):
+    store = ProfileStore(str(tmp_path), max_profiles=3)
+    monkeypatch.setattr(profiling, "profile_store", store)
+    return store
+
+
+@pytest.fixture()
+def profiled_client(auth_client, store):
+    # auth_client installs the dependency overrides on main.app.
+    app = ProfilingMiddleware(main.app, enabled=True, interval_ms=1)
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture()
+def slow_queries(db_session):
+    # Slow statements so the threadpool worker is caught mid-query.
+    slow_down = lambda *args: time.sleep(0.02)  # noqa: E731
+    event.listen(db_session.bind, "before_cursor_execute", slow_down)
+    yield
+    event.remove(db_session.bind, "before_cursor_execute", slow_down)
+
+
+def _frame_names(profile):
+    return {name for name, _, _ in profile["frames"]}
+
+
+def test_header_triggers_profile_with_worker_samples(profiled_client, store, slow_queries, tmp_path, internal_headers):
+    profiled_client.post("/api/projects/", json={"name": "P", "description": "D"})
+    response = profiled_client.get("/api/projects/", headers={"X-Profile": "1", **internal_headers})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+
+    listed = profiled_client.get("/internal/profiles", headers=internal_headers).json()
+    assert [p["id"] for p in listed] == [profile_id]
+    assert listed[0]["route"] == "/api/projects/"
+    assert listed[0]["trigger"] == "header"
+
+    profile = store.load(profile_id)
+    assert any(thread.startswith("worker") for thread in profile["threads"])
+    assert "get_projects_by_user" in _frame_names(profile)
+
+    speedscope = profiled_client.get(f"/internal/profiles/{profile_id}", headers=internal_headers).json()
+    assert speedscope["profiles"][0]["type"] == "sampled"
+    assert len(speedscope["shared"]["frames"]) == len(profile["frames"])
+
+    download = profiled_client.get(
+        f"/internal/profiles/{profile_id}", params={"format": "pstats"}, headers=internal_headers
+    )
+    path = tmp_path / "profile.pstats"
+    path.write_bytes(download.content)
+    stats = pstats.Stats(str(path))
+    assert any(name == "get_projects_by_user" for _, _, name in stats.stats)
+    assert stats.total_tt > 0
+
+
+def test_requests_without_header_are_not_profiled(profiled_client, store):
+    response = profiled_client.get("/api/projects/")
+    assert "x-profile-id" not in response.headers
+    assert store.list() == []
+
+
+def test_header_requires_internal_token(profiled_client, store, internal_headers):
+    response = profiled_client.get("/api/projects/", headers={"X-Profile": "1"})
+    assert "x-profile-id" not in response.headers
+
+    response = profiled_client.get(
+        "/api/projects/", headers={"X-Profile": "1", **internal_headers}
+    )
+    assert "x-profile-id" in response.headers
+    assert len(store.list()) == 1
+
+
+def test_store_keeps_newest_profiles(store):
+    for second in range(5):
+        store.save({"id": f"20260101T00000{second}-0000000{second}", "frames": [], "threads": {}})
+    assert [p["id"] for p in store.list()] == [
+        "20260101T000004-00000004",
+        "20260101T000003-00000003",
+        "20260101T000002-00000002",
+    ]
+
+
+def test_unknown_or_malformed_profile_ids_are_404(profiled_client, internal_headers):
+    for profile_id in ("20260101T000000-deadbeef", "..%2F..%2Fetc%2Fpasswd"):
+        response = profiled_client.get(f"/internal/profiles/{profile_id}", headers=internal_headers)
+        assert response.status_code == 404
+
+
+def test_profiling_stays_off_without_internal_token(auth_client, store, monkeypatch):
+    monkeypatch.setattr(settings, "INTERNAL_API_TOKEN", None)
+    app = ProfilingMiddleware(main.app, enabled=True, sample_rate=1.0, interval_ms=1)
+    with TestClient(app) as client:
+        response = client.get("/api/projects/", headers={"X-Profile": "1", "X-Internal-Token": ""})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert store.list() == []
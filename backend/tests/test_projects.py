@@ -1,4 +1,5 @@
 from fastapi import status
+from sqlalchemy import event
 from app.models.user import User
 
 
@@ -81,3 +82,127 @@ def test_projects_list_sorted_by_due_date_and_created(auth_client):
         "No Due First",
         "No Due Second",
     ]
+
+
+def test_project_full_returns_tasks_comments_and_counts(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "Full", "description": "D"}).json()["id"]
+    tasks_url = f"/api/project/{pid}/tasks/"
+    auth_client.post(tasks_url, json={"title": "A", "description": "d"})
+    auth_client.post(tasks_url, json={"title": "B", "description": "d", "status": "done"})
+    auth_client.post(tasks_url, json={"title": "C", "description": "d"})
+    for i in range(3):
+        auth_client.post(f"/api/projects/{pid}/comments/", json={"body": f"c{i}"})
+
+    statements = []
+    event.listen(
+        db_session.bind,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    r = auth_client.get(f"/api/projects/{pid}/full", params={"comments": 2})
+    assert r.status_code == status.HTTP_200_OK
+    assert len(statements) == 3
+
+    body = r.json()
+    assert body["project"]["id"] == pid
+    assert [t["title"] for t in body["tasks"]] == ["A", "B", "C"]
+    assert [c["body"] for c in body["comments"]] == ["c1", "c2"]
+    assert body["comments"][0]["author"]["username"]
+    assert body["task_counts"] == {"todo": 2, "in_progress": 0, "done": 1}
+
+
+def test_project_full_requires_membership(auth_client, db_session):
+    pid = auth_client.post("/api/projects/", json={"name": "Full", "description": "D"}).json()["id"]
+    other = User(username="eve", email="e@example.com", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    db_session.refresh(other)
+
+    import main
+    from app.dependencies.auth import get_current_user as _get_current_user
+
+    main.app.dependency_overrides[_get_current_user] = lambda: other
+    try:
+        r = auth_client.get(f"/api/projects/{pid}/full")
+        assert r.status_code == status.HTTP_404_NOT_FOUND
+    finally:
+        main.app.dependency_overrides.pop(_get_current_user, None)
+
+
+def test_project_stats_aggregates_in_sql(auth_client, test_user, count_queries):
+    from datetime import datetime, timedelta, timezone
+
+    soon = (datetime.now(timezone.utc) + timedelta(days=3)).isoformat()
+    later = (datetime.now(timezone.utc) + timedelta(days=30)).isoformat()
+    auth_client.post("/api/projects/", json={"name": "A", "description": "D", "status": "active", "due_date": soon})
+    auth_client.post("/api/projects/", json={"name": "B", "description": "D", "status": "active", "due_date": later})
+    pid = auth_client.post("/api/projects/", json={"name": "C", "description": "D", "status": "completed"}).json()["id"]
+    auth_client.post("/api/projects/", json={"name": "D", "description": "D"})
+    auth_client.post(f"/api/project/{pid}/tasks/", json={"title": "T", "description": "d", "status": "done"})
+
+    test_user.id  # reload the expired fixture user outside the counted block
+    with count_queries() as counter:
+        r = auth_client.get("/api/projects/stats")
+    assert r.status_code == status.HTTP_200_OK
+    assert counter.count == 1
+    assert r.json() == {
+        "total": 4,
+        "active": 2,
+        "completed": 1,
+        "due_soon": 1,
+        "tasks_todo": 0,
+        "tasks_in_progress": 0,
+        "tasks_done": 1,
+    }
+
+
+def test_project_task_stats(auth_client, test_user, count_queries):
+    from datetime import datetime, timedelta, timezone
+
+    past = (datetime.now(timezone.utc) - timedelta(days=1)).isoformat()
+    pid = auth_client.post("/api/projects/", json={"name": "S", "description": "D"}).json()["id"]
+    tasks_url = f"/api/project/{pid}/tasks/"
+    auth_client.post(tasks_url, json={"title": "A", "description": "d", "due_date": past})
+    auth_client.post(tasks_url, json={"title": "B", "description": "d", "status": "in_progress"})
+    auth_client.post(tasks_url, json={"title": "C", "description": "d", "status": "done", "due_date": past})
+
+    test_user.id  # reload the expired fixture user outside the counted block
+    with count_queries() as counter:
+        r = auth_client.get(f"/api/projects/{pid}/stats")
+    assert r.status_code == status.HTTP_200_OK
+    assert counter.count == 2
+    assert r.json() == {"total": 3, "todo": 1, "in_progress": 1, "done": 1, "overdue": 1}
+
+    assert auth_client.get("/api/projects/9999/stats").status_code == status.HTTP_404_NOT_FOUND
+
+
+def test_projects_list_filters_in_sql(auth_client):
+    to_create = [
+        {"name": "Active High", "description": "A", "status": "active", "priority": "high",
+         "due_date": "2024-01-10T00:00:00Z"},
+        {"name": "Active Low", "description": "B", "status": "active", "priority": "low"},
+        {"name": "Done High", "description": "C", "status": "completed", "priority": "high",
+         "due_date": "2024-03-10T00:00:00Z"},
+        {"name": "Archived", "description": "D", "status": "active", "is_archived": True},
+    ]
+    for payload in to_create:
+        assert auth_client.post("/api/projects/", json=payload).status_code == status.HTTP_201_CREATED
+
+    def names(**params):
+        resp = auth_client.get("/api/projects/", params=params)
+        assert resp.status_code == status.HTTP_200_OK
+        return [item["name"] for item in resp.json()]
+
+    assert names(status="active") == ["Active High", "Active Low", "Archived"]
+    assert names(priority="high") == ["Active High", "Done High"]
+    assert names(status="active", archived="false") == ["Active High", "Active Low"]
+    assert names(archived="true") == ["Archived"]
+    # Projects without a due date are never "due before".
+    assert names(due_before="2024-02-01T00:00:00Z") == ["Active High"]
+    # Offsets are converted to UTC: 2024-01-10T01:00+02:00 is 2024-01-09T23:00Z.
+    assert names(due_before="2024-01-10T01:00:00+02:00") == []
+    assert names(due_before="2024-01-09T21:30:00-03:00") == ["Active High"]
+    assert auth_client.get("/api/projects/", params={"status": "bogus"}).status_code == 422
+
+    unfiltered = auth_client.get("/api/projects/").headers["ETag"]
+    assert auth_client.get("/api/projects/", params={"status": "active"}).headers["ETag"] != unfiltered
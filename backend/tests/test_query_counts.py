@@ -0,0 +1,149 @@
+import itertools
+
+from app.models.comment import Comment
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.project_task_counter import ProjectTaskCounter
+from app.models.task import Task
+from app.models.user import User
+
+_ids = itertools.count()
+
+
+def _add_users(db_session, n):
+    users = []
+    for _ in range(n):
+        i = next(_ids)
+        users.append(User(username=f"user{i}", email=f"user{i}@example.com", hashed_password="x"))
+    db_session.add_all(users)
+    db_session.commit()
+    return users
+
+
+def _create_project(db_session, owner):
+    project = Project(name="P", description="D", owner_id=owner.id)
+    db_session.add(project)
+    db_session.flush()
+    db_session.add(ProjectMember(project_id=project.id, user_id=owner.id))
+    db_session.commit()
+    return project.id
+
+
+def test_task_list_query_count_is_constant(db_session, test_user, assert_constant_queries):
+    project_id = _create_project(db_session, test_user)
+
+    def add_rows(n):
+        # Distinct assignees so a lazy ``Task.assignee`` load would show up.
+        for user in _add_users(db_session, n):
+            db_session.add(Task(title="T", description="d", project_id=project_id, assignee_id=user.id))
+        db_session.commit()
+
+    assert_constant_queries(f"/api/project/{project_id}/tasks/", add_rows)
+
+
+def test_comment_list_query_count_is_constant(db_session, test_user, assert_constant_queries):
+    project_id = _create_project(db_session, test_user)
+
+    def add_rows(n):
+        # Distinct authors so a lazy ``Comment.author`` load would show up.
+        for user in _add_users(db_session, n):
+            db_session.add(Comment(body="c", project_id=project_id, author_id=user.id))
+        db_session.commit()
+
+    assert_constant_queries(f"/api/projects/{project_id}/comments/", add_rows)
+
+
+def test_project_list_query_count_is_constant(db_session, test_user, assert_constant_queries):
+    def add_rows(n):
+        for _ in range(n):
+            project_id = _create_project(db_session, test_user)
+            owner = _add_users(db_session, 1)[0]
+            db_session.add(Project(name="Shared", description="D", owner_id=owner.id))
+            db_session.add(Task(title="T", description="d", project_id=project_id, assignee_id=test_user.id))
+        db_session.commit()
+
+    assert_constant_queries("/api/projects/", add_rows)
+
+
+def test_project_full_query_count_is_constant(db_session, test_user, assert_constant_queries):
+    project_id = _create_project(db_session, test_user)
+
+    def add_rows(n):
+        for user in _add_users(db_session, n):
+            db_session.add(Task(title="T", description="d", project_id=project_id, assignee_id=user.id))
+            db_session.add(Comment(body="c", project_id=project_id, author_id=user.id))
+        db_session.commit()
+
+    assert_constant_queries(f"/api/projects/{project_id}/full", add_rows, params={"comments": 100})
+
+
+def test_user_list_query_count_is_constant(assert_constant_queries, db_session):
+    assert_constant_queries("/api/users/", lambda n: _add_users(db_session, n))
+
+
+def test_project_changes_query_count_is_constant(db_session, test_user, assert_constant_queries):
+    project_id = _create_project(db_session, test_user)
+
+    def add_rows(n):
+        for user in _add_users(db_session, n):
+            db_session.add(Task(title="T", description="d", project_id=project_id, assignee_id=user.id))
+            db_session.add(Comment(body="c", project_id=project_id, author_id=user.id))
+        db_session.commit()
+
+    assert_constant_queries(f"/api/projects/{project_id}/changes", add_rows)
+
+
+def _task_in_board(db_session, owner):
+    project_id = _create_project(db_session, owner)
+    db_session.add(ProjectTaskCounter(project_id=project_id, todo=1))
+    done = Task(title="Done", description="d", project_id=project_id, status="done", order=1024.0)
+    task = Task(title="T", description="d", project_id=project_id, order=1024.0)
+    db_session.add_all([done, task])
+    db_session.commit()
+    url = f"/api/project/{project_id}/tasks/{task.id}"
+    # Start from an empty identity map, like a fresh request session. The
+    # owner is loaded first because the auth override keeps returning it.
+    owner.id
+    db_session.expunge_all()
+    return url
+
+
+def _statements(count_queries, request):
+    with count_queries() as counter:
+        response = request()
+    assert response.status_code < 300, response.text
+    return response, [statement.split()[0].upper() for statement in counter.statements]
+
+
+def test_task_edit_statement_budget(auth_client, db_session, test_user, count_queries):
+    url = _task_in_board(db_session, test_user)
+
+    # Ownership-checked fetch, UPDATE ... RETURNING, counter bump.
+    response, statements = _statements(count_queries, lambda: auth_client.patch(url, json={"title": "New"}))
+    assert statements == ["SELECT", "UPDATE", "UPDATE"]
+    assert response.json()["title"] == "New"
+
+    response, statements = _statements(
+        count_queries, lambda: auth_client.put(url, json={"title": "T", "description": "e"})
+    )
+    assert statements == ["SELECT", "UPDATE", "UPDATE"]
+    assert response.json()["description"] == "e"
+
+
+def test_task_move_statement_budget(auth_client, db_session, test_user, count_queries):
+    url = _task_in_board(db_session, test_user)
+
+    # The new position is computed inside the UPDATE.
+    response, statements = _statements(count_queries, lambda: auth_client.patch(url, json={"status": "done"}))
+    assert statements == ["SELECT", "UPDATE", "UPDATE"]
+    assert response.json()["status"] == "done"
+    assert response.json()["order"] == 2048.0
+
+
+def test_task_delete_statement_budget(auth_client, db_session, test_user, count_queries):
+    url = _task_in_board(db_session, test_user)
+
+    # DELETE ... RETURNING, counter update, tombstone.
+    _, statements = _statements(count_queries, lambda: auth_client.delete(url))
+    assert statements == ["DELETE", "UPDATE", "INSERT"]
+    assert auth_client.get(url).status_code == 403
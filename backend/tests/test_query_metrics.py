@@ -0,0 +1,64 @@
+import logging
+import re
+import time
+
+from sqlalchemy import event
+
+from app.core.config import settings
+from app.core.query_metrics import params_fingerprint
+
+LOGGER = "app.core.query_metrics"
+
+
+def _server_timing(response):
+    match = re.search(r'db;dur=([\d.]+);desc="(\d+) queries"', response.headers["server-timing"])
+    assert match, response.headers["server-timing"]
+    return float(match.group(1)), int(match.group(2))
+
+
+def test_server_timing_reports_request_queries(auth_client, count_queries):
+    auth_client.post("/api/projects/", json={"name": "P", "description": "D"})
+
+    with count_queries() as counter:
+        response = auth_client.get("/api/projects/")
+    db_ms, queries = _server_timing(response)
+    assert queries == counter.count > 0
+    assert db_ms > 0
+    assert "app;dur=" in response.headers["server-timing"]
+
+
+def test_request_log_has_route_and_db_fields(auth_client, caplog):
+    project_id = auth_client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+
+    with caplog.at_level(logging.INFO, logger=LOGGER):
+        response = auth_client.get(f"/api/projects/{project_id}")
+    _, queries = _server_timing(response)
+    record = next(r for r in caplog.records if getattr(r, "db_queries", None) is not None)
+    assert record.route == "/api/projects/{project_id}"
+    assert record.method == "GET"
+    assert record.status_code == 200
+    assert record.db_queries == queries
+    assert record.db_ms >= 0
+
+
+def test_slow_queries_are_logged_with_route_and_fingerprint(auth_client, db_session, caplog, monkeypatch):
+    monkeypatch.setattr(settings, "SLOW_QUERY_MS", 1)
+    slow_down = lambda *args: time.sleep(0.002)  # noqa: E731
+    event.listen(db_session.bind, "before_cursor_execute", slow_down)
+    try:
+        with caplog.at_level(logging.WARNING, logger=LOGGER):
+            auth_client.get("/api/projects/", params={"limit": 5})
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", slow_down)
+
+    slow = [r for r in caplog.records if hasattr(r, "statement")]
+    assert slow
+    assert all(r.route == "/api/projects/" for r in slow)
+    assert all(r.duration_ms >= 1 for r in slow)
+    assert all(re.fullmatch(r"[0-9a-f]{12}", r.params_fingerprint) for r in slow)
+
+
+def test_params_fingerprint_is_stable_and_hides_values():
+    assert params_fingerprint((1, "secret")) == params_fingerprint((1, "secret"))
+    assert params_fingerprint((1, "secret")) != params_fingerprint((2, "secret"))
+    assert "secret" not in params_fingerprint((1, "secret"))
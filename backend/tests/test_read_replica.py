@@ -0,0 +1,109 @@
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import main
+from app import database
+from app.core.read_your_writes import PRIMARY_COOKIE, is_primary_sticky
+from app.core.user_cache import user_cache
+from app.dependencies.auth import get_current_user
+from app.dependencies.db import get_db
+from app.models.base import Base
+from app.models.user import User
+
+app = main.app
+
+
+@pytest.fixture()
+def replicated(tmp_path, monkeypatch):
+    """Primary and replica as two SQLite files; ``replicate()`` catches the replica up."""
+    primary_path, replica_path = tmp_path / "primary.db", tmp_path / "replica.db"
+    primary = create_engine(f"sqlite:///{primary_path}", connect_args={"check_same_thread": False})
+    replica = create_engine(f"sqlite:///{replica_path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(primary)
+    Base.metadata.create_all(replica)
+
+    session = sessionmaker(bind=primary, autoflush=False)()
+    user = User(username="alice", email="alice@example.com", hashed_password="x", is_active=True)
+    session.add(user)
+    session.commit()
+
+    def replicate():
+        replica.dispose()
+        with sqlite3.connect(primary_path) as source, sqlite3.connect(replica_path) as target:
+            source.backup(target)
+
+    def override_db():
+        yield session
+
+    monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(bind=replica, autoflush=False))
+    app.dependency_overrides[get_db] = override_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    user_cache.clear()
+    try:
+        with TestClient(app) as client:
+            yield client, replicate
+    finally:
+        app.dependency_overrides.clear()
+        session.close()
+        primary.dispose()
+        replica.dispose()
+
+
+def test_reads_go_to_replica_unless_client_just_wrote(replicated):
+    client, replicate = replicated
+
+    created = client.post("/api/projects/", json={"name": "P", "description": "D"})
+    assert created.status_code == 201
+    assert PRIMARY_COOKIE in created.cookies
+
+    # Read-your-writes: the writer still sees its project although the
+    # replica has not caught up.
+    assert [p["name"] for p in client.get("/api/projects/").json()] == ["P"]
+
+    client.cookies.clear()
+    assert client.get("/api/projects/").json() == []
+
+    replicate()
+    assert [p["name"] for p in client.get("/api/projects/").json()] == ["P"]
+
+
+def test_failed_writes_do_not_pin_reads(replicated):
+    client, _ = replicated
+    response = client.put("/api/projects/999", json={"name": "X", "description": "D"})
+    assert response.status_code == 404
+    assert PRIMARY_COOKIE not in response.cookies
+
+
+def test_no_cookie_without_replica(auth_client):
+    response = auth_client.post("/api/projects/", json={"name": "P", "description": "D"})
+    assert response.status_code == 201
+    assert PRIMARY_COOKIE not in response.cookies
+
+
+@pytest.mark.parametrize(
+    "value, sticky",
+    [(None, False), ("garbage", False), ("100", False), ("2000000000", True)],
+)
+def test_primary_cookie_parsing(value, sticky):
+    class Connection:
+        cookies = {} if value is None else {PRIMARY_COOKIE: value}
+
+    assert is_primary_sticky(Connection(), now=1_000_000_000) is sticky
+
+
+def test_sync_endpoints_read_the_primary(replicated):
+    client, _ = replicated
+    project_id = client.post("/api/projects/", json={"name": "P", "description": "D"}).json()["id"]
+    client.post(f"/api/project/{project_id}/tasks/", json={"title": "T", "description": "d"})
+    client.cookies.clear()
+
+    # The replica has not caught up, but the sync cursor must not run ahead of the rows.
+    full = client.get(f"/api/projects/{project_id}/full")
+    assert full.status_code == 200
+    assert [t["title"] for t in full.json()["tasks"]] == ["T"]
+    changes = client.get(f"/api/projects/{project_id}/changes")
+    assert [t["title"] for t in changes.json()["tasks"]] == ["T"]
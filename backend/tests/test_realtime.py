@@ -0,0 +1,153 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.auth import create_access_token
+from app.core.events import Broadcaster, PG_NOTIFY_MAX_BYTES, broadcaster, emit
+from app.models.user import User
+from app.utils.security import hash_password
+
+
+def _token(user):
+    return create_access_token({"sub": str(user.id)})
+
+
+def _project(auth_client):
+    return auth_client.post("/api/projects/", json={"name": "Live", "description": "D"}).json()["id"]
+
+
+def test_task_changes_are_pushed(auth_client, test_user):
+    pid = _project(auth_client)
+    url = f"/api/project/{pid}/tasks/"
+
+    with auth_client.websocket_connect(f"/api/ws/projects/{pid}?token={_token(test_user)}") as ws:
+        auth_client.post(url, json={"title": "A", "description": "d"})
+        created = ws.receive_json()
+        assert created["type"] == "tasks.updated"
+        assert created["project_id"] == pid
+        [task] = created["tasks"]
+        assert task["title"] == "A" and task["status"] == "todo"
+
+        auth_client.patch(f"{url}{task['id']}", json={"status": "done"})
+        moved = ws.receive_json()
+        assert moved["tasks"][0]["id"] == task["id"]
+        assert moved["tasks"][0]["status"] == "done"
+
+        auth_client.delete(f"{url}{task['id']}")
+        assert ws.receive_json() == {"type": "tasks.deleted", "project_id": pid, "ids": [task["id"]]}
+
+
+def test_reorder_and_bulk_changes_are_pushed(auth_client, test_user):
+    pid = _project(auth_client)
+    bulk = f"/api/project/{pid}/tasks/bulk"
+
+    with auth_client.websocket_connect(f"/api/ws/projects/{pid}?token={_token(test_user)}") as ws:
+        results = auth_client.post(
+            bulk, json={"items": [{"title": t, "description": "d"} for t in "ABC"]}
+        ).json()["results"]
+        ids = [r["id"] for r in results]
+        event = ws.receive_json()
+        assert [t["id"] for t in event["tasks"]] == ids
+
+        auth_client.post(
+            f"/api/project/{pid}/tasks/reorder",
+            json={"moves": [{"task_id": ids[2], "after_id": None, "before_id": ids[0]}]},
+        )
+        event = ws.receive_json()
+        assert [t["id"] for t in event["tasks"]] == [ids[2]]
+
+        auth_client.request("DELETE", bulk, json={"ids": ids[:2]})
+        assert sorted(ws.receive_json()["ids"]) == ids[:2]
+
+
+def test_comment_changes_are_pushed(auth_client, test_user):
+    pid = _project(auth_client)
+    url = f"/api/projects/{pid}/comments/"
+
+    with auth_client.websocket_connect(f"/api/ws/projects/{pid}?token={_token(test_user)}") as ws:
+        comment = auth_client.post(url, json={"body": "hello"}).json()
+        event = ws.receive_json()
+        assert event["type"] == "comments.updated"
+        assert event["comments"][0]["author"] == {"id": test_user.id, "username": "alice"}
+
+        auth_client.patch(f"{url}{comment['id']}", json={"body": "edited"})
+        event = ws.receive_json()
+        assert event["comments"][0]["edited"] is True
+
+        auth_client.delete(f"{url}{comment['id']}")
+        assert ws.receive_json()["ids"] == [comment["id"]]
+
+
+def test_events_are_scoped_to_the_project(auth_client, test_user):
+    first, second = _project(auth_client), _project(auth_client)
+
+    with auth_client.websocket_connect(f"/api/ws/projects/{first}?token={_token(test_user)}") as ws:
+        auth_client.post(f"/api/project/{second}/tasks/", json={"title": "Other", "description": "d"})
+        auth_client.post(f"/api/project/{first}/tasks/", json={"title": "Mine", "description": "d"})
+        assert ws.receive_json()["tasks"][0]["title"] == "Mine"
+
+
+def test_rolled_back_changes_are_not_published(db_session, client, test_user):
+    pid = _project_for(client, test_user)
+    with client.websocket_connect(f"/api/ws/projects/{pid}?token={_token(test_user)}") as ws:
+        db_session.execute(text("SELECT 1"))
+        emit(db_session, pid, "tasks.deleted", ids=[999])
+        db_session.rollback()
+        emit(db_session, pid, "tasks.deleted", ids=[1])
+        db_session.commit()
+        assert ws.receive_json()["ids"] == [1]
+
+
+def test_socket_rejects_bad_token_and_non_members(client, db_session, test_user):
+    pid = _project_for(client, test_user)
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/api/ws/projects/{pid}?token=garbage"):
+            pass
+    assert exc.value.code == 1008
+
+    stranger = User(username="bob", email="bob@example.com", hashed_password=hash_password("pw"))
+    db_session.add(stranger)
+    db_session.commit()
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/api/ws/projects/{pid}?token={_token(stranger)}"):
+            pass
+    assert exc.value.code == 1008
+
+
+def test_subscription_is_removed_on_disconnect(auth_client, test_user):
+    pid = _project(auth_client)
+    with auth_client.websocket_connect(f"/api/ws/projects/{pid}?token={_token(test_user)}"):
+        assert broadcaster.subscriber_count(pid) == 1
+    assert broadcaster.subscriber_count(pid) == 0
+
+
+def test_slow_subscriber_gets_resync():
+    async def scenario():
+        hub = Broadcaster(queue_size=2)
+        subscription = hub.subscribe(7)
+        hub.publish([{"type": "tasks.deleted", "project_id": 7, "ids": [i]} for i in range(5)])
+        await asyncio.sleep(0)
+        messages = []
+        while not subscription.queue.empty():
+            messages.append(subscription.queue.get_nowait())
+        return messages
+
+    messages = asyncio.run(scenario())
+    assert messages[0] == '{"type":"resync","project_id":7}'
+    assert len(messages) <= 2
+
+
+def test_oversized_notify_payload_becomes_resync():
+    hub = Broadcaster(backend="postgres")
+    statement = hub.notify_statement(
+        [{"type": "tasks.updated", "project_id": 3, "tasks": ["x" * PG_NOTIFY_MAX_BYTES]}]
+    )
+    params = statement.compile().params
+    assert list(params.values())[1] == '{"type":"resync","project_id":3}'
+
+
+def _project_for(client, user):
+    headers = {"Authorization": f"Bearer {_token(user)}"}
+    return client.post("/api/projects/", json={"name": "P", "description": "D"}, headers=headers).json()["id"]
@@ -0,0 +1,69 @@
+from fastapi import status
+
+from app.dependencies.pagination import NEXT_CURSOR_HEADER
+from app.models.project import Project
+from app.models.user import User
+
+
+def _search(client, q, **params):
+    return client.get("/api/search", params={"q": q, **params})
+
+
+def test_search_across_projects_tasks_and_comments(auth_client):
+    pid = auth_client.post(
+        "/api/projects/", json={"name": "Falcon launch", "description": "Rocket rollout"}
+    ).json()["id"]
+    auth_client.post(f"/api/project/{pid}/tasks/", json={"title": "Fuel check", "description": "Falcon tanks"})
+    auth_client.post(f"/api/projects/{pid}/comments/", json={"body": "The falcon is ready"})
+    auth_client.post("/api/projects/", json={"name": "Other", "description": "Nothing here"})
+
+    resp = _search(auth_client, "falcon")
+    assert resp.status_code == status.HTTP_200_OK
+    hits = resp.json()
+    assert sorted(h["kind"] for h in hits) == ["comment", "project", "task"]
+    assert all(h["project_id"] == pid for h in hits)
+
+    assert [h["title"] for h in _search(auth_client, "fuel").json()] == ["Fuel check"]
+    assert _search(auth_client, "falcon rocket").json()[0]["kind"] == "project"
+    assert _search(auth_client, "zeppelin").json() == []
+    assert _search(auth_client, '"*').json() == []
+
+
+def test_search_follows_updates_and_deletes(auth_client):
+    pid = auth_client.post("/api/projects/", json={"name": "Alpha", "description": "D"}).json()["id"]
+    auth_client.put(f"/api/projects/{pid}", json={"name": "Bravo"})
+    assert _search(auth_client, "alpha").json() == []
+    assert [h["id"] for h in _search(auth_client, "bravo").json()] == [pid]
+
+    auth_client.delete(f"/api/projects/{pid}")
+    assert _search(auth_client, "bravo").json() == []
+
+
+def test_search_is_scoped_to_accessible_projects(auth_client, db_session):
+    other = User(username="bob", email="bob@example.com", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    db_session.add(Project(name="Secret falcon", description="D", owner_id=other.id))
+    db_session.commit()
+
+    assert _search(auth_client, "secret").json() == []
+
+
+def test_search_paginates_ranked_hits(auth_client):
+    pid = auth_client.post("/api/projects/", json={"name": "Board", "description": "D"}).json()["id"]
+    for i in range(5):
+        auth_client.post(f"/api/project/{pid}/tasks/", json={"title": f"Deploy {i}", "description": "deploy"})
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        resp = _search(auth_client, "deploy", **params)
+        seen += [h["id"] for h in resp.json()]
+        cursor = resp.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            break
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
@@ -0,0 +1,140 @@
+from fastapi import status
+from sqlalchemy import event
+
+
+def _create_project(auth_client):
+    return auth_client.post(
+        "/api/projects/", json={"name": "Bulk", "description": "B"}
+    ).json()["id"]
+
+
+def _count_statements(db_session, prefix):
+    statements = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(prefix):
+            statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", _before_cursor_execute)
+    return statements
+
+
+def _count_commits(db_session):
+    commits = []
+    event.listen(db_session.bind, "commit", lambda conn: commits.append(conn))
+    return commits
+
+
+def test_bulk_create_uses_single_transaction(auth_client, db_session):
+    project_id = _create_project(auth_client)
+    inserts = _count_statements(db_session, "INSERT INTO TASKS")
+    commits = _count_commits(db_session)
+
+    items = [{"title": f"T{i}", "description": "d"} for i in range(50)]
+    items[3]["status"] = "done"
+    resp = auth_client.post(f"/api/project/{project_id}/tasks/bulk", json={"items": items})
+    assert resp.status_code == status.HTTP_201_CREATED
+    assert len(commits) == 1
+    # Ordered RETURNING is batched into one statement where the dialect can
+    # correlate rows (PostgreSQL); SQLite falls back to one INSERT per row.
+    if db_session.bind.dialect.name == "postgresql":
+        assert len(inserts) == 1
+
+    results = resp.json()["results"]
+    assert [r["index"] for r in results] == list(range(50))
+    assert all(r["status"] == "created" for r in results)
+    assert [r["task"]["title"] for r in results] == [f"T{i}" for i in range(50)]
+    assert results[0]["task"]["order"] == 1024.0
+    assert results[4]["task"]["order"] == 4 * 1024.0
+    assert results[3]["task"]["order"] == 1024.0
+
+    tasks = auth_client.get(f"/api/project/{project_id}/tasks/").json()
+    assert len(tasks) == 50
+
+
+def test_bulk_update_reports_missing_ids(auth_client):
+    project_id = _create_project(auth_client)
+    created = auth_client.post(
+        f"/api/project/{project_id}/tasks/bulk",
+        json={"items": [{"title": "A", "description": "d"}, {"title": "B", "description": "d"}]},
+    ).json()["results"]
+    ids = [r["id"] for r in created]
+
+    resp = auth_client.patch(
+        f"/api/project/{project_id}/tasks/bulk",
+        json={"items": [
+            {"id": ids[0], "status": "done"},
+            {"id": 9999, "title": "X"},
+            {"id": ids[1], "title": "B2", "priority": "high"},
+        ]},
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    results = resp.json()["results"]
+    assert [r["status"] for r in results] == ["updated", "not_found", "updated"]
+    assert results[0]["task"]["status"] == "done"
+    assert results[0]["task"]["order"] == 1024.0
+    assert results[2]["task"]["title"] == "B2"
+    assert results[2]["task"]["priority"] == "high"
+
+
+def test_bulk_delete(auth_client):
+    project_id = _create_project(auth_client)
+    created = auth_client.post(
+        f"/api/project/{project_id}/tasks/bulk",
+        json={"items": [{"title": t, "description": "d"} for t in "ABC"]},
+    ).json()["results"]
+    ids = [r["id"] for r in created]
+
+    resp = auth_client.request(
+        "DELETE", f"/api/project/{project_id}/tasks/bulk", json={"ids": [ids[0], 9999, ids[2]]}
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert [r["status"] for r in resp.json()["results"]] == ["deleted", "not_found", "deleted"]
+
+    remaining = auth_client.get(f"/api/project/{project_id}/tasks/").json()
+    assert [t["title"] for t in remaining] == ["B"]
+
+
+def test_bulk_requires_project_ownership(auth_client):
+    resp = auth_client.post(
+        "/api/project/9999/tasks/bulk", json={"items": [{"title": "A", "description": "d"}]}
+    )
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+
+
+def test_bulk_rejects_empty_batch(auth_client):
+    project_id = _create_project(auth_client)
+    resp = auth_client.post(f"/api/project/{project_id}/tasks/bulk", json={"items": []})
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_bulk_create_rejects_null_status_as_validation_error(auth_client):
+    project_id = _create_project(auth_client)
+    url = f"/api/project/{project_id}/tasks/bulk"
+    for field in ("status", "priority"):
+        resp = auth_client.post(url, json={"items": [{"title": "A", "description": "d", field: None}]})
+        assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    resp = auth_client.post(
+        f"/api/project/{project_id}/tasks/", json={"title": "A", "description": "d", "status": None}
+    )
+    assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert auth_client.get(f"/api/project/{project_id}/tasks/").json() == []
+
+
+def test_update_rejects_null_status_as_validation_error(auth_client):
+    project_id = _create_project(auth_client)
+    url = f"/api/project/{project_id}/tasks/"
+    auth_client.post(url, json={"title": "A", "description": "d"})
+    task_id = auth_client.get(url).json()[0]["id"]
+
+    for field in ("status", "priority", "title"):
+        resp = auth_client.patch(f"{url}bulk", json={"items": [{"id": task_id, field: None}]})
+        assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        resp = auth_client.patch(f"{url}{task_id}", json={field: None})
+        assert resp.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    # Nullable fields can still be cleared, and omitted fields stay unchanged.
+    resp = auth_client.patch(f"{url}{task_id}", json={"due_date": None, "assignee_id": None})
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["status"] == "todo"
@@ -0,0 +1,117 @@
+from fastapi import status
+from sqlalchemy import event
+
+
+def _setup_column(auth_client, titles):
+    project_id = auth_client.post(
+        "/api/projects/", json={"name": "Board", "description": "B"}
+    ).json()["id"]
+    url = f"/api/project/{project_id}/tasks/"
+    for title in titles:
+        auth_client.post(url, json={"title": title, "description": "d"})
+    ids = {t["title"]: t["id"] for t in auth_client.get(url).json()}
+    return project_id, ids
+
+
+def _column(auth_client, project_id, column):
+    tasks = auth_client.get(f"/api/project/{project_id}/tasks/").json()
+    in_column = [t for t in tasks if t["status"] == column]
+    return [t["title"] for t in sorted(in_column, key=lambda t: (t["order"], t["id"]))]
+
+
+def _reorder(auth_client, project_id, *moves):
+    return auth_client.post(
+        f"/api/project/{project_id}/tasks/reorder", json={"moves": list(moves)}
+    )
+
+
+def _count_task_updates(db_session):
+    updates = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE TASKS"):
+            updates.append(parameters)
+
+    event.listen(db_session.bind, "before_cursor_execute", _before_cursor_execute)
+    return updates
+
+
+def test_new_tasks_append_to_column(auth_client):
+    project_id, _ = _setup_column(auth_client, ["A", "B", "C"])
+    tasks = auth_client.get(f"/api/project/{project_id}/tasks/").json()
+    assert [t["order"] for t in tasks] == [1024.0, 2048.0, 3072.0]
+
+
+def test_move_within_column_updates_single_row(auth_client, db_session):
+    project_id, ids = _setup_column(auth_client, ["A", "B", "C"])
+    updates = _count_task_updates(db_session)
+
+    resp = _reorder(auth_client, project_id, {"task_id": ids["C"], "after_id": ids["A"]})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [t["title"] for t in resp.json()] == ["C"]
+    assert resp.json()[0]["order"] == 1536.0
+    assert len(updates) == 1
+    assert _column(auth_client, project_id, "todo") == ["A", "C", "B"]
+
+    resp = _reorder(auth_client, project_id, {"task_id": ids["B"], "before_id": ids["A"]})
+    assert resp.status_code == status.HTTP_200_OK
+    assert _column(auth_client, project_id, "todo") == ["B", "A", "C"]
+
+
+def test_batch_moves_across_columns(auth_client):
+    project_id, ids = _setup_column(auth_client, ["A", "B", "C"])
+
+    resp = _reorder(
+        auth_client,
+        project_id,
+        {"task_id": ids["A"], "status": "in_progress"},
+        {"task_id": ids["C"], "status": "in_progress", "before_id": ids["A"]},
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert {t["title"] for t in resp.json()} == {"A", "C"}
+    assert _column(auth_client, project_id, "in_progress") == ["C", "A"]
+    assert _column(auth_client, project_id, "todo") == ["B"]
+
+
+def test_exhausted_gap_renumbers_column(auth_client):
+    project_id, ids = _setup_column(auth_client, ["A", "B", "C"])
+    url = f"/api/project/{project_id}/tasks"
+    auth_client.patch(f"{url}/{ids['A']}", json={"order": 1.0})
+    auth_client.patch(f"{url}/{ids['B']}", json={"order": 1.0000000001})
+
+    resp = _reorder(auth_client, project_id, {"task_id": ids["C"], "after_id": ids["A"]})
+    assert resp.status_code == status.HTTP_200_OK
+    assert [t["order"] for t in resp.json()] == [1024.0, 2048.0, 3072.0]
+    assert _column(auth_client, project_id, "todo") == ["A", "C", "B"]
+
+
+def test_reorder_rejects_neighbour_from_other_column(auth_client):
+    project_id, ids = _setup_column(auth_client, ["A", "B"])
+    resp = _reorder(
+        auth_client,
+        project_id,
+        {"task_id": ids["A"], "status": "done", "after_id": ids["B"]},
+    )
+    assert resp.status_code == status.HTTP_400_BAD_REQUEST
+
+    resp = _reorder(auth_client, project_id, {"task_id": 9999})
+    assert resp.status_code == status.HTTP_403_FORBIDDEN
+    assert _column(auth_client, project_id, "todo") == ["A", "B"]
+
+
+def test_reorder_rejects_swapped_or_distant_neighbours(auth_client):
+    project_id, ids = _setup_column(auth_client, ["A", "B", "C", "D"])
+
+    swapped = {"task_id": ids["D"], "after_id": ids["B"], "before_id": ids["A"]}
+    distant = {"task_id": ids["D"], "after_id": ids["A"], "before_id": ids["C"]}
+    for move in (swapped, distant):
+        resp = _reorder(auth_client, project_id, move)
+        assert resp.status_code == status.HTTP_400_BAD_REQUEST
+    assert _column(auth_client, project_id, "todo") == ["A", "B", "C", "D"]
+
+    # The moving card itself may sit between the two neighbours.
+    resp = _reorder(auth_client, project_id, {"task_id": ids["B"], "after_id": ids["A"], "before_id": ids["C"]})
+    assert resp.status_code == status.HTTP_200_OK
+    resp = _reorder(auth_client, project_id, {"task_id": ids["D"], "after_id": ids["B"], "before_id": ids["C"]})
+    assert resp.status_code == status.HTTP_200_OK
+    assert _column(auth_client, project_id, "todo") == ["A", "B", "D", "C"]
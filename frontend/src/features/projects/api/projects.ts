@@ -4,7 +4,8 @@ import {
   ProjectPriority,
   ProjectStatus,
 } from "../../../types/project";
-import { Task } from "../../../types/task";
+import { ProjectComment } from "../../../types/comment";
+import { Task, TaskStatus } from "../../../types/task";
 
 export type ProjectCreatePayload = {
   name: string;
@@ -25,8 +26,32 @@ export type ProjectUpdatePayload = Partial<{
   owner_id: number;
 }>;
 
-export const fetchProjects = async (): Promise<Project[]> => {
-  const response = await api.get("projects/");
+export type ProjectListFilters = {
+  status?: ProjectStatus;
+  priority?: ProjectPriority;
+  archived?: boolean;
+  due_before?: string;
+};
+
+export const fetchProjects = async (
+  filters: ProjectListFilters = {}
+): Promise<Project[]> => {
+  const response = await api.get("projects/", { params: filters });
+  return response.data;
+};
+
+export type ProjectStats = {
+  total: number;
+  active: number;
+  completed: number;
+  due_soon: number;
+  tasks_todo: number;
+  tasks_in_progress: number;
+  tasks_done: number;
+};
+
+export const fetchProjectStats = async (): Promise<ProjectStats> => {
+  const response = await api.get("projects/stats");
   return response.data;
 };
 
@@ -42,24 +67,40 @@ export const getProjectById = async (projectId: number): Promise<Project> => {
   return response.data;
 };
 
-export const getProjectWithTasks = async (
-  projectId: number
-): Promise<{ project: Project; tasks: Task[] }> => {
-  const projectRes = await api.get(`projects/${projectId}`);
+export type ProjectWithTasks = {
+  project: Project;
+  tasks: Task[];
+  comments: ProjectComment[];
+  task_counts: Record<TaskStatus, number>;
+  cursor: string;
+};
 
-  let tasks: Task[] = [];
-  try {
-    const tasksRes = await api.get(`project/${projectId}/tasks/`);
-    tasks = tasksRes.data;
-  } catch (error: any) {
-    if (error.response && error.response.status === 404) {
-      tasks = [];
-    } else {
-      throw error;
-    }
-  }
+export type ProjectChanges = {
+  tasks: Task[];
+  comments: ProjectComment[];
+  deleted_task_ids: number[];
+  deleted_comment_ids: number[];
+  cursor: string;
+};
 
-  return { project: projectRes.data, tasks };
+export const getProjectWithTasks = async (
+  projectId: number,
+  commentLimit = 20
+): Promise<ProjectWithTasks> => {
+  const response = await api.get(`projects/${projectId}/full`, {
+    params: { comments: commentLimit },
+  });
+  return response.data;
+};
+
+export const getProjectChanges = async (
+  projectId: number,
+  since: string
+): Promise<ProjectChanges> => {
+  const response = await api.get(`projects/${projectId}/changes`, {
+    params: { since },
+  });
+  return response.data;
 };
 
 export const updateProject = async (
@@ -1,15 +1,29 @@
-import { useQuery, UseQueryOptions } from "@tanstack/react-query";
-import { getProjectWithTasks } from "../api/projects";
-import { Project } from "../../../types/project";
-import { Task } from "../../../types/task";
+import { useQuery, useQueryClient, UseQueryOptions } from "@tanstack/react-query";
+import { getProjectWithTasks, ProjectWithTasks } from "../api/projects";
+import { ProjectComment } from "../../../types/comment";
+
+// Latest comments requested with the project; a thread this short arrives whole.
+const COMMENT_LIMIT = 20;
 
 export const useProjectDetails = (
   projectId: number,
-  options?: UseQueryOptions<{ project: Project; tasks: Task[] }>
+  options?: UseQueryOptions<ProjectWithTasks>
 ) => {
+  const queryClient = useQueryClient();
   return useQuery({
     queryKey: ["project", projectId],
-    queryFn: () => getProjectWithTasks(projectId),
+    queryFn: async () => {
+      const details = await getProjectWithTasks(projectId, COMMENT_LIMIT);
+      // Seed the comments card so the page loads in one round-trip. Longer
+      // threads come back truncated; the card then fetches the full list.
+      if (details.comments.length < COMMENT_LIMIT) {
+        queryClient.setQueryData<ProjectComment[]>(
+          ["project", projectId, "comments"],
+          details.comments
+        );
+      }
+      return details;
+    },
     enabled: !!projectId,
     ...options,
   });
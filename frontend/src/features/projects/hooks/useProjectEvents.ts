@@ -0,0 +1,174 @@
+import { useEffect } from "react";
+import { QueryClient, useQueryClient } from "@tanstack/react-query";
+import { useAuth } from "../../auth/hooks/useAuth";
+import { getProjectChanges, ProjectWithTasks } from "../api/projects";
+import { ProjectComment } from "../../../types/comment";
+import { Task, TaskStatus } from "../../../types/task";
+
+type ProjectEvent =
+  | { type: "tasks.updated"; project_id: number; tasks: Task[] }
+  | { type: "tasks.deleted"; project_id: number; ids: number[] }
+  | { type: "comments.updated"; project_id: number; comments: ProjectComment[] }
+  | { type: "comments.deleted"; project_id: number; ids: number[] }
+  | { type: "resync"; project_id: number };
+
+const POLICY_VIOLATION = 1008;
+const MAX_RECONNECT_DELAY_MS = 30_000;
+
+const countTasks = (tasks: Task[]): Record<TaskStatus, number> => {
+  const counts: Record<TaskStatus, number> = { todo: 0, in_progress: 0, done: 0 };
+  tasks.forEach((task) => {
+    counts[task.status] += 1;
+  });
+  return counts;
+};
+
+const upsert = <T extends { id: number }>(items: T[], changed: T[]): T[] => {
+  const byId = new Map(changed.map((item) => [item.id, item]));
+  const merged = items.map((item) => byId.get(item.id) ?? item);
+  const known = new Set(items.map((item) => item.id));
+  return merged.concat(changed.filter((item) => !known.has(item.id)));
+};
+
+const applyEvent = (
+  queryClient: QueryClient,
+  projectId: number,
+  event: ProjectEvent
+) => {
+  const detailsKey = ["project", projectId];
+  const commentsKey = ["project", projectId, "comments"];
+
+  const updateTasks = (update: (tasks: Task[]) => Task[]) => {
+    queryClient.setQueryData<ProjectWithTasks>(detailsKey, (previous) => {
+      if (!previous) return previous;
+      const tasks = update(previous.tasks);
+      return { ...previous, tasks, task_counts: countTasks(tasks) };
+    });
+  };
+
+  const updateComments = (
+    update: (comments: ProjectComment[]) => ProjectComment[]
+  ) => {
+    queryClient.setQueryData<ProjectComment[]>(commentsKey, (previous) =>
+      previous ? update(previous) : previous
+    );
+    queryClient.setQueryData<ProjectWithTasks>(detailsKey, (previous) =>
+      previous ? { ...previous, comments: update(previous.comments) } : previous
+    );
+  };
+
+  switch (event.type) {
+    case "tasks.updated":
+      updateTasks((tasks) => upsert(tasks, event.tasks));
+      break;
+    case "tasks.deleted": {
+      const removed = new Set(event.ids);
+      updateTasks((tasks) => tasks.filter((task) => !removed.has(task.id)));
+      break;
+    }
+    case "comments.updated":
+      updateComments((comments) => upsert(comments, event.comments));
+      break;
+    case "comments.deleted": {
+      const removed = new Set(event.ids);
+      updateComments((comments) =>
+        comments.filter((comment) => !removed.has(comment.id))
+      );
+      break;
+    }
+    case "resync":
+      queryClient.invalidateQueries({ queryKey: detailsKey });
+      break;
+  }
+};
+
+/**
+ * Catches up after a reconnect by fetching only what changed since the
+ * cached board was loaded; falls back to a full refetch when the cursor
+ * has expired or the request fails.
+ */
+const catchUp = async (queryClient: QueryClient, projectId: number) => {
+  const detailsKey = ["project", projectId];
+  const cached = queryClient.getQueryData<ProjectWithTasks>(detailsKey);
+  if (!cached?.cursor) {
+    queryClient.invalidateQueries({ queryKey: detailsKey });
+    return;
+  }
+
+  try {
+    const changes = await getProjectChanges(projectId, cached.cursor);
+    const events: ProjectEvent[] = [
+      { type: "tasks.updated", project_id: projectId, tasks: changes.tasks },
+      { type: "tasks.deleted", project_id: projectId, ids: changes.deleted_task_ids },
+      { type: "comments.updated", project_id: projectId, comments: changes.comments },
+      {
+        type: "comments.deleted",
+        project_id: projectId,
+        ids: changes.deleted_comment_ids,
+      },
+    ];
+    events.forEach((event) => applyEvent(queryClient, projectId, event));
+    queryClient.setQueryData<ProjectWithTasks>(detailsKey, (previous) =>
+      previous ? { ...previous, cursor: changes.cursor } : previous
+    );
+  } catch {
+    queryClient.invalidateQueries({ queryKey: detailsKey });
+  }
+};
+
+const socketUrl = (projectId: number, token: string) => {
+  const protocol = window.location.protocol === "https:" ? "wss:" : "ws:";
+  return `${protocol}//${window.location.host}/api/ws/projects/${projectId}?token=${encodeURIComponent(
+    token
+  )}`;
+};
+
+/**
+ * Keeps the project details and comment caches live by applying the
+ * task and comment changes pushed over `/api/ws/projects/{id}`.
+ * Reconnects with backoff and then fetches the changes made while
+ * disconnected from `/projects/{id}/changes`.
+ */
+export const useProjectEvents = (projectId: number) => {
+  const queryClient = useQueryClient();
+  const { token } = useAuth();
+
+  useEffect(() => {
+    if (!projectId || !token) return;
+
+    let socket: WebSocket | null = null;
+    let retryTimer: ReturnType<typeof setTimeout> | undefined;
+    let attempts = 0;
+    let stopped = false;
+
+    const connect = () => {
+      socket = new WebSocket(socketUrl(projectId, token));
+
+      socket.onopen = () => {
+        if (attempts > 0) {
+          void catchUp(queryClient, projectId);
+        }
+        attempts = 0;
+      };
+
+      socket.onmessage = (message) => {
+        applyEvent(queryClient, projectId, JSON.parse(message.data));
+      };
+
+      socket.onclose = (event) => {
+        if (stopped || event.code === POLICY_VIOLATION) return;
+        const delay = Math.min(1000 * 2 ** attempts, MAX_RECONNECT_DELAY_MS);
+        attempts += 1;
+        retryTimer = setTimeout(connect, delay);
+      };
+    };
+
+    connect();
+
+    return () => {
+      stopped = true;
+      clearTimeout(retryTimer);
+      socket?.close();
+    };
+  }, [projectId, token, queryClient]);
+};
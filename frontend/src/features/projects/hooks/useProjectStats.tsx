@@ -3,10 +3,16 @@ import TrendingUpIcon from "@mui/icons-material/TrendingUp";
 import EventBusyIcon from "@mui/icons-material/EventBusy";
 import CheckCircleOutlineIcon from "@mui/icons-material/CheckCircleOutline";
 import { useMemo } from "react";
+import { useQuery } from "@tanstack/react-query";
 import { StatCardData } from "../components/ProjectsStatsGrid";
-import { Project } from "../../../types/project";
+import { fetchProjectStats, ProjectStats } from "../api/projects";
 
-const DAY_IN_MS = 24 * 60 * 60 * 1000;
+const emptyStats: ProjectStats = {
+  total: 0,
+  active: 0,
+  completed: 0,
+  due_soon: 0,
+};
 
 const statsIcons: Record<StatCardData["palette"], React.ReactElement> = {
   primary: <FolderOpenIcon fontSize="small" />,
@@ -15,33 +21,14 @@ const statsIcons: Record<StatCardData["palette"], React.ReactElement> = {
   info: <CheckCircleOutlineIcon fontSize="small" />,
 };
 
-const computeStats = (projects: Project[]) => {
-  const now = new Date();
-  const total = projects.length;
-  let active = 0;
-  let completed = 0;
-  let dueSoon = 0;
-
-  projects.forEach((project) => {
-    if (project.status === "active") active += 1;
-    if (project.status === "completed") completed += 1;
-    if (project.due_date) {
-      const dueDate = new Date(project.due_date);
-      if (!Number.isNaN(dueDate.getTime())) {
-        const diffDays = Math.ceil(
-          (dueDate.getTime() - now.getTime()) / DAY_IN_MS
-        );
-        if (diffDays >= 0 && diffDays <= 7) dueSoon += 1;
-      }
-    }
+export function useProjectStats() {
+  const { data } = useQuery({
+    queryKey: ["projects", "stats"],
+    queryFn: fetchProjectStats,
   });
 
-  return { total, active, completed, dueSoon };
-};
-
-export function useProjectStats(projects: Project[] | undefined) {
   return useMemo<StatCardData[]>(() => {
-    const stats = computeStats(projects ?? []);
+    const stats = data ?? emptyStats;
     const ratio = (value: number) =>
       stats.total > 0 ? Math.min(Math.max(value / stats.total, 0), 1) : 0;
 
@@ -64,11 +51,11 @@ export function useProjectStats(projects: Project[] | undefined) {
       },
       {
         label: "Due within 7 days",
-        value: stats.dueSoon,
+        value: stats.due_soon,
         caption: "Deadlines approaching",
         icon: statsIcons.warning,
         palette: "warning",
-        ratio: ratio(stats.dueSoon),
+        ratio: ratio(stats.due_soon),
       },
       {
         label: "Completed",
@@ -79,7 +66,7 @@ export function useProjectStats(projects: Project[] | undefined) {
         ratio: ratio(stats.completed),
       },
     ];
-  }, [projects]);
+  }, [data]);
 }
 
 export default useProjectStats;
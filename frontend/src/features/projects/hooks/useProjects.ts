@@ -1,9 +1,9 @@
 import { useQuery } from "@tanstack/react-query";
-import { fetchProjects } from "../api/projects";
+import { fetchProjects, ProjectListFilters } from "../api/projects";
 
-export const useProjects = () => {
+export const useProjects = (filters: ProjectListFilters = {}) => {
   return useQuery({
-    queryKey: ["projects"],
-    queryFn: fetchProjects,
+    queryKey: ["projects", "list", filters],
+    queryFn: () => fetchProjects(filters),
   });
 };
@@ -1,9 +1,12 @@
 import { useMutation, useQueryClient } from "@tanstack/react-query";
-import { updateProject, ProjectUpdatePayload } from "../api/projects";
+import {
+  updateProject,
+  ProjectUpdatePayload,
+  ProjectWithTasks,
+} from "../api/projects";
 import { Project } from "../../../types/project";
-import { Task } from "../../../types/task";
 
-type ProjectDetails = { project: Project; tasks: Task[] };
+type ProjectDetails = ProjectWithTasks;
 
 type Context = { previous?: ProjectDetails };
 
@@ -28,8 +31,8 @@ export const useUpdateProject = (projectId: number) => {
         } as Project;
 
         queryClient.setQueryData<ProjectDetails>(["project", projectId], {
+          ...previous,
           project: optimisticProject,
-          tasks: previous.tasks,
         });
       }
 
@@ -46,10 +49,12 @@ export const useUpdateProject = (projectId: number) => {
         projectId,
       ]);
 
-      queryClient.setQueryData<ProjectDetails>(["project", projectId], {
-        project,
-        tasks: previous?.tasks ?? [],
-      });
+      if (previous) {
+        queryClient.setQueryData<ProjectDetails>(["project", projectId], {
+          ...previous,
+          project,
+        });
+      }
 
       queryClient.invalidateQueries({ queryKey: ["projects"] });
     },
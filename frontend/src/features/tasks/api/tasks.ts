@@ -53,3 +53,20 @@ export const updateTask = async (
   );
   return response.data;
 };
+
+export type TaskMove = {
+  task_id: number;
+  status?: TaskStatus;
+  after_id?: number | null;
+  before_id?: number | null;
+};
+
+export const reorderTasks = async (
+  projectId: number,
+  moves: TaskMove[]
+): Promise<Task[]> => {
+  const response = await api.post(`project/${projectId}/tasks/reorder`, {
+    moves,
+  });
+  return response.data;
+};
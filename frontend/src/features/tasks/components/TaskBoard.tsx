@@ -13,7 +13,8 @@ import TaskColumn from "./TaskColumn";
 import TaskCard from "./TaskCard";
 import { Task } from "../../../types/task";
 import { Box } from "@mui/material";
-import { useUpdateTaskStatus } from "../hooks/useUpdateTaskStatus";
+import { useReorderTasks } from "../hooks/useReorderTasks";
+import { TaskMove } from "../api/tasks";
 import { colors } from "../../../shared/styles/colors";
 import { alpha } from "@mui/material/styles";
 import { useUsers } from "../../users/hooks/useUsers";
@@ -24,10 +25,24 @@ type Props = {
   projectId: number;
 };
 
+const ORDER_STEP = 1024;
+
+// Same ordering as the backend: by fractional order, unordered cards last.
+const byPosition = (a: Task, b: Task) =>
+  (a.order ?? Number.POSITIVE_INFINITY) -
+    (b.order ?? Number.POSITIVE_INFINITY) || a.id - b.id;
+
+const positionBetween = (lower?: number | null, upper?: number | null) => {
+  if (lower == null && upper == null) return ORDER_STEP;
+  if (lower == null) return (upper as number) - ORDER_STEP;
+  if (upper == null) return lower + ORDER_STEP;
+  return (lower + upper) / 2;
+};
+
 export default function TaskBoard({ tasks: incomingTasks, projectId }: Props) {
   const [tasks, setTasks] = useState<Task[]>(incomingTasks);
   const [activeTask, setActiveTask] = useState<Task | null>(null);
-  const { mutate: updateStatus } = useUpdateTaskStatus(projectId);
+  const { mutate: reorder } = useReorderTasks(projectId);
   const { data: users = [] } = useUsers();
   const userList = users ?? [];
 
@@ -52,11 +67,33 @@ export default function TaskBoard({ tasks: incomingTasks, projectId }: Props) {
     const newStatus = over?.data?.current?.status as Task["status"] | undefined;
     if (!sourceTask || !newStatus) return;
 
+    // One reorder request per drop: the server slots the card between its
+    // new neighbours and only rewrites that card.
+    const column = tasks
+      .filter((t) => t.status === newStatus && t.id !== sourceTask.id)
+      .sort(byPosition);
+    const overIndex =
+      over.data.current?.type === "task"
+        ? column.findIndex((t) => t.id === over.id)
+        : -1;
+
+    let move: TaskMove;
+    let order: number;
+    if (overIndex >= 0) {
+      const below = column[overIndex];
+      move = { task_id: sourceTask.id, status: newStatus, before_id: below.id };
+      order = positionBetween(column[overIndex - 1]?.order, below.order);
+    } else {
+      const last = column[column.length - 1];
+      move = { task_id: sourceTask.id, status: newStatus, after_id: last?.id };
+      order = positionBetween(last?.order, null);
+    }
+
     const updatedTasks = tasks.map((t) =>
-      t.id === active.id ? { ...t, status: newStatus } : t
+      t.id === active.id ? { ...t, status: newStatus, order } : t
     );
     setTasks(updatedTasks);
-    updateStatus({ taskId: sourceTask.id, status: newStatus });
+    reorder({ moves: [move], optimisticTasks: updatedTasks });
   };
 
   return (
@@ -101,7 +138,9 @@ export default function TaskBoard({ tasks: incomingTasks, projectId }: Props) {
               <TaskColumn
                 status={col.status}
                 label={col.label}
-                tasks={tasks.filter((t) => t.status === col.status)}
+                tasks={tasks
+                  .filter((t) => t.status === col.status)
+                  .sort(byPosition)}
                 users={userList}
               />
             </Box>
@@ -0,0 +1,59 @@
+import { useMutation, useQueryClient } from "@tanstack/react-query";
+import { reorderTasks, TaskMove } from "../api/tasks";
+import { Task } from "../../../types/task";
+import { Project } from "../../../types/project";
+
+type ProjectDetails = { project: Project; tasks: Task[] };
+
+type Variables = {
+  moves: TaskMove[];
+  optimisticTasks: Task[];
+};
+
+type Context = {
+  previous?: ProjectDetails;
+};
+
+export const useReorderTasks = (projectId: number) => {
+  const queryClient = useQueryClient();
+
+  return useMutation<Task[], unknown, Variables, Context>({
+    mutationFn: ({ moves }) => reorderTasks(projectId, moves),
+    onMutate: async ({ optimisticTasks }) => {
+      await queryClient.cancelQueries({ queryKey: ["project", projectId] });
+
+      const previous = queryClient.getQueryData<ProjectDetails>([
+        "project",
+        projectId,
+      ]);
+
+      if (previous) {
+        queryClient.setQueryData<ProjectDetails>(["project", projectId], {
+          ...previous,
+          tasks: optimisticTasks,
+        });
+      }
+
+      return { previous };
+    },
+    onError: (_error, _variables, context) => {
+      if (context?.previous) {
+        queryClient.setQueryData(["project", projectId], context.previous);
+      }
+    },
+    onSuccess: (changedTasks) => {
+      const previous = queryClient.getQueryData<ProjectDetails>([
+        "project",
+        projectId,
+      ]);
+
+      if (previous) {
+        const changed = new Map(changedTasks.map((task) => [task.id, task]));
+        queryClient.setQueryData<ProjectDetails>(["project", projectId], {
+          ...previous,
+          tasks: previous.tasks.map((task) => changed.get(task.id) ?? task),
+        });
+      }
+    },
+  });
+};
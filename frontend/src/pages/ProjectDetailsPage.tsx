@@ -18,6 +18,7 @@ import { ProjectPageHeader } from "../features/projects/components/ProjectPageHe
 import { ProjectMetricsStrip } from "../features/projects/components/ProjectMetricsStrip";
 
 import { useProjectDetails } from "../features/projects/hooks/useProjectDetails";
+import { useProjectEvents } from "../features/projects/hooks/useProjectEvents";
 import { useUpdateProject } from "../features/projects/hooks/useUpdateProject";
 import { useUsers } from "../features/users/hooks/useUsers";
 import { useProjectTaskStats } from "../features/projects/hooks/useProjectTaskStats";
@@ -33,6 +34,7 @@ export default function ProjectDetailsPage() {
   const safeProjectId = isProjectIdValid ? projectId : 0;
 
   const { data, isLoading, isError, error } = useProjectDetails(safeProjectId);
+  useProjectEvents(safeProjectId);
   const { mutateAsync: updateProject } = useUpdateProject(safeProjectId);
   const { data: users = [], isLoading: usersLoading } = useUsers();
 
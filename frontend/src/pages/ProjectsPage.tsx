@@ -29,7 +29,6 @@ const safeDateValue = (value: string | null) => {
 };
 
 export default function ProjectsPage() {
-  const { data: projects, isLoading, isError, error } = useProjects();
   const [searchTerm, setSearchTerm] = useState("");
   const [statusFilter, setStatusFilter] = useState<Project["status"] | "all">(
     "all"
@@ -37,11 +36,16 @@ export default function ProjectsPage() {
   const [priorityFilter, setPriorityFilter] = useState<
     Project["priority"] | "all"
   >("all");
+  // Status and priority are filtered by the API; search and sort stay local.
+  const { data: projects, isLoading, isError, error } = useProjects({
+    status: statusFilter === "all" ? undefined : statusFilter,
+    priority: priorityFilter === "all" ? undefined : priorityFilter,
+  });
   const [sortBy, setSortBy] = useState<"recent" | "dueSoon" | "name">("recent");
   const [createDialogOpen, setCreateDialogOpen] = useState(false);
 
   const projectsList = useMemo(() => projects ?? [], [projects]);
-  const statsCards = useProjectStats(projectsList);
+  const statsCards = useProjectStats();
 
   const filteredProjects = useMemo(() => {
     let results = projectsList;
@@ -57,16 +61,6 @@ export default function ProjectsPage() {
       });
     }
 
-    if (statusFilter !== "all") {
-      results = results.filter((project) => project.status === statusFilter);
-    }
-
-    if (priorityFilter !== "all") {
-      results = results.filter(
-        (project) => project.priority === priorityFilter
-      );
-    }
-
     const sorted = [...results].sort((a, b) => {
       if (sortBy === "name") {
         return a.name.localeCompare(b.name);
@@ -86,7 +80,7 @@ export default function ProjectsPage() {
     });
 
     return sorted;
-  }, [projectsList, searchTerm, statusFilter, priorityFilter, sortBy]);
+  }, [projectsList, searchTerm, sortBy]);
 
   const totalFiltered = filteredProjects.length;
   const isInitialLoading = isLoading && !projects;
@@ -18,6 +18,7 @@ export default defineConfig(({ mode }) => {
           target,
           changeOrigin: true,
           secure: false,
+          ws: true,
         },
       },
     },